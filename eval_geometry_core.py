@@ -0,0 +1,248 @@
+import importlib
+import importlib.util
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+import numpy as np
+
+# Plain CPython benchmark for the bpy-free geometry core (no Blender process needed).
+REPO = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO)
+
+from rc_mechanism_generator.geometry import all_part_specs, build_part  # noqa: E402
+
+# `python eval_geometry_core.py [variants]` benchmarks; `--checks` runs the correctness checks.
+ARGS = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+VARIANTS = int(ARGS[0]) if ARGS else 200
+
+SETTINGS = {
+    "segments": 16,
+    "arm_rod_diameter_mm": 6.0,
+    "arm_bushing_diameter_mm": 8.0,
+    "min_wall_mm": 1.6,
+    "add_ribs": True,
+    "arm_section": "ROUND",
+    "default_hardware": "M3",
+    "generate_knuckle_when_missing": True,
+    "servo_horn_length_mm": 18.0,
+    "servo_horn_diameter_mm": 8.0,
+    "tie_rod_diameter_mm": 4.0,
+    "tie_rod_terminal_diameter_mm": 6.0,
+    "shock_stroke_mm": 20.0,
+    "shock_body_diameter_mm": 10.0,
+    "shock_rod_diameter_mm": 3.0,
+    "shock_eyelet_diameter_mm": 6.0,
+    "generate_spring": True,
+    "spring_outer_diameter_mm": 14.0,
+    "spring_wire_diameter_mm": 1.4,
+    "spring_turns": 8.0,
+    "spring_resolution": 8,
+}
+
+IFACE = {
+    "hole_m": 0.0032,
+    "nut_flat_m": 0.0057,
+    "insert_m": 0.00475,
+    "sliding_clearance_m": 0.00025,
+    "press_clearance_m": -0.00012,
+}
+
+
+def mock_snapshot(rng: random.Random, jitter: float = 0.0) -> dict:
+    # Same layout as examples/create_mock_scene.py.
+    def j(value):
+        return value + rng.uniform(-jitter, jitter)
+
+    wheel_y = 0.13
+    wheel_z = 0.06
+    half_track = 0.115
+    points = {"servo": (0.0, 0.09, 0.09)}
+    for side, sign in (("L", -1.0), ("R", 1.0)):
+        key = side.lower()
+        x = half_track * sign
+        points[f"wheel_center_{key}"] = (x, wheel_y, wheel_z)
+        points[f"lca_in_front_{key}"] = (j(x * 0.55), j(wheel_y - 0.03), j(wheel_z - 0.03))
+        points[f"lca_in_rear_{key}"] = (j(x * 0.55), j(wheel_y - 0.06), j(wheel_z - 0.03))
+        points[f"lca_out_{key}"] = (j(x * 0.92), j(wheel_y - 0.015), j(wheel_z - 0.02))
+        points[f"uca_in_front_{key}"] = (j(x * 0.52), j(wheel_y - 0.03), j(wheel_z + 0.035))
+        points[f"uca_in_rear_{key}"] = (j(x * 0.52), j(wheel_y - 0.06), j(wheel_z + 0.035))
+        points[f"uca_out_{key}"] = (j(x * 0.90), j(wheel_y - 0.02), j(wheel_z + 0.028))
+        points[f"steering_arm_point_{key}"] = (j(x * 0.88), j(wheel_y + 0.015), j(wheel_z - 0.005))
+        points[f"shock_top_{key}"] = (x - sign * 0.02, wheel_y, wheel_z + 0.055)
+        points[f"shock_bottom_{key}"] = (j(x * 0.75), j(wheel_y - 0.03), j(wheel_z - 0.018))
+    return {
+        "rcgen_id": "EVAL_CORE",
+        "sides": ("L", "R"),
+        "settings": dict(SETTINGS),
+        "iface": dict(IFACE),
+        "points": points,
+        "axes": {"right": (1.0, 0.0, 0.0), "forward": (0.0, 1.0, 0.0), "up": (0.0, 0.0, 1.0)},
+        "servo_axis": (0.0, 0.0, 1.0),
+        "uprights": {"L": False, "R": False},
+        "servo_horn_ref": False,
+    }
+
+
+def import_as_extension(tmp_dir: str):
+    # Mirror Blender's extension layout: the package is copied under bl_ext/user_default and the
+    # parent packages exist only in sys.modules, so a spawned interpreter cannot import it.
+    root = os.path.join(tmp_dir, "bl_ext", "user_default")
+    shutil.copytree(
+        os.path.join(REPO, "rc_mechanism_generator"),
+        os.path.join(root, "rc_mechanism_generator"),
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    for name, path in (("bl_ext", os.path.dirname(root)), ("bl_ext.user_default", root)):
+        package = types.ModuleType(name)
+        package.__path__ = [path]
+        sys.modules[name] = package
+    return importlib.import_module("bl_ext.user_default.rc_mechanism_generator.geometry")
+
+
+def check_parallel_build() -> dict:
+    # parallel_min_parts=0 forces the process pool even for the 15 parts of the mock scene.
+    expected = [build_part(spec).vert_count for spec in all_part_specs(mock_snapshot(random.Random(7), 0.003))]
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        layouts = (
+            ("source_tree", importlib.import_module("rc_mechanism_generator.geometry")),
+            ("installed_extension", import_as_extension(tmp_dir)),
+        )
+        for label, geometry in layouts:
+            t0 = time.perf_counter()
+            specs = geometry.all_part_specs(mock_snapshot(random.Random(7), 0.003))
+            buffers, message = geometry.build_parts(specs, 2, 0)
+            # Wait for the workers so none starts loading from the temp dir after it is removed.
+            if geometry.parallel._executor is not None:
+                geometry.parallel._executor.shutdown(wait=True)
+            geometry.shutdown_executor()
+            report[label] = {
+                "ok": [buffer.vert_count for buffer in buffers] == expected,
+                "fallback": message,
+                "duration_s": time.perf_counter() - t0,
+            }
+    # Both layouts must really run in the pool, the extension one included.
+    for label, _geometry in layouts:
+        report[label]["ok"] &= not report[label]["fallback"]
+    return report
+
+
+def load_slicer():
+    # dfm/__init__ pulls in bpy through the checks module; the slicer itself is pure NumPy.
+    spec = importlib.util.spec_from_file_location("rcgen_slicer", os.path.join(REPO, "rc_mechanism_generator", "dfm", "slicer.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def box_mesh(low, high, offset=0):
+    # Closed box with outward-facing triangles; `offset` shifts the indices for concatenated shells.
+    co = [(high[0] if i & 1 else low[0], high[1] if i & 2 else low[1], high[2] if i & 4 else low[2]) for i in range(8)]
+    quads = ((0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5))
+    tris = [(a + offset, b + offset, c + offset) for q in quads for a, b, c in ((q[0], q[1], q[2]), (q[0], q[2], q[3]))]
+    return co, tris
+
+
+def check_thin_rib():
+    # A 0.3 mm rib overlapping a 20 mm block, as generated parts join primitives: the whole-layer
+    # 2A/P is far above the 0.4 mm extrusion width, the rib's island is not.
+    slicer = load_slicer()
+    params = {
+        "layer_height_mm": 0.2,
+        "nozzle_mm": 0.4,
+        "wall_count": 2,
+        "infill_percent": 20.0,
+        "filament_density_g_cm3": 1.24,
+        "print_speed_mm_s": 60.0,
+    }
+    block_co, block_tris = box_mesh((0.0, 0.0, 0.0), (0.02, 0.02, 0.01))
+    rib_co, rib_tris = box_mesh((0.019, 0.005, 0.0), (0.026, 0.0053, 0.01), offset=8)
+    report = {}
+    for label, co, tris in (("block", block_co, block_tris), ("block_with_rib", block_co + rib_co, block_tris + rib_tris)):
+        estimate = slicer.estimate_print(np.array(co), np.array(tris), np.eye(3), params)
+        report[label] = {"layers": estimate["layers"], "thin_layers": estimate["thin_layers"]}
+    # Generated parts at the default settings have no thin features: slivers where a layer grazes a
+    # rounded primitive must not be reported.
+    flagged = {}
+    for spec in all_part_specs(mock_snapshot(random.Random(7), 0.003)):
+        buffer = build_part(spec)
+        starts = [int(start) for start in np.cumsum(buffer.loop_totals) - buffer.loop_totals]
+        tris = [
+            (buffer.loops[start], buffer.loops[start + k], buffer.loops[start + k + 1])
+            for start, total in zip(starts, buffer.loop_totals.tolist())
+            for k in range(1, total - 1)
+        ]
+        estimate = slicer.estimate_print(buffer.co.astype(np.float64), np.array(tris), np.eye(3), params)
+        if estimate["thin_layers"]:
+            flagged[spec["name"]] = estimate["thin_layers"]
+    report["generated_parts_flagged"] = flagged
+    report["ok"] = (
+        report["block"]["thin_layers"] == 0
+        and report["block_with_rib"]["thin_layers"] == report["block_with_rib"]["layers"]
+        and not flagged
+    )
+    return report
+
+
+CHECKS = {
+    "parallel_build": check_parallel_build,
+    "thin_rib": check_thin_rib,
+}
+
+
+def run_checks():
+    results = {}
+    for name, check in CHECKS.items():
+        try:
+            results[name] = check()
+        except Exception as exc:
+            results[name] = {"ok": False, "error": f"{exc.__class__.__name__}: {exc}"}
+    print(json.dumps(results, indent=2))
+    failed = [name for name, result in results.items() if not all_ok(result)]
+    if failed:
+        print("FAILED:", ", ".join(failed))
+        sys.exit(1)
+
+
+def all_ok(result: dict) -> bool:
+    if "ok" in result:
+        return bool(result["ok"])
+    return all(all_ok(value) for value in result.values() if isinstance(value, dict))
+
+
+def main():
+    rng = random.Random(1234)
+    times = []
+    parts = 0
+    verts = 0
+    for _ in range(VARIANTS):
+        snapshot = mock_snapshot(rng, jitter=0.003)
+        t0 = time.perf_counter()
+        for spec in all_part_specs(snapshot):
+            buffer = build_part(spec)
+            parts += 1
+            verts += buffer.vert_count
+        times.append(time.perf_counter() - t0)
+    result = {
+        "variants": VARIANTS,
+        "parts": parts,
+        "vertices": verts,
+        "total_s": sum(times),
+        "p50_variant_s": statistics.median(times),
+        "max_variant_s": max(times),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    if "--checks" in sys.argv:
+        run_checks()
+    else:
+        main()
@@ -2,11 +2,16 @@ import os
 import sys
 import json
 import time
+import importlib
+import threading
 import traceback
 import statistics
 import runpy
+import zipfile
+import xml.etree.ElementTree as ET
 
 import bpy
+import numpy as np
 import addon_utils
 
 REPO = r"c:\Users\u60897\Documents\my-mechanical-addon"
@@ -33,6 +38,7 @@ results = {
     "stability": {},
     "undo_redo": {},
     "persistence": {},
+    "checks": {},
     "errors": [],
     "warnings": [],
 }
@@ -51,6 +57,17 @@ def safe_call(label, fn):
         return {"ok": False, "duration_s": dt, "error": str(e)}
 
 
+def run_check(label, fn):
+    # Like safe_call, but a check returning ok=False is recorded as an error too.
+    def checked():
+        out = fn()
+        if not out.get("ok", False):
+            raise AssertionError(json.dumps(out, default=str))
+        return out
+
+    return safe_call(label, checked)
+
+
 def ensure_clean_addon_state():
     try:
         if addon_utils.check(MODULE)[1]:
@@ -193,6 +210,468 @@ results["e2e"]["export_artifacts"] = {
     "stl_count": stl_count,
 }
 
+# 3b) Regression checks (LOD swap, stale preview, STL/3MF round-trips, cancel, re-export, DFM cache and
+# its reuse by the export, congruent copies, enclosed and modified-reference interference).
+# Each check fails the run through results["errors"]; scene settings are restored before the benchmarks.
+CHECK_SETTINGS = ("use_preview_lod", "export_stl", "export_3mf", "dedupe_congruent_parts")
+settings_before_checks = {name: getattr(bpy.context.scene.rcgen_settings, name) for name in CHECK_SETTINGS}
+
+
+def generated_mesh_objects():
+    return [obj for obj in bpy.context.scene.objects if obj.type == "MESH" and "rcgen_id" in obj and "rcgen_module" in obj]
+
+
+def triangle_count(obj):
+    obj.data.calc_loop_triangles()
+    return len(obj.data.loop_triangles)
+
+
+def read_manifest():
+    with open(os.path.join(set_dir, "manifest.json"), encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def check_lod_export():
+    # Viewport holds PREVIEW meshes; the export must write full resolution and leave the scene as it was.
+    s = bpy.context.scene.rcgen_settings
+    s.use_preview_lod = False
+    bpy.ops.rcgen.generate_all()
+    full = {obj.name: triangle_count(obj) for obj in generated_mesh_objects()}
+    s.use_preview_lod = True
+    bpy.ops.rcgen.generate_all()
+    preview = {obj.name: (obj.data.name, triangle_count(obj)) for obj in generated_mesh_objects()}
+    mounts = {obj.name: tuple(obj.location) for obj in bpy.context.scene.objects if obj.name.startswith(("RC_ShockTop_", "RC_ShockBottom_"))}
+    meshes_before = len(bpy.data.meshes)
+    bpy.ops.rcgen.export_manufacturing_pack()
+    exported = {e["object"]: e["triangles"] for e in read_manifest()["exports"] if e["format"] == "STL"}
+    mismatched = sorted(name for name, count in exported.items() if name in full and count != full[name])
+    not_restored = sorted(obj.name for obj in generated_mesh_objects() if obj.data.name != preview[obj.name][0])
+    moved = sorted(name for name, loc in mounts.items() if tuple(bpy.data.objects[name].location) != loc)
+    return {
+        "ok": bool(exported) and not mismatched and not not_restored and not moved and len(bpy.data.meshes) == meshes_before,
+        "preview_lower_res": sum(1 for name, (_, count) in preview.items() if count < full.get(name, 0)),
+        "exported_full_res": len(exported) - len(mismatched),
+        "mismatched": mismatched,
+        "not_restored": not_restored,
+        "mounts_moved": moved,
+        "meshes_delta": len(bpy.data.meshes) - meshes_before,
+    }
+
+
+results["checks"]["lod_export"] = run_check("lod_export", check_lod_export)
+
+
+def check_stale_preview_export():
+    # A preview part the scene no longer matches must abort the export instead of writing unseen geometry.
+    scene = bpy.context.scene
+    s = scene.rcgen_settings
+    s.use_preview_lod = True
+    bpy.ops.rcgen.generate_all()
+    manifest_path = os.path.join(set_dir, "manifest.json")
+    stamp = os.path.getmtime(manifest_path) if os.path.exists(manifest_path) else None
+    hardpoint = scene.rcgen_refs.lca_out_l
+    hardpoint.location.z += 0.002
+    bpy.context.view_layer.update()
+    error = ""
+    try:
+        bpy.ops.rcgen.export_manufacturing_pack()
+    except RuntimeError as exc:
+        error = str(exc)
+    hardpoint.location.z -= 0.002
+    bpy.context.view_layer.update()
+    after = os.path.getmtime(manifest_path) if os.path.exists(manifest_path) else None
+    return {
+        "ok": "Scene out of date" in error and after == stamp,
+        "error": error,
+        "manifest_rewritten": after != stamp,
+    }
+
+
+results["checks"]["stale_preview_export"] = run_check("stale_preview_export", check_stale_preview_export)
+
+STL_RECORD = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")])
+
+
+def world_corners(obj):
+    # Independent of the addon's foreach_get path: plain per-vertex matrix products.
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    co = np.array([tuple(obj.matrix_world @ v.co) for v in mesh.vertices], dtype=np.float64)
+    tris = np.array([tuple(t.vertices) for t in mesh.loop_triangles], dtype=np.int64).reshape(-1, 3)
+    return co[tris]
+
+
+def full_resolution_export(stl=True, three_mf=False):
+    s = bpy.context.scene.rcgen_settings
+    s.use_preview_lod = False
+    s.export_stl = stl
+    s.export_3mf = three_mf
+    bpy.ops.rcgen.generate_all()
+    bpy.ops.rcgen.export_manufacturing_pack()
+    return read_manifest()
+
+
+def check_stl_roundtrip():
+    checked = 0
+    failures = []
+    for entry in full_resolution_export()["exports"]:
+        obj = bpy.data.objects.get(entry["object"])
+        if entry["format"] != "STL" or obj is None:
+            continue  # split halves and pins only exist during the export
+        with open(entry["path"], "rb") as fp:
+            header = fp.read(80)
+            count = int(np.frombuffer(fp.read(4), dtype="<u4")[0])
+            records = np.fromfile(fp, dtype=STL_RECORD)
+        expected = world_corners(obj)
+        lengths = np.linalg.norm(records["normal"], axis=1)
+        problems = []
+        if len(header) != 80 or count != len(records) or count != entry["triangles"]:
+            problems.append(f"count {count}/{len(records)}/{entry['triangles']}")
+        if os.path.getsize(entry["path"]) != 84 + 50 * count or entry["bytes"] != os.path.getsize(entry["path"]):
+            problems.append("size")
+        if records["vertices"].shape != expected.shape or np.abs(records["vertices"] - expected).max() > 1.0e-6:
+            problems.append("vertices")
+        if np.any((lengths > 0.0) & (np.abs(lengths - 1.0) > 1.0e-4)):
+            problems.append("normals")
+        if problems:
+            failures.append(f"{entry['object']}: {', '.join(problems)}")
+        checked += 1
+    return {"ok": checked > 0 and not failures, "checked": checked, "failures": failures}
+
+
+results["checks"]["stl_roundtrip"] = run_check("stl_roundtrip", check_stl_roundtrip)
+
+NS_3MF = {"m": "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"}
+
+
+def read_3mf(path):
+    with zipfile.ZipFile(path) as package:
+        names = set(package.namelist())
+        root = ET.fromstring(package.read("3D/3dmodel.model"))
+    objects = {}
+    for node in root.iterfind("m:resources/m:object", NS_3MF):
+        co = np.array([[float(v.get(axis)) for axis in "xyz"] for v in node.iterfind("m:mesh/m:vertices/m:vertex", NS_3MF)])
+        tris = np.array(
+            [[int(t.get(key)) for key in ("v1", "v2", "v3")] for t in node.iterfind("m:mesh/m:triangles/m:triangle", NS_3MF)]
+        )
+        objects[node.get("id")] = (node.get("name"), co.reshape(-1, 3), tris.reshape(-1, 3))
+    items = []
+    for node in root.iterfind("m:build/m:item", NS_3MF):
+        values = np.array([float(value) for value in node.get("transform").split()])
+        items.append((node.get("objectid"), values[:9].reshape(3, 3).T, values[9:]))
+    return names, objects, items
+
+
+def euler_xyz(rx, ry, rz):
+    cx, sx, cy, sy, cz, sz = np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz)
+    rot_x = np.array(((1.0, 0.0, 0.0), (0.0, cx, -sx), (0.0, sx, cx)))
+    rot_y = np.array(((cy, 0.0, sy), (0.0, 1.0, 0.0), (-sy, 0.0, cy)))
+    rot_z = np.array(((cz, -sz, 0.0), (sz, cz, 0.0), (0.0, 0.0, 1.0)))
+    return rot_z @ rot_y @ rot_x
+
+
+def check_3mf_roundtrip():
+    manifest = full_resolution_export(stl=False, three_mf=True)
+    entries = {entry["object"]: entry for entry in manifest["exports"] if entry["format"] == "3MF"}
+    path = next(iter(entries.values()))["path"]
+    names, objects, items = read_3mf(path)
+    failures = []
+    if not {"[Content_Types].xml", "_rels/.rels", "3D/3dmodel.model"} <= names:
+        failures.append("package parts missing")
+    if len(items) != sum(1 + len(entry.get("copies", [])) for entry in entries.values()):
+        failures.append("build items do not match parts plus congruent copies")
+    checked = 0
+    instances: dict[str, int] = {}
+    for object_id, rotation, translation in items:
+        name, co, tris = objects[object_id]
+        entry = entries.get(name)
+        if entry is None or len(tris) != entry["triangles"]:
+            failures.append(f"{name}: not in manifest or triangle count differs")
+            continue
+        # The first item is the part itself, the next ones its congruent copies (mirrored across X).
+        instance = instances[name] = instances.get(name, -1) + 1
+        mirrored = instance > 0 and entry["copies"][instance - 1]["mirrored"]
+        placed = co @ rotation.T + translation
+        if abs(placed[:, 2].min()) > 1.0e-3:
+            failures.append(f"{name}: not on the bed (min z {placed[:, 2].min():.4f} mm)")
+        if abs(abs(np.linalg.det(rotation)) - 1.0) > 1.0e-5:
+            failures.append(f"{name}: build transform is not a rotation")
+        ori = manifest["orientations"].get(name, {"rx_rad": 0.0, "ry_rad": 0.0, "rz_rad": 0.0})
+        expected_rotation = euler_xyz(ori["rx_rad"], ori["ry_rad"], ori["rz_rad"])
+        if mirrored:
+            expected_rotation = np.diag((-1.0, 1.0, 1.0)) @ expected_rotation
+        if np.abs(rotation - expected_rotation).max() > 1.0e-5:
+            failures.append(f"{name} #{instance}: build transform differs from the DFM orientation")
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            expected = world_corners(obj) * 1000.0
+            flat = expected.reshape(-1, 3)
+            center = (flat.min(axis=0) + flat.max(axis=0)) * 0.5
+            if np.abs(co[tris] + center - expected).max() > 1.0e-3:
+                failures.append(f"{name}: mesh vertices differ")
+        checked += 1
+    copies = sum(len(entry.get("copies", [])) for entry in entries.values())
+    return {
+        "ok": checked > 0 and not failures,
+        "objects": len(objects),
+        "build_items": len(items),
+        "congruent_copies": copies,
+        "failures": failures,
+    }
+
+
+results["checks"]["3mf_roundtrip"] = run_check("3mf_roundtrip", check_3mf_roundtrip)
+
+
+def check_export_cancel():
+    # Drives ExportJob directly: in background sessions the operator waits for the job itself.
+    export = importlib.import_module(f"{MODULE}.export")
+    target = os.path.join(EXPORT_DIR, "cancel_probe.txt")
+    with open(target, "w", encoding="utf-8") as fp:
+        fp.write("previous")
+    job = export.ExportJob(2)
+    started = threading.Event()
+    later_stage = []
+
+    def slow_write():
+        with export.atomic_path(target) as tmp, open(tmp, "w", encoding="utf-8") as fp:
+            fp.write("partial")
+            started.set()
+            for _ in range(500):
+                job.check_cancelled()
+                time.sleep(0.01)
+
+    job.add_stage([("slow", slow_write), ("quick", lambda: None)])
+    job.add_stage([("manifest", lambda: later_stage.append(True))])
+    job.start()
+    started.wait(5.0)
+    t0 = time.perf_counter()
+    job.cancel()
+    job.wait()
+    with open(target, encoding="utf-8") as fp:
+        content = fp.read()
+    leftovers = [name for name in os.listdir(EXPORT_DIR) if name.startswith("cancel_probe.txt.")]
+    no_job_poll = bpy.ops.rcgen.cancel_export.poll()
+    return {
+        "ok": job.cancelled and not job.errors and not later_stage and content == "previous" and not leftovers and not no_job_poll,
+        "cancel_latency_s": time.perf_counter() - t0,
+        "completed": job.completed,
+        "total": job.total,
+        "previous_file_kept": content == "previous",
+        "temp_files_left": leftovers,
+        "later_stage_ran": bool(later_stage),
+        "cancel_operator_polls_without_job": no_job_poll,
+    }
+
+
+results["checks"]["export_cancel"] = run_check("export_cancel", check_export_cancel)
+
+
+def part_file_stamps():
+    entries = read_manifest()["exports"]
+    return {entry["path"]: os.stat(entry["path"]).st_mtime_ns for entry in entries}
+
+
+def check_unchanged_reexport():
+    # A second export of the same scene rewrites no part file; a change rewrites only what it touches;
+    # a damaged file on disk is rewritten even though its digest still matches.
+    export = importlib.import_module(f"{MODULE}.export")
+    s = bpy.context.scene.rcgen_settings
+    full_resolution_export(stl=True, three_mf=True)
+    first = part_file_stamps()
+    full_resolution_export(stl=True, three_mf=True)
+    second = part_file_stamps()
+    status_unchanged = export.last_export_status()
+
+    s.spring_turns += 1.0
+    full_resolution_export(stl=True, three_mf=True)
+    third = part_file_stamps()
+    s.spring_turns -= 1.0
+    rewritten = sorted(os.path.basename(path) for path in third if third[path] != second.get(path))
+
+    victim = next(path for path in third if path.endswith(".stl") and "Spring" not in path)
+    with open(victim, "r+b") as fp:
+        fp.truncate(100)
+    full_resolution_export(stl=True, three_mf=False)
+    repaired = os.path.getsize(victim) > 100
+    leftovers = [name for name in os.listdir(set_dir) if name.endswith(".tmp")]
+    spring_only = bool(rewritten) and all("Spring" in name or name.endswith(".3mf") for name in rewritten)
+    return {
+        "ok": first == second and "(0 part files written" in status_unchanged and spring_only and repaired and not leftovers,
+        "status_unchanged": status_unchanged,
+        "rewritten_after_spring_change": rewritten,
+        "truncated_file_rewritten": repaired,
+        "temp_files_left": leftovers,
+    }
+
+
+results["checks"]["unchanged_reexport"] = run_check("unchanged_reexport", check_unchanged_reexport)
+
+
+def stored_links():
+    links = {}
+    for obj in generated_mesh_objects():
+        link = json.loads(obj.get("rcgen_dfm_result", "{}")).get("congruent")
+        if link:
+            links[obj.name] = link
+    return links
+
+
+def check_dfm_cache_congruence():
+    dfm = importlib.import_module(f"{MODULE}.dfm")
+    scene = bpy.context.scene
+    s = scene.rcgen_settings
+    s.use_preview_lod = False
+    s.dedupe_congruent_parts = True
+    bpy.ops.rcgen.generate_all()
+    count = len(generated_mesh_objects())
+    dfm.run_printability_checks(scene)
+    warm = dfm.run_printability_checks(scene)[3]
+    links = warm["congruent"]
+
+    # Edit only a representative: its copy keeps its own cache key but must not reuse the old link.
+    rep_name = next((link["of"] for link in links.values()), None)
+    relinked = {}
+    if rep_name is not None:
+        rep = bpy.data.objects[rep_name]
+        rep.rotation_euler.z += 0.5
+        bpy.context.view_layer.update()
+        edited = dfm.run_printability_checks(scene)[3]
+        rep_key = rep.get("rcgen_dfm_key")
+        relinked = {
+            "cached": edited["cached"],
+            "stale_links": sorted(name for name, link in stored_links().items() if link["of"] == rep_name and link["of_key"] != rep_key),
+        }
+        rep.rotation_euler.z -= 0.5
+        bpy.context.view_layer.update()
+
+    # Dedupe off: keys change for every part and no copy keeps a representative's result.
+    s.dedupe_congruent_parts = False
+    off = dfm.run_printability_checks(scene)[3]
+    links_off = stored_links()
+    s.dedupe_congruent_parts = True
+    return {
+        "ok": (
+            warm["cached"] == count
+            and warm["checked"] == 0
+            and bool(links)
+            and not relinked.get("stale_links", True)
+            and off["cached"] == 0
+            and not off["congruent"]
+            and not links_off
+        ),
+        "parts": count,
+        "warm_cached": warm["cached"],
+        "congruent": links,
+        "after_representative_edit": relinked,
+        "dedupe_off_cached": off["cached"],
+        "dedupe_off_links": sorted(links_off),
+    }
+
+
+results["checks"]["dfm_cache_congruence"] = run_check("dfm_cache_congruence", check_dfm_cache_congruence)
+
+
+def check_dfm_check_then_export():
+    # The standalone check and the export both check full-resolution meshes, so with preview
+    # meshes in the viewport an export right after a check reuses every cached result.
+    s = bpy.context.scene.rcgen_settings
+    s.use_preview_lod = True
+    s.export_stl = True
+    s.export_3mf = False
+    bpy.ops.rcgen.generate_all()
+    count = len(generated_mesh_objects())
+    bpy.ops.rcgen.run_printability_checks()
+    bpy.ops.rcgen.export_manufacturing_pack()
+    dfm = read_manifest()["dfm"]
+    return {
+        "ok": dfm["cached"] == count and dfm["checked"] == 0,
+        "parts": count,
+        "cached": dfm["cached"],
+        "checked": dfm["checked"],
+    }
+
+
+results["checks"]["dfm_check_then_export"] = run_check("dfm_check_then_export", check_dfm_check_then_export)
+
+
+def check_superseded_copies():
+    # An export without dedupe leaves R-side STLs; the next deduped export must remove them.
+    s = bpy.context.scene.rcgen_settings
+    s.dedupe_congruent_parts = False
+    full_resolution_export(stl=True, three_mf=False)
+    s.dedupe_congruent_parts = True
+    manifest = full_resolution_export(stl=True, three_mf=True)
+    copies = sorted(manifest["dfm"]["congruent"])
+    left = sorted(name for name in copies if os.path.exists(os.path.join(set_dir, name + ".stl")))
+    listed = sorted(os.path.basename(path)[:-4] for path in manifest["superseded_removed"])
+    in_3mf = sorted(copy["object"] for entry in manifest["exports"] if entry["format"] == "3MF" for copy in entry.get("copies", []))
+    return {
+        "ok": bool(copies) and not left and listed == copies and in_3mf == copies,
+        "copies": copies,
+        "stl_left": left,
+        "superseded_removed": listed,
+        "copies_in_3mf": in_3mf,
+    }
+
+
+results["checks"]["superseded_copies"] = run_check("superseded_copies", check_superseded_copies)
+
+
+def check_enclosed_interference():
+    # A small box fully inside a larger one has no intersecting triangles but must still interfere.
+    collision = importlib.import_module(f"{MODULE}.utils.collision")
+    boxes = {}
+    for label, size, location in (("outer", 0.1, (5.0, 5.0, 5.0)), ("inner", 0.02, (5.01, 4.99, 5.02)), ("apart", 0.02, (5.2, 5.0, 5.0))):
+        bpy.ops.mesh.primitive_cube_add(size=size, location=location)
+        boxes[label] = bpy.context.active_object
+    names = {label: obj.name for label, obj in boxes.items()}
+    found = [
+        (a.name, b.name, pairs)
+        for a, b, pairs in collision.find_interferences([boxes["inner"], boxes["apart"]], [boxes["outer"]], check_object_pairs=False)
+    ]
+    for obj in boxes.values():
+        mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.meshes.remove(mesh)
+    return {
+        "ok": found == [(names["inner"], names["outer"], collision.ENCLOSED)],
+        "found": found,
+    }
+
+
+results["checks"]["enclosed_interference"] = run_check("enclosed_interference", check_enclosed_interference)
+
+
+def check_modified_reference_interference():
+    # A reference's modifiers count: the box only meets the second copy added by an Array modifier.
+    collision = importlib.import_module(f"{MODULE}.utils.collision")
+    bpy.ops.mesh.primitive_cube_add(size=0.05, location=(5.0, 5.0, 5.0))
+    reference = bpy.context.active_object
+    array = reference.modifiers.new("Array", "ARRAY")
+    array.count = 2
+    array.relative_offset_displace = (2.0, 0.0, 0.0)
+    bpy.ops.mesh.primitive_cube_add(size=0.02, location=(5.125, 5.0, 5.0))
+    part = bpy.context.active_object
+    bpy.context.view_layer.update()
+    found = [(a.name, b.name, pairs) for a, b, pairs in collision.find_interferences([part], [reference], check_object_pairs=False)]
+    names = (part.name, reference.name)
+    for obj in (part, reference):
+        mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.meshes.remove(mesh)
+    return {
+        "ok": len(found) == 1 and found[0][:2] == names and found[0][2] > 0,
+        "found": found,
+    }
+
+
+results["checks"]["modified_reference_interference"] = run_check("modified_reference_interference", check_modified_reference_interference)
+
+for name, value in settings_before_checks.items():
+    setattr(bpy.context.scene.rcgen_settings, name, value)
+bpy.ops.rcgen.generate_all()
+
 # 4) Performance (small)
 results["performance"]["small_update_all"] = safe_call(
     "perf_small",
@@ -208,18 +687,31 @@ results["performance"]["large_update_all"] = safe_call(
 
 # 6) Stability 100x update
 
-def run_100x_updates():
+def run_100x(op_callable):
     fails = 0
+    mesh_counts = []
     t0 = time.perf_counter()
     for i in range(100):
         try:
-            bpy.ops.rcgen.update_all()
+            op_callable()
         except Exception:
             fails += 1
+        mesh_counts.append(len(bpy.data.meshes))
     dt = time.perf_counter() - t0
-    return {"rounds": 100, "fails": fails, "total_s": dt, "avg_s": dt / 100.0}
+    return {
+        "rounds": 100,
+        "fails": fails,
+        "total_s": dt,
+        "avg_s": dt / 100.0,
+        "meshes_first": mesh_counts[0],
+        "meshes_last": mesh_counts[-1],
+        "meshes_max": max(mesh_counts),
+        "orphan_meshes": sum(1 for mesh in bpy.data.meshes if mesh.users == 0),
+    }
 
-results["stability"]["update_all_100x"] = safe_call("update_100x", run_100x_updates)
+results["stability"]["update_all_100x"] = safe_call("update_100x", lambda: run_100x(lambda: bpy.ops.rcgen.update_all()))
+# generate_all ignores the hash cache, so every round rewrites all part meshes in place.
+results["stability"]["generate_all_100x"] = safe_call("generate_100x", lambda: run_100x(lambda: bpy.ops.rcgen.generate_all()))
 
 # 7) Save/reopen persistence
 blend_path = os.path.join(OUT_DIR, "runtime_eval_scene.blend")
@@ -243,6 +735,7 @@ print(json.dumps({
     "install_ok": results["install_enable"].get("install_enable", {}).get("ok", False),
     "generate_ok": results["e2e"].get("generate_all", {}).get("ok", False),
     "export_ok": results["e2e"].get("export_pack", {}).get("ok", False),
+    "checks_ok": all(check.get("ok", False) for check in results["checks"].values()),
     "errors": len(results.get("errors", [])),
 }, ensure_ascii=False))
 
@@ -8,16 +8,22 @@ bl_info = {
     "category": "Add Mesh",
 }
 
-from . import operators, properties, ui  # noqa: E402
-
 
+# Blender modules are imported lazily so `rc_mechanism_generator.geometry` can be used from
+# plain CPython (build servers, worker processes) where `bpy` is not available.
 def register():
+    from . import operators, properties, tracking, ui
+
     properties.register()
     operators.register()
     ui.register()
+    tracking.register()
 
 
 def unregister():
+    from . import operators, properties, tracking, ui
+
+    tracking.unregister()
     ui.unregister()
     operators.unregister()
     properties.unregister()
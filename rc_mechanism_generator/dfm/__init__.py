@@ -1,4 +1,7 @@
-from .checks import run_printability_checks
+from .analysis import combine_mass_properties, mass_properties
+from .checks import format_dfm_timings, run_printability_checks
+from .congruence import congruence_groups, match_shapes, shape_fingerprint
+from .slicer import euler_xyz_matrix
 from .interfaces import (
     hardware_hole_diameter_m,
     hex_nut_flat_m,
@@ -7,6 +10,13 @@ from .interfaces import (
 )
 
 __all__ = [
+    "combine_mass_properties",
+    "mass_properties",
+    "congruence_groups",
+    "match_shapes",
+    "shape_fingerprint",
+    "euler_xyz_matrix",
+    "format_dfm_timings",
     "run_printability_checks",
     "hardware_hole_diameter_m",
     "hex_nut_flat_m",
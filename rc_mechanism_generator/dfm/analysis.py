@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from .slicer import estimate_print, euler_xyz_matrix
+
+# Pure NumPy mesh analysis used by dfm.checks. Inputs are plain arrays read with foreach_get, so
+# the functions can run outside the main thread (or outside Blender).
+
+
+def overhang_ratios(
+    normals: np.ndarray,
+    areas: np.ndarray,
+    matrix: np.ndarray,
+    warn_deg: float,
+) -> tuple[float, float]:
+    # Returns (face-count ratio, world-area-weighted ratio). The per-face predicate matches the
+    # previous per-polygon check: normal rotated by the 3x3 part of matrix_world, angle from +Z
+    # above warn_deg and normal z below 0.2.
+    if len(normals) == 0:
+        return 0.0, 0.0
+    linear = np.asarray(matrix, dtype=np.float64)[:3, :3]
+    world = normals.astype(np.float64) @ linear.T
+    lengths = np.linalg.norm(world, axis=1)
+    nz = np.divide(world[:, 2], lengths, out=np.zeros_like(lengths), where=lengths > 0.0)
+    angle_from_up = np.arccos(np.clip(nz, -1.0, 1.0))
+    bad = (angle_from_up > math.radians(warn_deg)) & (nz < 0.2)
+
+    # Polygon area scales with |cofactor(M) @ n| under a linear map M (exact for non-uniform scale).
+    det = float(np.linalg.det(linear))
+    cofactor = det * np.linalg.inv(linear).T if abs(det) > 1.0e-18 else linear
+    world_areas = areas.astype(np.float64) * np.linalg.norm(normals.astype(np.float64) @ cofactor.T, axis=1)
+    total_area = float(world_areas.sum())
+    area_ratio = float(world_areas[bad].sum()) / total_area if total_area > 0.0 else 0.0
+    return float(np.count_nonzero(bad)) / len(normals), area_ratio
+
+
+def _component_labels(vert_count: int, edge_vertices: np.ndarray) -> np.ndarray:
+    # Min-label propagation with pointer jumping; converges in a few passes on part meshes.
+    labels = np.arange(vert_count, dtype=np.int64)
+    if len(edge_vertices) == 0:
+        return labels
+    a = edge_vertices[:, 0]
+    b = edge_vertices[:, 1]
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        updated = labels.copy()
+        np.minimum.at(updated, a, low)
+        np.minimum.at(updated, b, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def manifold_report(
+    vert_count: int,
+    edge_vertices: np.ndarray,
+    loop_vertices: np.ndarray,
+    loop_edges: np.ndarray,
+) -> dict[str, int]:
+    edge_vertices = np.asarray(edge_vertices, dtype=np.int64).reshape(-1, 2)
+    loop_vertices = np.asarray(loop_vertices, dtype=np.int64)
+    loop_edges = np.asarray(loop_edges, dtype=np.int64)
+    edge_count = len(edge_vertices)
+    faces_per_edge = np.bincount(loop_edges, minlength=edge_count)
+
+    # A loop runs along its edge "forward" when it starts at the edge's first vertex. Two faces
+    # sharing an edge are consistently wound when exactly one of them runs forward.
+    forward = loop_vertices == edge_vertices[loop_edges, 0]
+    forward_per_edge = np.bincount(loop_edges, weights=forward, minlength=edge_count)
+    two_faced = faces_per_edge == 2
+
+    face_verts = np.zeros(vert_count, dtype=bool)
+    face_verts[loop_vertices] = True
+    labels = _component_labels(vert_count, edge_vertices[faces_per_edge > 0])
+    return {
+        "boundary_edges": int(np.count_nonzero(faces_per_edge == 1)),
+        "non_manifold_edges": int(np.count_nonzero(faces_per_edge > 2)),
+        "wire_edges": int(np.count_nonzero(faces_per_edge == 0)),
+        "inconsistent_edges": int(np.count_nonzero(two_faced & (forward_per_edge != 1))),
+        "shells": int(len(np.unique(labels[face_verts]))),
+    }
+
+
+def suggested_orientation(bounds_min: np.ndarray, bounds_max: np.ndarray) -> tuple[float, float, float]:
+    dims = np.asarray(bounds_max, dtype=np.float64) - np.asarray(bounds_min, dtype=np.float64)
+    if dims[2] <= dims[0] and dims[2] <= dims[1]:
+        return (0.0, 0.0, 0.0)
+    if dims[0] <= dims[1]:
+        return (0.0, math.radians(90.0), 0.0)
+    return (math.radians(90.0), 0.0, 0.0)
+
+
+_FACE_CANDIDATES = 12
+_SCORE_BLOCK = 2_000_000
+
+
+def fibonacci_directions(count: int) -> np.ndarray:
+    # Near-uniform unit vectors on the sphere.
+    index = np.arange(count, dtype=np.float64) + 0.5
+    z = 1.0 - 2.0 * index / count
+    radius = np.sqrt(np.clip(1.0 - z * z, 0.0, 1.0))
+    theta = index * math.pi * (3.0 - math.sqrt(5.0))
+    return np.column_stack((radius * np.cos(theta), radius * np.sin(theta), z))
+
+
+def _rotation_to_down(direction: np.ndarray) -> np.ndarray:
+    # Smallest rotation taking `direction` to -Z (Rodrigues).
+    target = np.array((0.0, 0.0, -1.0))
+    axis = np.cross(direction, target)
+    sin_angle = float(np.linalg.norm(axis))
+    cos_angle = float(np.dot(direction, target))
+    if sin_angle < 1.0e-12:
+        return np.eye(3) if cos_angle > 0.0 else np.diag((1.0, -1.0, -1.0))
+    k = axis / sin_angle
+    cross = np.array(((0.0, -k[2], k[1]), (k[2], 0.0, -k[0]), (-k[1], k[0], 0.0)))
+    return np.eye(3) + sin_angle * cross + (1.0 - cos_angle) * (cross @ cross)
+
+
+def _euler_xyz(rotation: np.ndarray) -> tuple[float, float, float]:
+    # Blender "XYZ" Euler order: R = Rz @ Ry @ Rx.
+    ry = math.asin(max(-1.0, min(1.0, -rotation[2, 0])))
+    if abs(rotation[2, 0]) < 1.0 - 1.0e-9:
+        rx = math.atan2(rotation[2, 1], rotation[2, 2])
+        rz = math.atan2(rotation[1, 0], rotation[0, 0])
+    else:
+        rx = math.atan2(-rotation[1, 2], rotation[1, 1])
+        rz = 0.0
+    return rx, ry, rz
+
+
+def _orientation_scores(
+    world: np.ndarray,
+    normals: np.ndarray,
+    areas: np.ndarray,
+    centroids: np.ndarray,
+    down: np.ndarray,
+    warn_deg: float,
+    extent: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    facing = normals @ down.T
+    vertex_heights = -(world @ down.T)
+    bed = vertex_heights.min(axis=0)
+    above_bed = -(centroids @ down.T) - bed
+    on_bed = (facing > math.cos(math.radians(1.0))) & (above_bed < extent * 1.0e-4)
+    overhang = (facing > math.sin(math.radians(warn_deg))) & ~on_bed
+    return (
+        (areas[:, None] * overhang).sum(axis=0),
+        (areas[:, None] * facing * above_bed * overhang).sum(axis=0),
+        (areas[:, None] * on_bed).sum(axis=0),
+        vertex_heights.max(axis=0) - bed,
+    )
+
+
+def optimize_orientation(
+    co: np.ndarray,
+    tris: np.ndarray,
+    matrix: np.ndarray,
+    warn_deg: float,
+    candidate_count: int,
+) -> dict[str, Any]:
+    # Scores every candidate "down" direction in one pass over the world-space triangles:
+    #   overhang area  - faces within (90 - warn_deg) of pointing straight down, not on the bed
+    #   support volume - their projected area times height above the bed
+    #   bed contact    - faces flat on the lowest plane
+    # Cost = support volume / (area * height extent) + overhang fraction - bed contact fraction / 2,
+    # plus a small build-height term to break ties.
+    matrix = np.asarray(matrix, dtype=np.float64)
+    world = np.asarray(co, dtype=np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    a, b, c = world[tris[:, 0]], world[tris[:, 1]], world[tris[:, 2]]
+    cross = np.cross(b - a, c - a)
+    double_areas = np.linalg.norm(cross, axis=1)
+    valid = double_areas > 0.0
+    if not valid.any():
+        return {"rx_rad": 0.0, "ry_rad": 0.0, "rz_rad": 0.0}
+    normals = cross[valid] / double_areas[valid, None]
+    areas = double_areas[valid] * 0.5
+    centroids = (a[valid] + b[valid] + c[valid]) / 3.0
+    total_area = float(areas.sum())
+    extent = float(np.linalg.norm(world.max(axis=0) - world.min(axis=0))) or 1.0
+
+    # The part's own axes and its largest face normals come first, so flat faces can land exactly on
+    # the bed; the sphere samples cover everything else.
+    linear = matrix[:3, :3]
+    axes = linear.T / np.maximum(np.linalg.norm(linear, axis=0), 1.0e-12)[:, None]
+    largest = normals[np.argsort(areas)[::-1][:_FACE_CANDIDATES]]
+    down = np.vstack((axes, -axes, largest, fibonacci_directions(max(0, candidate_count))))
+    # Candidates are scored in chunks to bound the (faces x candidates) temporaries on dense meshes.
+    chunk = max(1, _SCORE_BLOCK // max(len(normals), len(world)))
+    scores = [
+        _orientation_scores(world, normals, areas, centroids, down[start:start + chunk], warn_deg, extent)
+        for start in range(0, len(down), chunk)
+    ]
+    overhang_area, support_volume, contact_area, build_height = (np.concatenate(values) for values in zip(*scores))
+    cost = (
+        support_volume / (total_area * extent)
+        + overhang_area / total_area
+        - 0.5 * contact_area / total_area
+        + 0.01 * build_height / extent
+    )
+
+    best = int(np.argmin(cost))
+    rx, ry, rz = _euler_xyz(_rotation_to_down(down[best]))
+    return {
+        "rx_rad": rx,
+        "ry_rad": ry,
+        "rz_rad": rz,
+        "down": [round(float(value), 6) for value in down[best]],
+        "candidates": len(down),
+        "overhang_area_mm2": float(overhang_area[best]) * 1.0e6,
+        "support_volume_mm3": float(support_volume[best]) * 1.0e9,
+        "contact_area_mm2": float(contact_area[best]) * 1.0e6,
+        "build_height_mm": float(build_height[best]) * 1000.0,
+    }
+
+
+def world_vertices(co: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float64)
+    return np.asarray(co, dtype=np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def mass_properties(parts: list[tuple[np.ndarray, np.ndarray]], density_g_cm3: float) -> list[dict]:
+    # Divergence theorem over closed triangle meshes: every triangle forms a signed tetrahedron with
+    # the part's reference point. All triangles of all parts go through one set of array operations and
+    # are summed per part with bincount. Inputs are (world vertices in meters, triangle indices);
+    # results are in mm / g, inertia about the center of mass along world axes. Exact for one closed
+    # shell; overlapping primitives of a generated part (never booleaned) add their overlap once per
+    # shell, so volume, mass and inertia are upper bounds.
+    if not parts:
+        return []
+    density = density_g_cm3 / 1000.0
+    origins = np.array([co.mean(axis=0) * 1000.0 if len(co) else np.zeros(3) for co, _ in parts])
+    owner = np.concatenate([np.full(len(tris), index, dtype=np.int64) for index, (_, tris) in enumerate(parts)])
+    corners = np.concatenate(
+        [(np.asarray(co, dtype=np.float64)[tris] * 1000.0) - origins[index] for index, (co, tris) in enumerate(parts)]
+    ).reshape(-1, 3, 3)
+    a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+    count = len(parts)
+
+    def per_part(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(owner, weights=weights, minlength=count)
+
+    cross = np.cross(b, c)
+    tet_volume = np.einsum("ij,ij->i", a, cross) / 6.0
+    total = a + b + c
+    volume = per_part(tet_volume)
+    area = per_part(np.linalg.norm(np.cross(b - a, c - a), axis=1) * 0.5)
+    first = np.column_stack([per_part(tet_volume * total[:, axis] / 4.0) for axis in range(3)])
+
+    # Second moment of a tetrahedron with one vertex at the origin: V/20 (aa^T + bb^T + cc^T + ss^T).
+    outer = (
+        np.einsum("ni,nj->nij", a, a)
+        + np.einsum("ni,nj->nij", b, b)
+        + np.einsum("ni,nj->nij", c, c)
+        + np.einsum("ni,nj->nij", total, total)
+    ) * (tet_volume / 20.0)[:, None, None]
+    second = np.stack([per_part(outer[:, i, j]) for i in range(3) for j in range(3)], axis=1).reshape(count, 3, 3)
+
+    safe_volume = np.where(np.abs(volume) > 1.0e-12, volume, 1.0)
+    center = first / safe_volume[:, None]
+    central = (second - volume[:, None, None] * np.einsum("ni,nj->nij", center, center)) * density
+    inertia = np.trace(central, axis1=1, axis2=2)[:, None, None] * np.eye(3) - central
+    principal = np.linalg.eigvalsh(inertia)
+
+    return [
+        {
+            "volume_mm3": float(volume[index]),
+            "area_mm2": float(area[index]),
+            "mass_g": float(volume[index] * density),
+            "center_mm": ((center[index] + origins[index]).round(4) + 0.0).tolist(),
+            "inertia_g_mm2": (inertia[index].round(4) + 0.0).tolist(),
+            "principal_g_mm2": (principal[index].round(4) + 0.0).tolist(),
+        }
+        for index in range(count)
+    ]
+
+
+def combine_mass_properties(items: list[dict]) -> dict:
+    # Mass-weighted center and inertia of a group of parts about the group's center (parallel axes).
+    mass = sum(item["mass_g"] for item in items)
+    volume = sum(item["volume_mm3"] for item in items)
+    if mass <= 0.0:
+        return {"mass_g": 0.0, "volume_mm3": volume, "center_mm": [0.0, 0.0, 0.0], "inertia_g_mm2": np.zeros((3, 3)).tolist()}
+    center = sum(np.array(item["center_mm"]) * item["mass_g"] for item in items) / mass
+    inertia = np.zeros((3, 3))
+    for item in items:
+        offset = np.array(item["center_mm"]) - center
+        inertia += np.array(item["inertia_g_mm2"]) + item["mass_g"] * (offset @ offset * np.eye(3) - np.outer(offset, offset))
+    return {
+        "mass_g": mass,
+        "volume_mm3": volume,
+        "center_mm": (center.round(4) + 0.0).tolist(),
+        "inertia_g_mm2": (inertia.round(4) + 0.0).tolist(),
+    }
+
+
+def check_part(
+    part: dict,
+    limits: dict,
+    thickness_fn: Callable[[dict, int, float], dict] | None = None,
+) -> dict:
+    # Independent per-part checks on a main-thread snapshot (see dfm.checks._part_snapshot).
+    # Safe to run from worker threads: only reads the arrays in `part`. thickness_fn is
+    # dfm.thickness.wall_thickness inside Blender; without it only the bounding-box wall test runs.
+    name = part["name"]
+    errors: list[str] = []
+    warnings: list[str] = []
+    stats: dict[str, float] = {}
+    timings: dict[str, float] = {}
+    dims = part["dimensions"]
+
+    t0 = time.perf_counter()
+    report = manifold_report(part["vert_count"], part["edge_vertices"], part["loop_vertices"], part["loop_edges"])
+    # Same edge count the bmesh is_manifold test reported: every edge not shared by exactly two faces.
+    open_edges = report["boundary_edges"] + report["non_manifold_edges"] + report["wire_edges"]
+    if open_edges or report["inconsistent_edges"]:
+        errors.append(
+            f"{name}: non-manifold edges={open_edges} "
+            f"(boundary={report['boundary_edges']}, >2 faces={report['non_manifold_edges']}, wire={report['wire_edges']}), "
+            f"inconsistent winding edges={report['inconsistent_edges']}, shells={report['shells']}"
+        )
+    stats["shells"] = report["shells"]
+    t1 = time.perf_counter()
+    timings["manifold"] = t1 - t0
+
+    if min(dims) < limits["min_wall_mm"] / 1000.0:
+        errors.append(f"{name}: below minimum wall {limits['min_wall_mm']:.2f} mm")
+    hole_m = limits["hole_diameter_mm"] / 1000.0
+    margin_m = limits["min_edge_hole_margin_mm"] / 1000.0
+    if min(dims) < hole_m + margin_m * 2.0:
+        warnings.append(f"{name}: hole too close to edge (approx)")
+    t2 = time.perf_counter()
+    timings["min_wall"] = t2 - t1
+
+    walls: dict = {"samples": 0}
+    if thickness_fn is not None and limits["wall_samples"] > 0:
+        walls = thickness_fn(part, limits["wall_samples"], limits["min_wall_mm"])
+    if walls["samples"]:
+        stats["wall_min_mm"] = walls["min_mm"]
+        stats["wall_p05_mm"] = walls["p05_mm"]
+        stats["wall_median_mm"] = walls["median_mm"]
+        stats["wall_violation_ratio"] = walls["violations"] / walls["samples"]
+    if walls.get("violations"):
+        x, y, z = walls["violation_points_mm"][0]
+        warnings.append(
+            f"{name}: thin walls, {walls['violations']}/{walls['samples']} samples below {limits['min_wall_mm']:.2f} mm "
+            f"(min {walls['min_mm']:.2f} mm near {x:.1f}, {y:.1f}, {z:.1f} mm)"
+        )
+    t_wall = time.perf_counter()
+    timings["wall_thickness"] = t_wall - t2
+    t2 = t_wall
+
+    ratio, area_ratio = overhang_ratios(part["normals"], part["areas"], part["matrix"], limits["overhang_warn_deg"])
+    if ratio > 0.50:
+        warnings.append(f"{name}: overhang-heavy geometry ({ratio * 100.0:.0f}% faces, {area_ratio * 100.0:.0f}% area)")
+    stats["overhang_face_ratio"] = ratio
+    stats["overhang_area_ratio"] = area_ratio
+    t3 = time.perf_counter()
+    timings["overhang"] = t3 - t2
+
+    volume_m = [value / 1000.0 for value in limits["print_volume_mm"]]
+    if any(dim > max_dim for dim, max_dim in zip(dims, volume_m)):
+        vx, vy, vz = limits["print_volume_mm"]
+        msg = f"{name}: exceeds print volume {vx:.0f}x{vy:.0f}x{vz:.0f} mm"
+        if limits["auto_split_large_parts"]:
+            warnings.append(msg + "; split recommended")
+        else:
+            errors.append(msg)
+    t4 = time.perf_counter()
+    timings["oversize"] = t4 - t3
+
+    if "tris" in part and len(part["tris"]):
+        orientation = optimize_orientation(
+            part["co"], part["tris"], part["matrix"], limits["overhang_warn_deg"], limits["orientation_candidates"]
+        )
+    else:
+        ori = suggested_orientation(part["bounds_min"], part["bounds_max"])
+        orientation = {"rx_rad": ori[0], "ry_rad": ori[1], "rz_rad": ori[2]}
+    t5 = time.perf_counter()
+    timings["orientation"] = t5 - t4
+
+    estimate: dict = {}
+    if "tris" in part and len(part["tris"]):
+        rotation = euler_xyz_matrix(orientation["rx_rad"], orientation["ry_rad"], orientation["rz_rad"])
+        estimate = estimate_print(world_vertices(part["co"], part["matrix"]), part["tris"], rotation, limits["print"])
+        stats["print_layers"] = estimate["layers"]
+        stats["filament_volume_mm3"] = estimate["filament_volume_mm3"]
+        stats["mass_g"] = estimate["mass_g"]
+        stats["print_time_min"] = estimate["print_time_min"]
+        if estimate["thin_layers"]:
+            z_low, z_high = estimate["thin_z_range_mm"]
+            warnings.append(
+                f"{name}: {estimate['thin_layers']} layers thinner than one extrusion width "
+                f"({limits['print']['nozzle_mm']:.2f} mm) between z={z_low:.1f} and {z_high:.1f} mm as printed"
+            )
+    timings["slicing"] = time.perf_counter() - t5
+
+    return {
+        "name": name,
+        "errors": errors,
+        "warnings": warnings,
+        "orientation": orientation,
+        "stats": stats,
+        "thin_wall_points_mm": walls.get("violation_points_mm", []),
+        "timings": timings,
+    }
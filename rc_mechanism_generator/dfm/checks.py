@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-import math
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import bmesh
 import bpy
-from mathutils import Vector
+import numpy as np
 
-from ..utils.blender_utils import bbox_intersects, world_bbox_bounds
+from ..geometry.dependencies import joined_parts, part_dependencies
+from ..utils.blender_utils import world_bbox_bounds
+from ..utils.collision import ENCLOSED, GeometryCache, find_interferences, minimum_clearances
+from .analysis import check_part, mass_properties, optimize_orientation, world_vertices
+from .congruence import congruence_groups
+from .thickness import wall_thickness
+
+DfmReport = dict
+
+# Bump when check_part changes what it reports, so results stored in .blend files are re-checked.
+DFM_CACHE_VERSION = 7
 
 
 def _generated_mesh_objects(scene: bpy.types.Scene) -> list[bpy.types.Object]:
@@ -17,108 +30,322 @@ def _generated_mesh_objects(scene: bpy.types.Scene) -> list[bpy.types.Object]:
     return result
 
 
-def _manifold_check(obj: bpy.types.Object) -> tuple[bool, str]:
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    bm.normal_update()
-    non_manifold = [e for e in bm.edges if not e.is_manifold]
-    bm.free()
-    if non_manifold:
-        return False, f"{obj.name}: non-manifold edges={len(non_manifold)}"
-    return True, ""
-
-
-def _min_dimension_m(obj: bpy.types.Object) -> float:
-    dims = obj.dimensions
-    return min(dims.x, dims.y, dims.z)
-
-
-def _estimate_overhang_ratio(obj: bpy.types.Object, warn_deg: float) -> float:
-    if obj.type != "MESH" or len(obj.data.polygons) == 0:
-        return 0.0
-    up = Vector((0.0, 0.0, 1.0))
-    warn_rad = math.radians(warn_deg)
-    total = 0
-    bad = 0
-    rot = obj.matrix_world.to_3x3()
-    for poly in obj.data.polygons:
-        total += 1
-        n = (rot @ poly.normal).normalized()
-        angle_from_up = n.angle(up)
-        if angle_from_up > warn_rad and n.z < 0.2:
-            bad += 1
-    if total == 0:
-        return 0.0
-    return bad / total
-
-
-def _hole_edge_warning(obj: bpy.types.Object, hole_diameter_mm: float, min_edge_hole_margin_mm: float) -> bool:
-    hole_dia_m = hole_diameter_mm / 1000.0
-    margin_m = min_edge_hole_margin_mm / 1000.0
-    min_dim = _min_dimension_m(obj)
-    return min_dim < (hole_dia_m + margin_m * 2.0)
-
-
-def _oversize_warning(obj: bpy.types.Object, settings: bpy.types.PropertyGroup) -> bool:
-    max_x = settings.print_volume_x_mm / 1000.0
-    max_y = settings.print_volume_y_mm / 1000.0
-    max_z = settings.print_volume_z_mm / 1000.0
-    dims = obj.dimensions
-    return dims.x > max_x or dims.y > max_y or dims.z > max_z
-
-
-def _wheelwell_interference_warning(obj: bpy.types.Object, refs: bpy.types.PropertyGroup) -> list[str]:
-    warnings = []
-    for side in ("l", "r"):
-        wheelwell = getattr(refs, f"wheelwell_{side}_obj", None)
-        if wheelwell is not None and bbox_intersects(obj, wheelwell):
-            warnings.append(f"{obj.name}: potential interference with WheelWell_{side.upper()} (Box Intersection)")
-    return warnings
-
-
-def suggested_print_orientation(obj: bpy.types.Object) -> tuple[float, float, float]:
-    min_v, max_v = world_bbox_bounds(obj)
-    dims = max_v - min_v
-    if dims.z <= dims.x and dims.z <= dims.y:
-        return (0.0, 0.0, 0.0)
-    if dims.x <= dims.y:
-        return (0.0, math.radians(90.0), 0.0)
-    return (math.radians(90.0), 0.0, 0.0)
-
-
-def run_printability_checks(scene: bpy.types.Scene) -> tuple[list[str], list[str], dict[str, dict[str, float]]]:
+def _mesh_topology_arrays(mesh: bpy.types.Mesh) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    edge_vertices = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_vertices)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    return edge_vertices.reshape(-1, 2), loop_vertices, loop_edges
+
+
+def _mesh_triangles(mesh: bpy.types.Mesh) -> tuple[np.ndarray, np.ndarray]:
+    mesh.calc_loop_triangles()
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    return co.reshape(-1, 3), tris.reshape(-1, 3)
+
+
+def _polygon_normals_areas(mesh: bpy.types.Mesh) -> tuple[np.ndarray, np.ndarray]:
+    count = len(mesh.polygons)
+    normals = np.empty(count * 3, dtype=np.float32)
+    areas = np.empty(count, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    mesh.polygons.foreach_get("area", areas)
+    return normals.reshape(-1, 3), areas
+
+
+def _part_snapshot(obj: bpy.types.Object) -> dict:
+    # Everything the per-part checks need, copied out of bpy on the main thread.
+    mesh = obj.data
+    edge_vertices, loop_vertices, loop_edges = _mesh_topology_arrays(mesh)
+    normals, areas = _polygon_normals_areas(mesh)
+    co, tris = _mesh_triangles(mesh)
+    bounds_min, bounds_max = world_bbox_bounds(obj)
+    return {
+        "name": obj.name,
+        "matrix": np.array(obj.matrix_world),
+        "dimensions": tuple(obj.dimensions),
+        "bounds_min": tuple(bounds_min),
+        "bounds_max": tuple(bounds_max),
+        "vert_count": len(mesh.vertices),
+        "edge_vertices": edge_vertices,
+        "loop_vertices": loop_vertices,
+        "loop_edges": loop_edges,
+        "normals": normals,
+        "areas": areas,
+        "co": co,
+        "tris": tris,
+    }
+
+
+def _mesh_digest(mesh: bpy.types.Mesh) -> bytes:
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    edge_vertices = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.edges.foreach_get("vertices", edge_vertices)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    digest = hashlib.sha1()
+    for array in (co, edge_vertices, loop_vertices, loop_starts):
+        digest.update(array.tobytes())
+    return digest.digest()
+
+
+def _dfm_cache_key(obj: bpy.types.Object, limits: dict, congruence: tuple[bool, float]) -> str:
+    # `congruence` is (dedupe_congruent_parts, congruence_tolerance_mm): toggling either re-checks
+    # every part, so no result produced under the other setting is reused.
+    payload = json.dumps((DFM_CACHE_VERSION, obj.name, limits, congruence), sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha1(payload.encode("utf-8"))
+    digest.update(np.array(obj.matrix_world, dtype=np.float64).tobytes())
+    digest.update(_mesh_digest(obj.data))
+    return digest.hexdigest()
+
+
+def _cached_result(obj: bpy.types.Object, key: str, current_keys: dict[str, str], dedupe: bool) -> dict | None:
+    if obj.get("rcgen_dfm_key") != key:
+        return None
+    try:
+        result = json.loads(obj.get("rcgen_dfm_result", ""))
+    except ValueError:
+        return None
+    # A congruent copy stores its representative's result (orientation, stats, messages), so it is
+    # only reusable while the representative still has the key it had when the copy was made.
+    link = result.get("congruent")
+    if link and (not dedupe or current_keys.get(link["of"]) != link["of_key"]):
+        return None
+    result["timings"] = {}
+    return result
+
+
+def _store_result(obj: bpy.types.Object, key: str, result: dict) -> None:
+    # Stored as ID properties so the cache is saved with the .blend file.
+    stored = {name: value for name, value in result.items() if name != "timings"}
+    obj["rcgen_dfm_key"] = key
+    obj["rcgen_dfm_result"] = json.dumps(stored, separators=(",", ":"))
+
+
+def _congruent_copy(result: dict, name: str, mirrored: bool, rep_key: str) -> dict:
+    # Result of a congruent part's representative, relabeled. Messages keep the representative's
+    # coordinates, so they name it.
+    rep = result["name"]
+    label = f"{name} ({'mirror of' if mirrored else 'same as'} {rep})"
+    copy = json.loads(json.dumps({key: value for key, value in result.items() if key != "timings"}))
+    copy["name"] = name
+    for kind in ("errors", "warnings"):
+        copy[kind] = [label + message[len(rep):] if message.startswith(f"{rep}:") else message for message in result[kind]]
+    copy["timings"] = {}
+    copy["congruent"] = {"of": rep, "mirrored": mirrored, "of_key": rep_key}
+    return copy
+
+
+def _check_limits(settings: bpy.types.PropertyGroup) -> dict:
+    return {
+        "min_wall_mm": settings.min_wall_mm,
+        "wall_samples": settings.wall_thickness_samples,
+        "hole_diameter_mm": settings.hole_diameter_mm,
+        "min_edge_hole_margin_mm": settings.min_edge_hole_margin_mm,
+        "overhang_warn_deg": settings.overhang_warn_deg,
+        "orientation_candidates": settings.orientation_candidates,
+        "print_volume_mm": (settings.print_volume_x_mm, settings.print_volume_y_mm, settings.print_volume_z_mm),
+        "auto_split_large_parts": settings.auto_split_large_parts,
+        "print": {
+            "layer_height_mm": settings.layer_height_mm,
+            "nozzle_mm": settings.nozzle_mm,
+            "wall_count": settings.perimeter_count,
+            "infill_percent": settings.infill_percent,
+            "filament_density_g_cm3": settings.filament_density_g_cm3,
+            "print_speed_mm_s": settings.print_speed_mm_s,
+        },
+    }
+
+
+def _dfm_worker_count(settings: bpy.types.PropertyGroup) -> int:
+    if settings.dfm_workers > 0:
+        return settings.dfm_workers
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _interference_warnings(
+    objs: list[bpy.types.Object],
+    refs: bpy.types.PropertyGroup,
+    joined: set[frozenset[str]],
+    cache: GeometryCache,
+) -> tuple[dict[str, list[str]], set[frozenset[str]]]:
+    # Every part against every other part and the wheel wells, skipping pairs joined by design.
+    wells = [well for well in (refs.wheelwell_l_obj, refs.wheelwell_r_obj) if well is not None]
+    warnings: dict[str, list[str]] = {}
+    intersecting: set[frozenset[str]] = set()
+    for a, b, tri_pairs in find_interferences(objs, wells, ignored_pairs=joined, cache=cache):
+        if tri_pairs == ENCLOSED:
+            detail = "fully enclosed"
+        else:
+            detail = f"{tri_pairs} triangle pairs" if tri_pairs else "bbox, non-mesh"
+        warnings.setdefault(a.name, []).append(f"{a.name}: interference with {b.name} ({detail})")
+        intersecting.add(frozenset((a.name, b.name)))
+    return warnings, intersecting
+
+
+def _clearance_report(
+    objs: list[bpy.types.Object],
+    settings: bpy.types.PropertyGroup,
+    tolerances: bpy.types.PropertyGroup,
+    joined: set[frozenset[str]],
+    intersecting: set[frozenset[str]],
+    cache: GeometryCache,
+) -> tuple[dict[str, list[str]], dict]:
+    # Gap matrix in mm (None = farther than clearance_search_mm). Joined pairs are listed but not
+    # warned about; intersecting pairs are already reported by the interference pass.
+    sliding_mm = tolerances.clearance_sliding_mm
+    gaps = minimum_clearances(objs, settings.clearance_search_mm / 1000.0, intersecting, cache)
+    names = [obj.name for obj in objs]
+    matrix: list[list[float | None]] = [[None] * len(names) for _ in names]
+    warnings: dict[str, list[str]] = {}
+    for i, a in enumerate(names):
+        for j in range(i + 1, len(names)):
+            key = frozenset((a, names[j]))
+            if key not in gaps:
+                continue
+            gap_mm = round(gaps[key] * 1000.0, 3)
+            matrix[i][j] = matrix[j][i] = gap_mm
+            if gap_mm < sliding_mm and key not in joined and key not in intersecting:
+                warnings.setdefault(a, []).append(
+                    f"{a}: clearance to {names[j]} {gap_mm:.2f} mm below sliding clearance {sliding_mm:.2f} mm"
+                )
+    report = {
+        "names": names,
+        "search_mm": settings.clearance_search_mm,
+        "sliding_mm": sliding_mm,
+        "gap_mm": matrix,
+    }
+    return warnings, report
+
+
+def suggested_print_orientation(
+    obj: bpy.types.Object,
+    warn_deg: float = 55.0,
+    candidate_count: int = 128,
+) -> tuple[float, float, float]:
+    co, tris = _mesh_triangles(obj.data)
+    result = optimize_orientation(co, tris, np.array(obj.matrix_world), warn_deg, candidate_count)
+    return result["rx_rad"], result["ry_rad"], result["rz_rad"]
+
+
+def run_printability_checks(
+    scene: bpy.types.Scene,
+) -> tuple[list[str], list[str], dict[str, dict[str, float]], DfmReport]:
     settings = scene.rcgen_settings
     refs = scene.rcgen_refs
     errors: list[str] = []
     warnings: list[str] = []
     orientations: dict[str, dict[str, float]] = {}
+    timings: dict[str, float] = {}
     objs = _generated_mesh_objects(scene)
+    t_start = time.perf_counter()
+
+    # bpy is not thread-safe: read arrays (and run the interference pass) on the main thread,
+    # then run the independent per-part checks in a thread pool (NumPy releases the GIL).
+    # Parts whose mesh, transform and limits are unchanged reuse the result stored on the object.
+    limits = _check_limits(settings)
+    dedupe = settings.dedupe_congruent_parts
+    congruence = (dedupe, settings.congruence_tolerance_mm)
+    keys = [_dfm_cache_key(obj, limits, congruence) for obj in objs]
+    current_keys = {obj.name: key for obj, key in zip(objs, keys)}
+    results: list[dict | None] = [_cached_result(obj, key, current_keys, dedupe) for obj, key in zip(objs, keys)]
+    stale = [index for index, result in enumerate(results) if result is None]
+    parts = [_part_snapshot(objs[index]) for index in stale]
+    timings["extract"] = time.perf_counter() - t_start
+    joined = joined_parts(part_dependencies())
+    geometry: GeometryCache = {}
+    t_interference = time.perf_counter()
+    interference, intersecting = _interference_warnings(objs, refs, joined, geometry)
+    t_clearance = time.perf_counter()
+    timings["interference"] = t_clearance - t_interference
+    clearance, clearance_report = _clearance_report(objs, settings, scene.rcgen_tolerances, joined, intersecting, geometry)
+    timings["clearance"] = time.perf_counter() - t_clearance
+
+    # One vectorized pass over the triangles of every re-checked part.
+    t_mass = time.perf_counter()
+    world = [world_vertices(part["co"], part["matrix"]) for part in parts]
+    masses = mass_properties(list(zip(world, (part["tris"] for part in parts))), settings.filament_density_g_cm3)
+    timings["mass"] = time.perf_counter() - t_mass
 
-    for obj in objs:
-        ok, manifold_msg = _manifold_check(obj)
-        if not ok:
-            errors.append(manifold_msg)
+    # Congruent re-checked parts (usually the L/R copies) are checked once; the copies reuse the result.
+    t_congruence = time.perf_counter()
+    if dedupe:
+        shapes = [(co * 1000.0, part["tris"], mass) for co, part, mass in zip(world, parts, masses)]
+        groups = congruence_groups(shapes, settings.congruence_tolerance_mm)
+    else:
+        groups = [(position, False) for position in range(len(parts))]
+    timings["congruence"] = time.perf_counter() - t_congruence
+    unique = [position for position, (rep, _) in enumerate(groups) if rep == position]
 
-        if _min_dimension_m(obj) < settings.min_wall_mm / 1000.0:
-            errors.append(f"{obj.name}: below minimum wall {settings.min_wall_mm:.2f} mm")
+    workers = min(_dfm_worker_count(settings), len(unique))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rcgen_dfm") as pool:
+            checked = dict(zip(unique, pool.map(lambda position: check_part(parts[position], limits, wall_thickness), unique)))
+    else:
+        checked = {position: check_part(parts[position], limits, wall_thickness) for position in unique}
 
-        if _hole_edge_warning(obj, settings.hole_diameter_mm, settings.min_edge_hole_margin_mm):
-            warnings.append(f"{obj.name}: hole too close to edge (approx)")
+    for position, index in enumerate(stale):
+        rep, mirrored = groups[position]
+        if rep == position:
+            result = checked[position]
+        else:
+            result = _congruent_copy(checked[rep], parts[position]["name"], mirrored, keys[stale[rep]])
+        result["mass"] = masses[position]
+        results[index] = result
+        _store_result(objs[index], keys[index], result)
+    part_results = [result for result in results if result is not None]
+    assert len(part_results) == len(objs), "every part has a cached or re-checked DFM result"
 
-        ratio = _estimate_overhang_ratio(obj, settings.overhang_warn_deg)
-        if ratio > 0.50:
-            warnings.append(f"{obj.name}: overhang-heavy geometry ({ratio * 100.0:.0f}% faces)")
+    # Cached copies were dropped above when their link went stale, so every remaining link holds.
+    congruent = {}
+    for result in part_results:
+        link = result.get("congruent")
+        if dedupe and link and current_keys.get(link["of"]) == link["of_key"]:
+            congruent[result["name"]] = {"of": link["of"], "mirrored": link["mirrored"]}
 
-        if _oversize_warning(obj, settings):
-            msg = f"{obj.name}: exceeds print volume {settings.print_volume_x_mm:.0f}x{settings.print_volume_y_mm:.0f}x{settings.print_volume_z_mm:.0f} mm"
-            if settings.auto_split_large_parts:
-                warnings.append(msg + "; split recommended")
-            else:
-                errors.append(msg)
+    # Results are indexed by scene order, so messages do not depend on scheduling.
+    part_stats: dict[str, dict[str, float]] = {}
+    part_mass: dict[str, dict] = {}
+    for result in part_results:
+        errors.extend(result["errors"])
+        warnings.extend(result["warnings"])
+        warnings.extend(interference.get(result["name"], []))
+        warnings.extend(clearance.get(result["name"], []))
+        orientations[result["name"]] = result["orientation"]
+        part_stats[result["name"]] = result["stats"]
+        part_mass[result["name"]] = result["mass"]
+        for check, seconds in result["timings"].items():
+            timings[check] = timings.get(check, 0.0) + seconds
+    timings["total"] = time.perf_counter() - t_start
 
-        warnings.extend(_wheelwell_interference_warning(obj, refs))
+    report = {
+        "workers": max(1, workers),
+        "checked": len(unique),
+        "congruent_copies": len(stale) - len(unique),
+        "cached": len(objs) - len(stale),
+        "timings_ms": {check: round(seconds * 1000.0, 3) for check, seconds in timings.items()},
+        "parts": part_stats,
+        "mass": part_mass,
+        "clearance": clearance_report,
+        "congruent": congruent,
+    }
+    return errors, warnings, orientations, report
 
-        ori = suggested_print_orientation(obj)
-        orientations[obj.name] = {"rx_rad": ori[0], "ry_rad": ori[1], "rz_rad": ori[2]}
 
-    return errors, warnings, orientations
+def format_dfm_timings(report: DfmReport) -> str:
+    # Per-check times are summed over parts (CPU time across workers); total is wall time.
+    timings = report["timings_ms"]
+    details = ", ".join(f"{check}={ms:.1f}" for check, ms in timings.items() if check != "total")
+    return (
+        f"DFM: {report['checked']} checked, {report['congruent_copies']} congruent copies, {report['cached']} cached "
+        f"({report['workers']} workers); "
+        f"timings ms: {details}; total={timings.get('total', 0.0):.1f}"
+    )
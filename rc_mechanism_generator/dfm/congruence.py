@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import numpy as np
+
+# Congruent and mirrored parts (typically the L/R copies of a part). Every part is put in a canonical
+# frame: vertices centered on their centroid and expressed in their principal (PCA) axes. Two parts
+# match when some assignment of those axes maps one vertex cloud onto the other within tolerance;
+# assignments with determinant -1 are reflections, so the match is a mirror image. Pure NumPy.
+
+_REL_TOL = 1.0e-3
+# Principal variances closer than this (relative) leave the axes inside that plane undefined
+# (round shafts, springs), so the in-plane angle is searched instead of trusted.
+_DEGENERATE_REL = 1.0e-2
+_REFERENCE_CANDIDATES = 64
+_MAX_SAMPLES = 512
+_NN_BLOCK = 8192
+
+# (vertices in mm, triangle indices, mass properties from analysis.mass_properties)
+ShapeInput = tuple[np.ndarray, np.ndarray, dict]
+
+
+def shape_fingerprint(co_mm: np.ndarray, tris: np.ndarray, mass: dict) -> dict:
+    co_mm = np.asarray(co_mm, dtype=np.float64)
+    centered = co_mm - co_mm.mean(axis=0) if len(co_mm) else co_mm.reshape(-1, 3)
+    variances, axes = np.linalg.eigh(centered.T @ centered / max(1, len(centered)))
+    if np.linalg.det(axes) < 0.0:
+        # Right-handed frames, so only the matching rotation can carry a reflection.
+        axes[:, 0] = -axes[:, 0]
+    return {
+        "counts": (len(co_mm), len(tris)),
+        "volume_mm3": abs(mass["volume_mm3"]),
+        "area_mm2": mass["area_mm2"],
+        "variances": variances,
+        "local": centered @ axes,
+    }
+
+
+def _invariants_match(a: dict, b: dict, tol_mm: float) -> bool:
+    if a["counts"] != b["counts"] or a["counts"][0] == 0:
+        return False
+    # Moving every vertex by up to tol_mm changes the volume by about area * tol_mm and each variance
+    # by about 2 * sigma * tol_mm.
+    area = max(a["area_mm2"], b["area_mm2"])
+    if abs(a["area_mm2"] - b["area_mm2"]) > _REL_TOL * area:
+        return False
+    if abs(a["volume_mm3"] - b["volume_mm3"]) > _REL_TOL * max(a["volume_mm3"], b["volume_mm3"]) + area * tol_mm:
+        return False
+    scale = max(float(a["variances"][-1]), float(b["variances"][-1]), 1.0e-12)
+    limit = _REL_TOL * scale + 2.0 * np.sqrt(scale) * tol_mm
+    return bool(np.all(np.abs(a["variances"] - b["variances"]) <= limit))
+
+
+def _plane_rotation(plane: tuple[int, int], angle: float) -> np.ndarray:
+    # Row-vector rotation by `angle` inside the (i, j) coordinate plane.
+    i, j = plane
+    rotation = np.eye(3)
+    rotation[i, i] = rotation[j, j] = np.cos(angle)
+    rotation[i, j] = np.sin(angle)
+    rotation[j, i] = -np.sin(angle)
+    return rotation
+
+
+def _reference_order(local: np.ndarray, plane: tuple[int, int], axis: int) -> np.ndarray:
+    # Vertices away from the symmetry axis, highest along it first: a landmark whose in-plane angle
+    # fixes the rotation about the axis.
+    radius = np.hypot(local[:, plane[0]], local[:, plane[1]])
+    usable = np.flatnonzero(radius >= 0.5 * radius.max())
+    return usable[np.argsort(-local[usable, axis], kind="stable")]
+
+
+def _candidate_rotations(a: dict, b: dict) -> list[np.ndarray]:
+    # Rotations R with a.local @ R ~ b.local. Proper rotations come first, so a part that is its own
+    # mirror image matches as "same".
+    scale = max(float(a["variances"][-1]), 1.0e-12)
+    degenerate = np.diff(a["variances"]) / scale < _DEGENERATE_REL
+    if degenerate.all() or not degenerate.any():
+        candidates = [np.diag((sx, sy, sz)) for sx in (1.0, -1.0) for sy in (1.0, -1.0) for sz in (1.0, -1.0)]
+    else:
+        plane, axis = ((0, 1), 2) if degenerate[0] else ((1, 2), 0)
+        b_refs = _reference_order(b["local"], plane, axis)[:_REFERENCE_CANDIDATES]
+        b_angles = np.arctan2(b["local"][b_refs, plane[1]], b["local"][b_refs, plane[0]])
+        candidates = []
+        # Flipping both plane axes is a half turn, which the angle search already covers.
+        for plane_sign in (1.0, -1.0):
+            for axis_sign in (1.0, -1.0):
+                flip = np.eye(3)
+                flip[plane[0], plane[0]] = plane_sign
+                flip[axis, axis] = axis_sign
+                flipped = a["local"] @ flip
+                ref = _reference_order(flipped, plane, axis)[0]
+                a_angle = np.arctan2(flipped[ref, plane[1]], flipped[ref, plane[0]])
+                candidates.extend(flip @ _plane_rotation(plane, float(angle - a_angle)) for angle in b_angles)
+    return sorted(candidates, key=lambda rotation: bool(np.linalg.det(rotation) < 0.0))
+
+
+def _max_nearest_distance(points: np.ndarray, cloud: np.ndarray) -> float:
+    if len(points) > _MAX_SAMPLES:
+        points = points[:: -(-len(points) // _MAX_SAMPLES)]
+    best = np.full(len(points), np.inf)
+    squared = np.einsum("ij,ij->i", points, points)
+    for start in range(0, len(cloud), _NN_BLOCK):
+        block = cloud[start:start + _NN_BLOCK]
+        d2 = squared[:, None] + np.einsum("ij,ij->i", block, block)[None, :] - 2.0 * points @ block.T
+        best = np.minimum(best, d2.min(axis=1))
+    return float(np.sqrt(max(float(best.max()), 0.0)))
+
+
+def match_shapes(a: dict, b: dict, tol_mm: float) -> bool | None:
+    # None when the parts differ; otherwise whether b is a mirror image of a.
+    if not _invariants_match(a, b, tol_mm):
+        return None
+    b_sorted = np.sort(b["local"], axis=0)
+    for rotation in _candidate_rotations(a, b):
+        moved = a["local"] @ rotation
+        # Sorted coordinates per axis are a cheap necessary condition; nearest neighbours both ways decide.
+        if np.abs(np.sort(moved, axis=0) - b_sorted).max() > tol_mm:
+            continue
+        if _max_nearest_distance(moved, b["local"]) <= tol_mm and _max_nearest_distance(b["local"], moved) <= tol_mm:
+            return bool(np.linalg.det(rotation) < 0.0)
+    return None
+
+
+def congruence_groups(shapes: list[ShapeInput], tol_mm: float) -> list[tuple[int, bool]]:
+    # (representative index, mirrored) per input; the first part of each group in input order is its
+    # representative. Parts are only compared with representatives of the same vertex/triangle count.
+    fingerprints = [shape_fingerprint(co, tris, mass) for co, tris, mass in shapes]
+    result: list[tuple[int, bool]] = []
+    representatives: dict[tuple[int, int], list[int]] = {}
+    for index, fingerprint in enumerate(fingerprints):
+        bucket = representatives.setdefault(fingerprint["counts"], [])
+        for rep in bucket:
+            mirrored = match_shapes(fingerprints[rep], fingerprint, tol_mm)
+            if mirrored is not None:
+                result.append((rep, mirrored))
+                break
+        else:
+            bucket.append(index)
+            result.append((index, False))
+    return result
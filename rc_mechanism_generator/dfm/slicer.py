@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# Slicer-lite: planar sections of the part in its print orientation, used for filament, mass and
+# time estimates. Pure NumPy, like dfm.analysis; all lengths in meters unless the key says mm.
+
+_SKIN_THICKNESS = 0.0008
+# Section points closer than this are the same contour vertex.
+_WELD_DISTANCE = 1.0e-9
+# Thin features must stay thin over this height: a plane grazing the rounded top or bottom of a
+# primitive cuts a sliver one or two layers tall that is not a feature of the part.
+_THIN_MIN_HEIGHT = 0.0006
+
+
+def euler_xyz_matrix(rx: float, ry: float, rz: float) -> np.ndarray:
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    rot_x = np.array(((1.0, 0.0, 0.0), (0.0, cx, -sx), (0.0, sx, cx)))
+    rot_y = np.array(((cy, 0.0, sy), (0.0, 1.0, 0.0), (-sy, 0.0, cy)))
+    rot_z = np.array(((cz, -sz, 0.0), (sz, cz, 0.0), (0.0, 0.0, 1.0)))
+    return rot_z @ rot_y @ rot_x
+
+
+def layer_sections(
+    co: np.ndarray, tris: np.ndarray, layer_height: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Cross-section area and perimeter at the middle of every layer, plus the narrowest island width.
+    # Each triangle is cut by every plane z in [z_low, z_high) it spans; the segments are oriented by
+    # the face normal, so the shoelace sum gives outer contours positive and holes negative.
+    # Exact for one closed shell. Generated parts are unions of overlapping closed primitives that are
+    # never booleaned, so overlapping regions (and the inner contours bounding them) count once per
+    # shell: areas and perimeters, and everything estimate_print derives from them, are upper bounds.
+    z_min = float(co[:, 2].min())
+    layer_count = max(1, math.ceil((float(co[:, 2].max()) - z_min) / layer_height))
+    planes = z_min + (np.arange(layer_count) + 0.5) * layer_height
+    empty = (planes, np.zeros(layer_count), np.zeros(layer_count), np.full(layer_count, np.inf))
+    if len(tris) == 0:
+        return empty
+
+    corners = co[tris]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    order = np.argsort(corners[:, :, 2], axis=1)
+    corners = np.take_along_axis(corners, order[:, :, None], axis=1)
+    low, mid, high = corners[:, 0], corners[:, 1], corners[:, 2]
+
+    first = np.ceil((low[:, 2] - z_min) / layer_height - 0.5).astype(np.int64)
+    last = np.ceil((high[:, 2] - z_min) / layer_height - 0.5).astype(np.int64) - 1
+    counts = np.maximum(last - first + 1, 0)
+    tri_index = np.repeat(np.arange(len(tris)), counts)
+    if len(tri_index) == 0:
+        return empty
+    layer = np.repeat(first, counts) + (np.arange(len(tri_index)) - np.repeat(np.cumsum(counts) - counts, counts))
+    z = planes[layer]
+
+    def cut(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        span = b[:, 2] - a[:, 2]
+        t = np.divide(z - a[:, 2], span, out=np.zeros_like(z), where=span != 0.0)
+        return a[:, :2] + (b[:, :2] - a[:, :2]) * t[:, None]
+
+    l, m, h = low[tri_index], mid[tri_index], high[tri_index]
+    p = cut(l, h)
+    below_mid = (z < m[:, 2])[:, None]
+    q = np.where(below_mid, cut(l, m), cut(m, h))
+
+    # Outward normal points to the right of an outer contour traversed counter-clockwise.
+    n = normals[tri_index]
+    direction = q - p
+    flip = direction[:, 0] * -n[:, 1] + direction[:, 1] * n[:, 0] < 0.0
+    p, q = np.where(flip[:, None], q, p), np.where(flip[:, None], p, q)
+
+    cross = p[:, 0] * q[:, 1] - q[:, 0] * p[:, 1]
+    lengths = np.linalg.norm(q - p, axis=1)
+    areas = np.bincount(layer, weights=cross * 0.5, minlength=layer_count)
+    perimeters = np.bincount(layer, weights=lengths, minlength=layer_count)
+    widths = _island_widths(layer, p, q, cross, lengths, layer_count)
+    return planes, np.maximum(areas, 0.0), perimeters, widths
+
+
+def _connected_labels(u: np.ndarray, v: np.ndarray, count: int) -> np.ndarray:
+    # Connected components of the graph with edges (u, v): hook every node onto the smallest label
+    # it touches, then compress the label chains. Converges in a few passes even for long loops.
+    labels = np.arange(count)
+    while True:
+        low = np.minimum(labels[u], labels[v])
+        hooked = labels.copy()
+        for nodes in (u, v, labels[u], labels[v]):
+            np.minimum.at(hooked, nodes, low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def _island_widths(
+    layer: np.ndarray,
+    p: np.ndarray,
+    q: np.ndarray,
+    cross: np.ndarray,
+    lengths: np.ndarray,
+    layer_count: int,
+) -> np.ndarray:
+    # 2A/P of every island (an outer contour plus the holes inside it), the narrowest per layer.
+    # Adjacent triangles cut a shared edge at the same point, so contours are rebuilt by matching
+    # segment endpoints. Open or branching contours (non-manifold input) are skipped.
+    points = np.round(np.concatenate((p, q)) / _WELD_DISTANCE).astype(np.int64)
+    layers = np.concatenate((layer, layer))
+    order = np.lexsort((points[:, 1], points[:, 0], layers))
+    step = np.any(np.diff(np.column_stack((layers, points))[order], axis=0) != 0, axis=1)
+    node = np.empty(len(order), dtype=np.int64)
+    node[order] = np.concatenate(([0], np.cumsum(step)))
+    u, v = node[: len(p)], node[len(p):]
+    keep = u != v
+    u, v, layer, p, q, cross, lengths = u[keep], v[keep], layer[keep], p[keep], q[keep], cross[keep], lengths[keep]
+    widths = np.full(layer_count, np.inf)
+    if len(u) == 0:
+        return widths
+
+    node_count = int(max(u.max(), v.max())) + 1
+    _, loop = np.unique(_connected_labels(u, v, node_count)[u], return_inverse=True)
+    loop = loop.reshape(-1)
+    loop_count = int(loop.max()) + 1
+    degree = np.bincount(u, minlength=node_count) + np.bincount(v, minlength=node_count)
+    closed = np.ones(loop_count, dtype=bool)
+    closed[loop[(degree[u] != 2) | (degree[v] != 2)]] = False
+    area = np.bincount(loop, weights=cross * 0.5, minlength=loop_count)
+    perimeter = np.bincount(loop, weights=lengths, minlength=loop_count)
+    loop_layer = np.zeros(loop_count, dtype=np.int64)
+    loop_layer[loop] = layer
+    outer = closed & (area > 0.0)
+    island_area = np.where(outer, area, 0.0)
+    island_perimeter = np.where(outer, perimeter, 0.0)
+    holes = np.flatnonzero(closed & (area < 0.0))
+    if len(holes):
+        # Segments of a contour are contiguous once sorted by loop, so its box is one reduceat.
+        by_loop = np.argsort(loop, kind="stable")
+        starts = np.flatnonzero(np.diff(loop[by_loop], prepend=-1))
+        box_min = np.minimum.reduceat(np.minimum(p, q)[by_loop], starts)
+        box_max = np.maximum.reduceat(np.maximum(p, q)[by_loop], starts)
+
+    # Each hole joins the smallest outer contour of its layer whose box contains the hole's box.
+    for hole in holes.tolist():
+        around = outer & (loop_layer == loop_layer[hole])
+        around &= np.all((box_min <= box_min[hole]) & (box_max >= box_max[hole]), axis=1)
+        if around.any():
+            host = int(np.flatnonzero(around)[np.argmin(area[around])])
+            island_area[host] += area[hole]
+            island_perimeter[host] += perimeter[hole]
+    islands = outer & (island_area > 0.0)
+    np.minimum.at(widths, loop_layer[islands], 2.0 * island_area[islands] / island_perimeter[islands])
+    return widths
+
+
+def _runs_at_least(mask: np.ndarray, length: int) -> np.ndarray:
+    # Keeps only the runs of consecutive True values at least `length` long.
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    kept = np.zeros(len(mask) + 1, dtype=np.int64)
+    long_runs = ends - starts >= length
+    np.add.at(kept, starts[long_runs], 1)
+    np.add.at(kept, ends[long_runs], -1)
+    return np.cumsum(kept[:-1]) > 0
+
+
+def estimate_print(co: np.ndarray, tris: np.ndarray, rotation: np.ndarray, params: dict) -> dict:
+    # params: layer_height_mm, nozzle_mm, wall_count, infill_percent, filament_density_g_cm3,
+    # print_speed_mm_s. Extrusion width is taken as the nozzle diameter.
+    layer_height = params["layer_height_mm"] / 1000.0
+    width = params["nozzle_mm"] / 1000.0
+    rotated = np.asarray(co, dtype=np.float64) @ rotation.T
+    planes, areas, perimeters, widths = layer_sections(rotated, tris, layer_height)
+
+    shell_area = np.minimum(areas, perimeters * width * params["wall_count"])
+    filled_area = shell_area + (areas - shell_area) * (params["infill_percent"] / 100.0)
+    # Solid skins: about 0.8 mm of fully filled layers at the bottom and the top.
+    skin = max(1, round(_SKIN_THICKNESS / layer_height))
+    filled_area[:skin] = areas[:skin]
+    filled_area[-skin:] = areas[-skin:]
+    solid_volume = float(areas.sum()) * layer_height
+    filament_volume = float(filled_area.sum()) * layer_height
+    path_length = filament_volume / (width * layer_height)
+
+    # Per island, so a thin rib on a large section is not averaged away: 2A/P approximates the
+    # width of a thin strip (and the radius of a round section).
+    thin = _runs_at_least(widths < width, max(2, math.ceil(_THIN_MIN_HEIGHT / layer_height - 1.0e-9)))
+    thin_z = planes[thin] - planes[0] + layer_height * 0.5
+    return {
+        "layers": int(len(planes)),
+        "solid_volume_mm3": solid_volume * 1.0e9,
+        "filament_volume_mm3": filament_volume * 1.0e9,
+        "mass_g": filament_volume * 1.0e6 * params["filament_density_g_cm3"],
+        "print_time_min": path_length * 1000.0 / params["print_speed_mm_s"] / 60.0,
+        "thin_layers": int(np.count_nonzero(thin)),
+        "thin_z_range_mm": [float(thin_z.min()) * 1000.0, float(thin_z.max()) * 1000.0] if thin.any() else [],
+    }
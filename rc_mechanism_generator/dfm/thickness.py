@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+# Offset of the ray origin below the surface (meters), so the first hit is not the sampled face.
+_RAY_EPSILON = 1.0e-5
+_MAX_REPORTED_POINTS = 8
+# Upper bound on shell crossings followed by one ray (overlapping primitives of a generated part).
+_MAX_CROSSINGS = 32
+
+
+def sample_surface(
+    co: np.ndarray,
+    tris: np.ndarray,
+    count: int,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Area-weighted points on the triangles plus their face normals. Fixed seed keeps reports and the
+    # DFM cache stable between runs.
+    a, b, c = co[tris[:, 0]], co[tris[:, 1]], co[tris[:, 2]]
+    cross = np.cross(b - a, c - a)
+    double_areas = np.linalg.norm(cross, axis=1)
+    valid = double_areas > 0.0
+    if count <= 0 or not valid.any():
+        return np.empty((0, 3)), np.empty((0, 3))
+    a, b, c, cross, double_areas = a[valid], b[valid], c[valid], cross[valid], double_areas[valid]
+
+    rng = np.random.default_rng(seed)
+    picked = rng.choice(len(double_areas), size=count, p=double_areas / double_areas.sum())
+    r1 = np.sqrt(rng.random(count))
+    r2 = rng.random(count)
+    points = (
+        a[picked] * (1.0 - r1)[:, None]
+        + b[picked] * (r1 * (1.0 - r2))[:, None]
+        + c[picked] * (r1 * r2)[:, None]
+    )
+    normals = cross[picked] / double_areas[picked, None]
+    return points, normals
+
+
+def _crossings(
+    tree: BVHTree,
+    origin: list[float],
+    direction: list[float],
+    max_distance: float,
+) -> Iterator[tuple[float, int]]:
+    # Generated parts are unions of closed primitives that were never booleaned, so a ray crosses
+    # internal shells. Yields (distance along the ray, +1) when a hit face points against the ray
+    # (entering a shell) and (distance, -1) otherwise (leaving one), re-casting past each hit.
+    travelled = 0.0
+    for _ in range(_MAX_CROSSINGS):
+        if travelled >= max_distance:
+            return
+        location, normal, _, distance = tree.ray_cast(origin, direction, max_distance - travelled)
+        if location is None:
+            return
+        travelled += distance
+        facing = normal[0] * direction[0] + normal[1] * direction[1] + normal[2] * direction[2]
+        yield travelled, 1 if facing < 0.0 else -1
+        origin = [value + step * _RAY_EPSILON for value, step in zip(location, direction)]
+        travelled += _RAY_EPSILON
+
+
+def wall_thickness(part: dict, sample_count: int, min_wall_mm: float) -> dict:
+    # BVHTree has no batched ray cast, so this loops over the samples in Python (one BVH query per
+    # shell crossing). Samples lying inside another primitive of the part are dropped: a ray along
+    # the outward normal that leaves more shells than it enters started on an internal surface.
+    # The inward ray then walks through embedded shells to the outer hull. Assumes outward winding
+    # (the manifold check reports meshes where that does not hold).
+    matrix = np.asarray(part["matrix"], dtype=np.float64)
+    co = part["co"].astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    tris = part["tris"]
+    points, normals = sample_surface(co, tris, sample_count)
+    if len(points) == 0:
+        return {"samples": 0}
+
+    tree = BVHTree.FromPolygons(co.tolist(), tris.tolist(), all_triangles=True)
+    max_distance = float(np.linalg.norm(co.max(axis=0) - co.min(axis=0))) + _RAY_EPSILON
+    origins = points - normals * _RAY_EPSILON
+    directions = -normals
+    outside = (points + normals * _RAY_EPSILON).tolist()
+    thickness = np.full(len(points), np.nan)
+    internal = 0
+    for index, (origin, direction) in enumerate(zip(origins.tolist(), directions.tolist())):
+        outward = [-value for value in direction]
+        if sum(step for _, step in _crossings(tree, outside[index], outward, max_distance)) < 0:
+            internal += 1
+            continue
+        depth = 1
+        for distance, step in _crossings(tree, origin, direction, max_distance):
+            depth += step
+            if depth == 0:
+                thickness[index] = distance + _RAY_EPSILON
+                break
+
+    measured = ~np.isnan(thickness)
+    if not measured.any():
+        return {"samples": 0, "internal_samples": internal}
+    values_mm = thickness[measured] * 1000.0
+    thin = np.flatnonzero(measured & (thickness * 1000.0 < min_wall_mm))
+    thin = thin[np.argsort(thickness[thin])][:_MAX_REPORTED_POINTS]
+    p05, median = np.percentile(values_mm, (5.0, 50.0))
+    return {
+        "samples": int(measured.sum()),
+        "internal_samples": internal,
+        "min_mm": float(values_mm.min()),
+        "p05_mm": float(p05),
+        "median_mm": float(median),
+        "violations": int(np.count_nonzero(values_mm < min_wall_mm)),
+        "violation_points_mm": (points[thin] * 1000.0).round(2).tolist(),
+    }
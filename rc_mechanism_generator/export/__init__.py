@@ -0,0 +1,32 @@
+from .incremental import atomic_path, is_unchanged, mesh_digest, previous_exports
+from .job import (
+    ExportJob,
+    ExportTask,
+    JobCancelled,
+    active_export_job,
+    last_export_status,
+    set_active_export_job,
+    shutdown_export_job,
+)
+from .stl import stl_records, write_binary_stl
+from .threemf import ThreeMFItem, write_3mf
+from .triangles import evaluated_world_triangles
+
+__all__ = [
+    "ExportJob",
+    "ExportTask",
+    "JobCancelled",
+    "ThreeMFItem",
+    "active_export_job",
+    "atomic_path",
+    "evaluated_world_triangles",
+    "is_unchanged",
+    "last_export_status",
+    "mesh_digest",
+    "previous_exports",
+    "set_active_export_job",
+    "shutdown_export_job",
+    "stl_records",
+    "write_3mf",
+    "write_binary_stl",
+]
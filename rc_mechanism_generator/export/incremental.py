@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import numpy as np
+
+# Bookkeeping for re-exports: manifest.json records a digest, triangle count and file size per
+# exported part, and files whose digest and size still match are not written again.
+
+ExportKey = tuple[str, str]  # (format, object name)
+
+
+@contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    # Yields a temporary path next to `path` and renames it over `path` only if the block finishes,
+    # so a failed or cancelled write leaves the previous file untouched.
+    tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def mesh_digest(co: np.ndarray, tris: np.ndarray, *extra: bytes) -> str:
+    # World-space vertices, so a transform change is a content change. `extra` covers anything else
+    # that ends up in the file (print rotation, bed size).
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(co, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(tris, dtype=np.int32).tobytes())
+    for chunk in extra:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def previous_exports(manifest_path: str) -> dict[ExportKey, dict]:
+    try:
+        with open(manifest_path, encoding="utf-8") as fp:
+            exports = json.load(fp).get("exports", [])
+    except (OSError, ValueError, AttributeError):
+        return {}
+    return {(entry["format"], entry["object"]): entry for entry in exports if "sha1" in entry}
+
+
+def is_unchanged(previous: dict | None, path: str, digest: str) -> bool:
+    # The size check catches files that were deleted, truncated or replaced since the last export.
+    if previous is None or previous.get("path") != path or previous.get("sha1") != digest:
+        return False
+    return os.path.isfile(path) and os.path.getsize(path) == previous.get("bytes")
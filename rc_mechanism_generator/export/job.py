@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+# Export work that runs off Blender's main thread. Tasks only see NumPy arrays and plain Python
+# data snapshotted beforehand; they must never touch bpy. Stages run in order (the manifest is
+# written after the files it lists), tasks inside a stage run concurrently. Task results are kept
+# by label and are visible to the tasks of later stages.
+
+ExportTask = tuple[str, Callable[[], object]]
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class ExportJob:
+    def __init__(self, workers: int, done_message: str = "") -> None:
+        self.total = 0
+        self.completed = 0
+        self.errors: list[str] = []
+        self.results: dict[str, object] = {}
+        self.done_message = done_message
+        self._workers = max(1, workers)
+        self._stages: list[list[ExportTask]] = []
+        self._cancel = threading.Event()
+        self._pending: dict[Future, str] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def add_stage(self, tasks: Sequence[ExportTask]) -> None:
+        if tasks:
+            self._stages.append(list(tasks))
+            self.total += len(tasks)
+
+    def start(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="rcgen-export")
+        self._submit_next_stage()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def close(self) -> None:
+        self._cancel.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def check_cancelled(self) -> None:
+        # Long tasks call this between items so a cancel does not wait for the whole file.
+        if self._cancel.is_set():
+            raise JobCancelled
+
+    def _run(self, task: Callable[[], object]) -> object:
+        self.check_cancelled()
+        return task()
+
+    def _submit_next_stage(self) -> None:
+        executor = self._executor
+        assert executor is not None, "start() creates the executor"
+        for label, task in self._stages.pop(0) if self._stages else ():
+            self._pending[executor.submit(self._run, task)] = label
+
+    def poll(self) -> bool:
+        # Main thread only. Collects finished tasks, starts the next stage when the current one is
+        # done and returns True once the job is over (finished, failed or cancelled).
+        for future in [future for future in self._pending if future.done()]:
+            label = self._pending.pop(future)
+            self.completed += 1
+            if future.cancelled():
+                continue
+            exc = future.exception()
+            if exc is None:
+                self.results[label] = future.result()
+            elif not isinstance(exc, JobCancelled):
+                self.errors.append(f"{label}: {exc}")
+        if self._pending:
+            return False
+        if self._stages and not self.errors and not self.cancelled:
+            self._submit_next_stage()
+            return False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        return True
+
+    def wait(self) -> None:
+        # Blocking variant for background (no UI) sessions, where timers never fire.
+        while not self.poll():
+            wait(list(self._pending), return_when=FIRST_COMPLETED)
+
+
+_active_job: ExportJob | None = None
+_last_status = ""
+
+
+def active_export_job() -> ExportJob | None:
+    return _active_job
+
+
+def set_active_export_job(job: ExportJob | None, status: str = "") -> None:
+    global _active_job, _last_status
+    _active_job = job
+    if status:
+        _last_status = status
+
+
+def last_export_status() -> str:
+    return _last_status
+
+
+def shutdown_export_job() -> None:
+    global _active_job
+    if _active_job is not None:
+        _active_job.close()
+    _active_job = None
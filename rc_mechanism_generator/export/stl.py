@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .incremental import atomic_path
+
+STL_HEADER = b"RC Mechanism Generator binary STL".ljust(80, b" ")
+STL_RECORD = np.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attributes", "<u2"),
+    ]
+)
+
+
+def stl_records(co: np.ndarray, tris: np.ndarray) -> np.ndarray:
+    corners = co[tris]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    records = np.zeros(len(tris), dtype=STL_RECORD)
+    records["normal"] = np.divide(normals, lengths[:, None], out=np.zeros_like(normals), where=lengths[:, None] > 0.0)
+    records["vertices"] = corners
+    return records
+
+
+def write_binary_stl(path: str, co: np.ndarray, tris: np.ndarray) -> int:
+    # 80-byte header, little-endian triangle count, then 50-byte records written in one tofile call.
+    records = stl_records(co, tris)
+    with atomic_path(path) as tmp, open(tmp, "wb") as fp:
+        fp.write(STL_HEADER)
+        fp.write(np.uint32(len(records)).astype("<u4").tobytes())
+        records.tofile(fp)
+    return len(records)
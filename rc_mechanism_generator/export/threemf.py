@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import zipfile
+from collections.abc import Iterable
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+
+from .incremental import atomic_path
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>'
+    "</Types>"
+)
+RELATIONSHIPS = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Target="/3D/3dmodel.model" Id="rel0" '
+    'Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>'
+    "</Relationships>"
+)
+MODEL_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<model unit="millimeter" xml:lang="en-US" '
+    'xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">\n'
+    "<resources>\n"
+)
+
+_CHUNK_ROWS = 8192
+_BED_SPACING_MM = 5.0
+
+# (name, world vertices in mm, triangle indices, print transforms). The transforms are one 3x3
+# print rotation or a stack of them (n x 3 x 3), one build item each: congruent copies are extra
+# instances of the same object, with a reflection (determinant -1) for mirrored copies.
+ThreeMFItem = tuple[str, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _write_rows(stream, row_format: str, rows: np.ndarray) -> None:
+    # One string-format call per chunk instead of one per vertex/triangle.
+    for start in range(0, len(rows), _CHUNK_ROWS):
+        chunk = rows[start:start + _CHUNK_ROWS]
+        text = (row_format * len(chunk)) % tuple(chunk.ravel().tolist())
+        stream.write(text.encode("utf-8"))
+
+
+def _transform_attr(rotation: np.ndarray, translation: np.ndarray) -> str:
+    # 3MF uses row vectors (p' = p M), so the rotation goes in transposed with the translation last.
+    values = [*rotation.T.ravel().tolist(), *translation.tolist()]
+    return " ".join(f"{value:.6f}" for value in values)
+
+
+def write_3mf(path: str, items: Iterable[ThreeMFItem], bed_size_mm: tuple[float, float]) -> int:
+    # Streams every object into 3D/3dmodel.model as it is produced, so only one part's arrays (and
+    # none of the XML) are held at a time. Mesh vertices are stored relative to the part's center;
+    # the build item applies the print rotation, drops the part on the bed and lays items out in rows.
+    build: list[tuple[int, str]] = []
+    cursor_x = cursor_y = row_depth = 0.0
+    with atomic_path(path) as tmp, zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", CONTENT_TYPES)
+        package.writestr("_rels/.rels", RELATIONSHIPS)
+        with package.open("3D/3dmodel.model", "w") as stream:
+            stream.write(MODEL_HEADER.encode("utf-8"))
+            for object_id, (name, co, tris, transforms) in enumerate(items, start=1):
+                if len(tris) == 0:
+                    continue
+                center = (co.min(axis=0) + co.max(axis=0)) * 0.5
+                local = co - center
+                stream.write(f'<object id="{object_id}" type="model" name={quoteattr(name)}><mesh>\n<vertices>\n'.encode("utf-8"))
+                _write_rows(stream, '<vertex x="%.4f" y="%.4f" z="%.4f"/>\n', local)
+                stream.write(b"</vertices>\n<triangles>\n")
+                _write_rows(stream, '<triangle v1="%d" v2="%d" v3="%d"/>\n', tris)
+                stream.write(b"</triangles>\n</mesh></object>\n")
+
+                for rotation in np.asarray(transforms, dtype=np.float64).reshape(-1, 3, 3):
+                    rotated = local @ rotation.T
+                    low, high = rotated.min(axis=0), rotated.max(axis=0)
+                    width, depth = high[0] - low[0], high[1] - low[1]
+                    if cursor_x > 0.0 and cursor_x + width > bed_size_mm[0]:
+                        cursor_x, cursor_y, row_depth = 0.0, cursor_y + row_depth + _BED_SPACING_MM, 0.0
+                    translation = np.array((cursor_x, cursor_y, 0.0)) - low
+                    cursor_x += width + _BED_SPACING_MM
+                    row_depth = max(row_depth, depth)
+                    build.append((object_id, _transform_attr(rotation, translation)))
+
+            stream.write(b"</resources>\n<build>\n")
+            for object_id, transform in build:
+                stream.write(f'<item objectid="{object_id}" transform="{transform}"/>\n'.encode("utf-8"))
+            stream.write(b"</build>\n</model>\n")
+    return len(build)
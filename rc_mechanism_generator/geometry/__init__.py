@@ -8,14 +8,51 @@ from .builders import (
     build_spring_mesh,
     build_wishbone_mesh,
 )
+from .dependencies import invalidated_nodes, is_mount_node, joined_parts, part_dependencies, part_module
+from .lod import LOD_FULL, LOD_PREVIEW, clear_full_cache, full_resolution_buffers, lod_settings, remember_full_buffer
+from .mesh_buffer import MeshBuffer
+from .parallel import build_parts, default_worker_count, shutdown_executor
+from .parts import (
+    PartSpec,
+    all_part_specs,
+    build_part,
+    part_hash,
+    servo_horn_tips,
+    shock_part_specs,
+    steering_part_specs,
+    suspension_part_specs,
+)
 
 __all__ = [
+    "LOD_FULL",
+    "LOD_PREVIEW",
+    "MeshBuffer",
+    "PartSpec",
+    "all_part_specs",
     "build_knuckle_mesh",
     "build_link_mesh",
+    "build_part",
+    "build_parts",
     "build_servo_horn_dual_mesh",
     "build_servo_horn_mesh",
     "build_shock_body_mesh",
     "build_shock_rod_mesh",
     "build_spring_mesh",
     "build_wishbone_mesh",
+    "clear_full_cache",
+    "default_worker_count",
+    "full_resolution_buffers",
+    "invalidated_nodes",
+    "is_mount_node",
+    "joined_parts",
+    "lod_settings",
+    "part_dependencies",
+    "part_hash",
+    "part_module",
+    "remember_full_buffer",
+    "servo_horn_tips",
+    "shutdown_executor",
+    "shock_part_specs",
+    "steering_part_specs",
+    "suspension_part_specs",
 ]
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+# Dependency graph between scene inputs and generated parts. Node names:
+#   "ref:<name>"        RCGEN_References pointer (hardpoint empties, wheels, chassis, ...)
+#   "settings:<name>"   RCGEN_Settings property
+#   "tolerances:<name>" RCGEN_Tolerances property
+#   "RC_*"              generated object (parts and inferred shock mounts)
+DependencyGraph = dict[str, frozenset[str]]
+
+_HOLE_INPUTS = ("settings:default_hardware", "tolerances:hole_oversize_mm")
+_ARM_SETTINGS = (
+    "arm_rod_diameter_mm",
+    "arm_bushing_diameter_mm",
+    "min_wall_mm",
+    "add_ribs",
+    "arm_section",
+    "segments",
+)
+_SHOCK_BOTTOM_SETTINGS = (
+    "bottom_mount_ratio",
+    "bottom_inboard_offset_mm",
+    "bottom_vertical_offset_mm",
+    "bottom_fore_aft_offset_mm",
+)
+_SHOCK_TOP_SETTINGS = (
+    "top_height_from_wheel_center_mm",
+    "top_fore_aft_offset_mm",
+    "top_inboard_offset_mm",
+    "tire_diameter_mm_manual",
+    "wheel_spin_axis",
+)
+_SHOCK_SETTINGS = (
+    "use_manual_shock_mounts",
+    "shock_total_length_mm",
+    "shock_stroke_mm",
+    "segments",
+)
+_SPRING_SETTINGS = (
+    "generate_spring",
+    "spring_outer_diameter_mm",
+    "spring_wire_diameter_mm",
+    "spring_turns",
+    "spring_resolution",
+)
+
+# Viewport LOD settings replace the resolution settings they shadow (see geometry.lod).
+_LOD_INPUTS = {
+    "settings:segments": ("settings:use_preview_lod", "settings:preview_segments"),
+    "settings:spring_resolution": ("settings:use_preview_lod", "settings:preview_spring_resolution"),
+}
+
+_MODULE_PREFIXES = (
+    ("RC_LCA_", "suspension"),
+    ("RC_UCA_", "suspension"),
+    ("RC_Knuckle_", "suspension"),
+    ("RC_ServoHorn", "steering"),
+    ("RC_TieRod_", "steering"),
+    ("RC_ShockTop_", "shocks"),
+    ("RC_ShockBottom_", "shocks"),
+    ("RC_ShockBody_", "shocks"),
+    ("RC_ShockRod_", "shocks"),
+    ("RC_Spring_", "shocks"),
+)
+
+
+def _settings(*names: str) -> tuple[str, ...]:
+    return tuple(f"settings:{name}" for name in names)
+
+
+def _wheel_center(key: str) -> tuple[str, ...]:
+    return (f"ref:hub_{key}_obj", f"ref:wheel_{key}_obj")
+
+
+def part_dependencies(sides: Iterable[str] = ("L", "R")) -> DependencyGraph:
+    sliding = "tolerances:clearance_sliding_mm"
+    graph: dict[str, tuple[str, ...]] = {
+        "RC_ServoHorn": (
+            "ref:servo_obj",
+            "ref:servo_horn_obj",
+            "ref:chassis_obj",
+            *_settings("servo_axis", "servo_horn_length_mm", "servo_horn_diameter_mm", "tie_rod_diameter_mm", "segments"),
+            *_HOLE_INPUTS,
+        ),
+    }
+    for side in sides:
+        key = side.lower()
+        for arm in ("LCA", "UCA"):
+            prefix = arm.lower()
+            graph[f"RC_{arm}_{side}"] = (
+                f"ref:{prefix}_in_front_{key}",
+                f"ref:{prefix}_in_rear_{key}",
+                f"ref:{prefix}_out_{key}",
+                "ref:chassis_obj",
+                *_settings(*_ARM_SETTINGS),
+                sliding,
+                *_HOLE_INPUTS,
+            )
+        graph[f"RC_Knuckle_{side}"] = (
+            f"ref:lca_out_{key}",
+            f"ref:uca_out_{key}",
+            f"ref:steering_arm_point_{key}",
+            f"ref:upright_{key}_obj",
+            "ref:chassis_obj",
+            *_wheel_center(key),
+            *_settings("generate_knuckle_when_missing", "segments", "default_hardware"),
+        )
+        graph[f"RC_TieRod_{side}"] = (
+            "ref:servo_obj",
+            "ref:chassis_obj",
+            f"ref:steering_arm_point_{key}",
+            *_settings("servo_horn_length_mm", "tie_rod_diameter_mm", "tie_rod_terminal_diameter_mm", "steering_min_length_mm", "segments"),
+            sliding,
+            *_HOLE_INPUTS,
+        )
+        # Inferred mounts (infer_shock_mounts): the bottom mount sits on the LCA, the top one is
+        # placed from the wheel center and pushed out of the wheel well.
+        graph[f"RC_ShockBottom_{side}"] = (
+            f"RC_LCA_{side}",
+            *_settings(*_SHOCK_BOTTOM_SETTINGS),
+        )
+        graph[f"RC_ShockTop_{side}"] = (
+            "ref:chassis_obj",
+            f"ref:tire_{key}_obj",
+            f"ref:wheelwell_{key}_obj",
+            *_wheel_center(key),
+            *_settings(*_SHOCK_TOP_SETTINGS),
+        )
+        mounts = (
+            f"RC_ShockTop_{side}",
+            f"RC_ShockBottom_{side}",
+            f"ref:shock_top_{key}",
+            f"ref:shock_bottom_{key}",
+            *_settings(*_SHOCK_SETTINGS),
+        )
+        graph[f"RC_ShockBody_{side}"] = (*mounts, *_settings("shock_body_diameter_mm", "shock_eyelet_diameter_mm"), *_HOLE_INPUTS)
+        graph[f"RC_ShockRod_{side}"] = (*mounts, *_settings("shock_rod_diameter_mm", "shock_eyelet_diameter_mm", "default_hardware"))
+        graph[f"RC_Spring_{side}"] = (*mounts, *_settings(*_SPRING_SETTINGS))
+    return {
+        node: frozenset(inputs).union(*(_LOD_INPUTS.get(source, ()) for source in inputs))
+        for node, inputs in graph.items()
+    }
+
+
+def is_mount_node(name: str) -> bool:
+    return name.startswith(("RC_ShockTop_", "RC_ShockBottom_"))
+
+
+def part_module(name: str) -> str | None:
+    for prefix, module in _MODULE_PREFIXES:
+        if name.startswith(prefix):
+            return module
+    return None
+
+
+def _is_joint_input(node: str) -> bool:
+    # Hardpoint empties, the servo and generated nodes are physical joints; other "_obj" references
+    # (chassis, wheels, wells) and settings are shared by parts that are not attached to each other.
+    if node.startswith("ref:"):
+        return not node.endswith("_obj") or node == "ref:servo_obj"
+    return node.startswith("RC_")
+
+
+def joined_parts(graph: DependencyGraph) -> set[frozenset[str]]:
+    # Pairs of parts that touch by design (ball joints, shock/rod/spring, bottom mount on the LCA).
+    joints: dict[str, set[str]] = {}
+    for node, inputs in graph.items():
+        if is_mount_node(node):
+            continue
+        expanded = {node, *inputs}
+        for source in inputs:
+            if is_mount_node(source):
+                expanded |= graph.get(source, frozenset())
+        joints[node] = {source for source in expanded if _is_joint_input(source)}
+
+    parts = sorted(joints)
+    return {
+        frozenset((a, b))
+        for index, a in enumerate(parts)
+        for b in parts[index + 1:]
+        if joints[a] & joints[b]
+    }
+
+
+def invalidated_nodes(changed: Iterable[str], graph: DependencyGraph) -> set[str]:
+    dependents: dict[str, set[str]] = {}
+    for node, inputs in graph.items():
+        for source in inputs:
+            dependents.setdefault(source, set()).add(node)
+
+    stack = list(changed)
+    result = {node for node in stack if node in graph}
+    while stack:
+        for node in dependents.get(stack.pop(), ()):
+            if node not in result:
+                result.add(node)
+                stack.append(node)
+    return result
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from .mesh_buffer import MeshBuffer
+from .parallel import build_parts
+from .parts import PartSpec, part_hash
+
+LOD_PREVIEW = "PREVIEW"
+LOD_FULL = "FULL"
+
+_FULL_CACHE_SIZE = 64
+_full_cache: OrderedDict[str, MeshBuffer] = OrderedDict()
+
+
+def lod_settings(settings: dict[str, Any], lod: str) -> dict[str, Any]:
+    if lod != LOD_PREVIEW:
+        return settings
+    result = dict(settings)
+    result["segments"] = min(settings["segments"], settings["preview_segments"])
+    result["spring_resolution"] = min(settings["spring_resolution"], settings["preview_spring_resolution"])
+    return result
+
+
+def remember_full_buffer(content_hash: str, buffer: MeshBuffer) -> None:
+    _full_cache[content_hash] = buffer
+    _full_cache.move_to_end(content_hash)
+    while len(_full_cache) > _FULL_CACHE_SIZE:
+        _full_cache.popitem(last=False)
+
+
+def clear_full_cache() -> None:
+    _full_cache.clear()
+
+
+def full_resolution_buffers(specs: list[PartSpec], workers: int = 1, min_parts: int = 0) -> tuple[list[MeshBuffer], str]:
+    hashes = [part_hash(spec) for spec in specs]
+    found = {digest: _full_cache[digest] for digest in hashes if digest in _full_cache}
+    missing = [spec for spec, digest in zip(specs, hashes) if digest not in found]
+    built, fallback = build_parts(missing, workers, min_parts)
+    for spec, buffer in zip(missing, built):
+        digest = part_hash(spec)
+        found[digest] = buffer
+        remember_full_buffer(digest, buffer)
+    return [found[digest] for digest in hashes], fallback
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class MeshBuffer:
+    __slots__ = ("_co", "_loops", "_loop_totals", "vert_count", "loop_count", "face_count")
+
+    def __init__(self, vert_capacity: int = 1024, face_capacity: int = 1024) -> None:
+        self._co = np.empty((max(1, vert_capacity), 3), dtype=np.float32)
+        self._loops = np.empty(max(1, face_capacity) * 4, dtype=np.int32)
+        self._loop_totals = np.empty(max(1, face_capacity), dtype=np.int32)
+        self.vert_count = 0
+        self.loop_count = 0
+        self.face_count = 0
+
+    def __getstate__(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Pickle only the filled slices; spare capacity would be shipped to worker processes otherwise.
+        return self.co.copy(), self.loops.copy(), self.loop_totals.copy()
+
+    def __setstate__(self, state: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        self._co, self._loops, self._loop_totals = state
+        self.vert_count = len(self._co)
+        self.loop_count = len(self._loops)
+        self.face_count = len(self._loop_totals)
+
+    @property
+    def co(self) -> np.ndarray:
+        return self._co[: self.vert_count]
+
+    @property
+    def loops(self) -> np.ndarray:
+        return self._loops[: self.loop_count]
+
+    @property
+    def loop_totals(self) -> np.ndarray:
+        return self._loop_totals[: self.face_count]
+
+    def loop_starts(self) -> np.ndarray:
+        starts = np.zeros(self.face_count, dtype=np.int32)
+        if self.face_count > 1:
+            np.cumsum(self.loop_totals[:-1], out=starts[1:])
+        return starts
+
+    @staticmethod
+    def _grown(array: np.ndarray, needed: int) -> np.ndarray:
+        if needed <= len(array):
+            return array
+        grown = np.empty((max(needed, len(array) * 2),) + array.shape[1:], dtype=array.dtype)
+        grown[: len(array)] = array
+        return grown
+
+    def _reserve(self, verts: int, loops: int, faces: int) -> None:
+        self._co = self._grown(self._co, self.vert_count + verts)
+        self._loops = self._grown(self._loops, self.loop_count + loops)
+        self._loop_totals = self._grown(self._loop_totals, self.face_count + faces)
+
+    def append(
+        self,
+        co: np.ndarray,
+        loops: np.ndarray,
+        loop_totals: np.ndarray,
+        linear: np.ndarray | None = None,
+        offset: np.ndarray | None = None,
+    ) -> None:
+        # Optional affine transform is written straight into the reserved slice (no temporary copy).
+        n_verts, n_loops, n_faces = len(co), len(loops), len(loop_totals)
+        if n_verts == 0:
+            return
+        self._reserve(n_verts, n_loops, n_faces)
+        v0, l0, f0 = self.vert_count, self.loop_count, self.face_count
+        co_slot = self._co[v0 : v0 + n_verts]
+        if linear is not None:
+            np.matmul(co, linear.T, out=co_slot, casting="same_kind")
+        else:
+            co_slot[:] = co
+        if offset is not None:
+            co_slot += offset
+        np.add(loops, v0, out=self._loops[l0 : l0 + n_loops], casting="same_kind")
+        self._loop_totals[f0 : f0 + n_faces] = loop_totals
+        self.vert_count += n_verts
+        self.loop_count += n_loops
+        self.face_count += n_faces
+
+    def extend(self, other: MeshBuffer) -> None:
+        self.append(other.co, other.loops, other.loop_totals)
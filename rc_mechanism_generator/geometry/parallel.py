@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import numpy as np
+
+from .mesh_buffer import MeshBuffer
+from .parts import PartSpec, build_part
+
+_executor: Executor | None = None
+_executor_workers = 0
+# Set once a spawned worker failed to load the geometry package, so later calls go straight to
+# the serial path instead of paying for a new pool each time.
+_unavailable_reason = ""
+
+# Time allowed for a fresh worker to start and load the package (interpreter spawn included).
+_PROBE_TIMEOUT_S = 60.0
+
+# Work items are pickled by module path. Installed as an extension the add-on lives under
+# `bl_ext.*`, which Blender registers at runtime and a plain spawned interpreter cannot import.
+# This package only depends on NumPy, so each worker loads it from its directory under a
+# top-level name instead, and every call reaches it through builtins (`exec`, `eval`) that
+# unpickle anywhere. Specs go in as plain dicts and meshes come back as plain arrays.
+_WORKER_PACKAGE = "rcgen_geometry"
+_WORKER_INIT = """
+import importlib.util, sys
+if {name!r} not in sys.modules:
+    spec = importlib.util.spec_from_file_location({name!r}, {init!r}, submodule_search_locations=[{path!r}])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[{name!r}] = module
+    spec.loader.exec_module(module)
+"""
+_WORKER_BUILD = f"__import__({_WORKER_PACKAGE!r}).build_part(spec).__getstate__()"
+
+
+def default_worker_count() -> int:
+    return max(1, min(8, (os.cpu_count() or 2) - 1))
+
+
+def resolve_worker_count(requested: int) -> int:
+    return default_worker_count() if requested <= 0 else requested
+
+
+def _worker_init_source() -> str:
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    return _WORKER_INIT.format(
+        name=_WORKER_PACKAGE,
+        init=os.path.join(package_dir, "__init__.py"),
+        path=package_dir,
+    )
+
+
+def _probe_executor(executor: Executor) -> None:
+    # Fails if the initializer could not load the package (the pool is broken then).
+    executor.submit(exec, f"import {_WORKER_PACKAGE}").result(timeout=_PROBE_TIMEOUT_S)
+
+
+def _get_executor(workers: int) -> Executor:
+    global _executor, _executor_workers, _unavailable_reason
+    if _unavailable_reason:
+        raise RuntimeError(_unavailable_reason)
+    if _executor is not None and _executor_workers == workers:
+        return _executor
+    shutdown_executor()
+    # "spawn" keeps workers independent of the host process state (Blender is not fork-safe).
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=exec,
+        initargs=(_worker_init_source(),),
+    )
+    try:
+        _probe_executor(executor)
+    except Exception as exc:
+        executor.shutdown(wait=False, cancel_futures=True)
+        _unavailable_reason = f"worker cannot load the geometry package ({exc.__class__.__name__})"
+        raise RuntimeError(_unavailable_reason) from exc
+    _executor = executor
+    _executor_workers = workers
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor, _executor_workers, _unavailable_reason
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = 0
+    _unavailable_reason = ""
+
+
+def build_parts_serial(specs: list[PartSpec]) -> list[MeshBuffer]:
+    return [build_part(spec) for spec in specs]
+
+
+def build_parts_parallel(specs: list[PartSpec], workers: int) -> list[MeshBuffer]:
+    executor = _get_executor(workers)
+    chunksize = max(1, len(specs) // (workers * 4))
+    try:
+        calls = [_WORKER_BUILD] * len(specs)
+        states = list(executor.map(eval, calls, [{"spec": spec} for spec in specs], chunksize=chunksize))
+    except Exception:
+        # A broken pool cannot be reused; the next call starts a fresh one.
+        shutdown_executor()
+        raise
+    return [_buffer_from_state(state) for state in states]
+
+
+def _buffer_from_state(state: tuple[np.ndarray, np.ndarray, np.ndarray]) -> MeshBuffer:
+    # Rebuilt here so callers get this package's MeshBuffer, not the worker's copy of the class.
+    buffer = MeshBuffer.__new__(MeshBuffer)
+    buffer.__setstate__(state)
+    return buffer
+
+
+def build_parts(specs: list[PartSpec], workers: int = 1, min_parts: int = 0) -> tuple[list[MeshBuffer], str]:
+    workers = resolve_worker_count(workers)
+    if workers <= 1 or len(specs) < max(2, min_parts):
+        return build_parts_serial(specs), ""
+    try:
+        return build_parts_parallel(specs, workers), ""
+    except Exception as exc:
+        reason = _unavailable_reason or exc.__class__.__name__
+        return build_parts_serial(specs), f"Parallel generation unavailable ({reason}); parts built serially."
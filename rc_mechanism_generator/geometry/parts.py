@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable
+
+import numpy as np
+
+from .builders import (
+    build_knuckle_mesh,
+    build_link_mesh,
+    build_servo_horn_dual_mesh,
+    build_shock_body_mesh,
+    build_shock_rod_mesh,
+    build_spring_mesh,
+    build_wishbone_mesh,
+)
+from .mesh_buffer import MeshBuffer
+
+# Part specs are plain dicts/tuples so a scene snapshot can be hashed, pickled to worker
+# processes or produced on a build server without a Blender process.
+PartSpec = dict[str, Any]
+
+# Bump when a builder changes its output for the same arguments, so cached parts get rebuilt.
+GEOMETRY_VERSION = 1
+
+_BUILDERS: dict[str, Callable[..., MeshBuffer]] = {
+    "wishbone": build_wishbone_mesh,
+    "link": build_link_mesh,
+    "knuckle": build_knuckle_mesh,
+    "servo_horn_dual": build_servo_horn_dual_mesh,
+    "shock_body": build_shock_body_mesh,
+    "shock_rod": build_shock_rod_mesh,
+    "spring": build_spring_mesh,
+}
+
+
+def _mm(value_mm: float) -> float:
+    return value_mm / 1000.0
+
+
+def _pt(value: Any) -> tuple[float, float, float]:
+    return tuple(float(c) for c in value)  # type: ignore[return-value]
+
+
+def _spec(
+    name: str,
+    mesh_name: str,
+    builder: str,
+    side: str,
+    module: str,
+    collection: str,
+    parent: str,
+    args: dict[str, Any],
+    params: dict[str, Any],
+) -> PartSpec:
+    return {
+        "name": name,
+        "mesh_name": mesh_name,
+        "builder": builder,
+        "side": side,
+        "module": module,
+        "collection": collection,
+        "parent": parent,
+        "args": args,
+        "params": params,
+    }
+
+
+def suspension_part_specs(snapshot: dict[str, Any]) -> list[PartSpec]:
+    settings = snapshot["settings"]
+    iface = snapshot["iface"]
+    points = snapshot["points"]
+    rod_radius = max(_mm(settings["arm_rod_diameter_mm"]) * 0.5, _mm(settings["min_wall_mm"]) * 0.5)
+    bushing_radius = _mm(settings["arm_bushing_diameter_mm"]) * 0.5 + iface["sliding_clearance_m"]
+    hole_dia_mm = round(iface["hole_m"] * 1000.0, 3)
+
+    specs = []
+    for side in snapshot["sides"]:
+        key = side.lower()
+        for arm, scale in (("LCA", 1.0), ("UCA", 0.9)):
+            prefix = arm.lower()
+            specs.append(
+                _spec(
+                    f"RC_{arm}_{side}",
+                    f"RC_{arm}_{side}_MESH",
+                    "wishbone",
+                    side,
+                    "suspension",
+                    "front",
+                    "chassis",
+                    {
+                        "in_front": _pt(points[f"{prefix}_in_front_{key}"]),
+                        "in_rear": _pt(points[f"{prefix}_in_rear_{key}"]),
+                        "out_point": _pt(points[f"{prefix}_out_{key}"]),
+                        "rod_radius": rod_radius * scale,
+                        "bushing_radius": bushing_radius * scale,
+                        "segments": settings["segments"],
+                        "add_rib": settings["add_ribs"],
+                        "section": settings["arm_section"],
+                    },
+                    {
+                        "kind": arm,
+                        "hardware": settings["default_hardware"],
+                        "hole_dia_mm": hole_dia_mm,
+                        "arm_section": settings["arm_section"],
+                    },
+                )
+            )
+
+        if not snapshot["uprights"].get(side) and settings["generate_knuckle_when_missing"]:
+            specs.append(
+                _spec(
+                    f"RC_Knuckle_{side}",
+                    f"RC_KNUCKLE_{side}_MESH",
+                    "knuckle",
+                    side,
+                    "suspension",
+                    "front",
+                    "chassis",
+                    {
+                        "center": _pt(points[f"wheel_center_{key}"]),
+                        "lca_out": _pt(points[f"lca_out_{key}"]),
+                        "uca_out": _pt(points[f"uca_out_{key}"]),
+                        "steering_point": _pt(points[f"steering_arm_point_{key}"]),
+                        "core_radius": _mm(7.0),
+                        "arm_radius": _mm(3.0),
+                        "segments": settings["segments"],
+                    },
+                    {"kind": "KNUCKLE", "hardware": settings["default_hardware"]},
+                )
+            )
+    return specs
+
+
+def servo_horn_tips(snapshot: dict[str, Any]) -> dict[str, tuple[float, float, float]]:
+    right = np.asarray(snapshot["axes"]["right"], dtype=np.float64)
+    center = np.asarray(snapshot["points"]["servo"], dtype=np.float64)
+    half_horn = _mm(snapshot["settings"]["servo_horn_length_mm"]) * 0.5
+    return {"L": _pt(center - right * half_horn), "R": _pt(center + right * half_horn)}
+
+
+def steering_part_specs(snapshot: dict[str, Any]) -> list[PartSpec]:
+    settings = snapshot["settings"]
+    iface = snapshot["iface"]
+    points = snapshot["points"]
+    tips = servo_horn_tips(snapshot)
+    hole_dia_mm = round(iface["hole_m"] * 1000.0, 3)
+
+    specs = []
+    if not snapshot["servo_horn_ref"]:
+        specs.append(
+            _spec(
+                "RC_ServoHorn",
+                "RC_SERVO_HORN_MESH",
+                "servo_horn_dual",
+                "C",
+                "steering",
+                "steering",
+                "servo",
+                {
+                    "origin": _pt(points["servo"]),
+                    "tip_left": tips["L"],
+                    "tip_right": tips["R"],
+                    "axis_dir": _pt(snapshot["servo_axis"]),
+                    "hub_radius": _mm(settings["servo_horn_diameter_mm"]) * 0.5,
+                    "arm_radius": _mm(settings["tie_rod_diameter_mm"]) * 0.6,
+                    "thickness": _mm(5.0),
+                    "segments": settings["segments"],
+                },
+                {
+                    "kind": "SERVO_HORN",
+                    "length_mm": settings["servo_horn_length_mm"],
+                    "hardware": settings["default_hardware"],
+                    "hole_dia_mm": hole_dia_mm,
+                },
+            )
+        )
+
+    terminal_radius = _mm(settings["tie_rod_terminal_diameter_mm"]) * 0.5 + iface["sliding_clearance_m"]
+    for side in snapshot["sides"]:
+        specs.append(
+            _spec(
+                f"RC_TieRod_{side}",
+                f"RC_TIEROD_{side}_MESH",
+                "link",
+                side,
+                "steering",
+                "steering",
+                "chassis",
+                {
+                    "start": tips[side],
+                    "end": _pt(points[f"steering_arm_point_{side.lower()}"]),
+                    "rod_radius": _mm(settings["tie_rod_diameter_mm"]) * 0.5,
+                    "terminal_radius": terminal_radius,
+                    "segments": settings["segments"],
+                },
+                {
+                    "kind": "TIE_ROD",
+                    "hardware": settings["default_hardware"],
+                    "hole_dia_mm": hole_dia_mm,
+                },
+            )
+        )
+    return specs
+
+
+def shock_part_specs(snapshot: dict[str, Any]) -> list[PartSpec]:
+    settings = snapshot["settings"]
+    iface = snapshot["iface"]
+    points = snapshot["points"]
+    stroke = _mm(settings["shock_stroke_mm"])
+    hole_dia_mm = round(iface["hole_m"] * 1000.0, 3)
+
+    specs = []
+    for side in snapshot["sides"]:
+        key = side.lower()
+        if f"shock_top_{key}" not in points or f"shock_bottom_{key}" not in points:
+            continue
+        top = np.asarray(points[f"shock_top_{key}"], dtype=np.float64)
+        bottom = np.asarray(points[f"shock_bottom_{key}"], dtype=np.float64)
+        axis = top - bottom
+        mount_dist = float(np.linalg.norm(axis))
+        if mount_dist <= 1.0e-8:
+            continue
+        axis /= mount_dist
+        body_len = max(mount_dist - stroke, mount_dist * 0.55)
+        body_end = top - axis * body_len
+
+        specs.append(
+            _spec(
+                f"RC_ShockBody_{side}",
+                f"RC_SHOCK_BODY_{side}_MESH",
+                "shock_body",
+                side,
+                "shock",
+                "shocks",
+                "chassis",
+                {
+                    "body_start": _pt(top),
+                    "body_end": _pt(body_end),
+                    "body_radius": _mm(settings["shock_body_diameter_mm"]) * 0.5,
+                    "eye_radius": _mm(settings["shock_eyelet_diameter_mm"]) * 0.5,
+                    "segments": settings["segments"],
+                },
+                {
+                    "kind": "SHOCK_BODY",
+                    "hardware": settings["default_hardware"],
+                    "hole_dia_mm": hole_dia_mm,
+                },
+            )
+        )
+        specs.append(
+            _spec(
+                f"RC_ShockRod_{side}",
+                f"RC_SHOCK_ROD_{side}_MESH",
+                "shock_rod",
+                side,
+                "shock",
+                "shocks",
+                "chassis",
+                {
+                    "rod_start": _pt(bottom),
+                    "rod_end": _pt(body_end),
+                    "rod_radius": _mm(settings["shock_rod_diameter_mm"]) * 0.5,
+                    "eye_radius": _mm(settings["shock_eyelet_diameter_mm"]) * 0.45,
+                    "segments": settings["segments"],
+                },
+                {
+                    "kind": "SHOCK_ROD",
+                    "hardware": settings["default_hardware"],
+                    "stroke_mm": settings["shock_stroke_mm"],
+                },
+            )
+        )
+        if settings["generate_spring"]:
+            specs.append(
+                _spec(
+                    f"RC_Spring_{side}",
+                    f"RC_SPRING_{side}_MESH",
+                    "spring",
+                    side,
+                    "shock",
+                    "shocks",
+                    "chassis",
+                    {
+                        "start": _pt(top - axis * (body_len * 0.12)),
+                        "end": _pt(bottom + axis * (mount_dist * 0.12)),
+                        "outer_diameter": _mm(settings["spring_outer_diameter_mm"]),
+                        "wire_diameter": _mm(settings["spring_wire_diameter_mm"]),
+                        "turns": settings["spring_turns"],
+                        "radial_segments": settings["spring_resolution"],
+                    },
+                    {"kind": "SPRING", "od_mm": settings["spring_outer_diameter_mm"]},
+                )
+            )
+    return specs
+
+
+def all_part_specs(snapshot: dict[str, Any]) -> list[PartSpec]:
+    return suspension_part_specs(snapshot) + steering_part_specs(snapshot) + shock_part_specs(snapshot)
+
+
+def build_part(spec: PartSpec) -> MeshBuffer:
+    return _BUILDERS[spec["builder"]](**spec["args"])
+
+
+def part_hash(spec: PartSpec) -> str:
+    # Builder args already fold in every hardpoint, setting and tolerance the mesh depends on.
+    payload = json.dumps((GEOMETRY_VERSION, spec["builder"], spec["args"]), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
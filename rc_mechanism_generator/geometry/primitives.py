@@ -1,79 +1,228 @@
 from __future__ import annotations
 
 import math
+from collections import OrderedDict
 
-import bmesh
-from mathutils import Matrix, Vector
+import numpy as np
+from numpy.typing import ArrayLike
 
+from .mesh_buffer import MeshBuffer
 
-def _matrix_from_direction(direction: Vector, midpoint: Vector) -> Matrix:
-    quat = direction.normalized().to_track_quat("Z", "Y")
-    matrix = quat.to_matrix().to_4x4()
-    matrix.translation = midpoint
-    return matrix
+
+MeshArrays = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+_TEMPLATE_CACHE_SIZE = 32
+_template_cache: OrderedDict[tuple[str, int], MeshArrays] = OrderedDict()
+
+
+def _empty_arrays() -> MeshArrays:
+    return np.zeros((0, 3)), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+
+
+def _unit_cylinder(segments: int, cap_ends: bool) -> MeshArrays:
+    # Radius 1, depth 1 centered on the origin along +Z (same frame as bmesh.ops.create_cone).
+    ang = np.arange(segments) / segments * math.tau
+    ring = np.column_stack((np.cos(ang), np.sin(ang)))
+    co = np.vstack((np.column_stack((ring, np.full(segments, -0.5))), np.column_stack((ring, np.full(segments, 0.5)))))
+    idx = np.arange(segments, dtype=np.int32)
+    nxt = (idx + 1) % segments
+    loop_chunks = [np.stack((idx, nxt, nxt + segments, idx + segments), axis=-1).reshape(-1)]
+    totals = [np.full(segments, 4, dtype=np.int32)]
+    if cap_ends:
+        loop_chunks.append(idx[::-1])
+        loop_chunks.append(idx + segments)
+        totals.append(np.full(2, segments, dtype=np.int32))
+    return co, np.concatenate(loop_chunks), np.concatenate(totals)
+
+
+def _unit_sphere(u_segments: int, v_segments: int) -> MeshArrays:
+    # Radius 1 UV sphere: (v_segments - 1) rings of u_segments verts, then the two poles.
+    polar = np.arange(1, v_segments) / v_segments * math.pi
+    azimuth = np.arange(u_segments) / u_segments * math.tau
+    ring_r = np.sin(polar)[:, None]
+    co = np.column_stack(
+        (
+            (ring_r * np.cos(azimuth)[None, :]).reshape(-1),
+            (ring_r * np.sin(azimuth)[None, :]).reshape(-1),
+            np.repeat(np.cos(polar), u_segments),
+        )
+    )
+    co = np.vstack((co, ((0.0, 0.0, 1.0), (0.0, 0.0, -1.0))))
+    rings = v_segments - 1
+    top = rings * u_segments
+    bottom = top + 1
+    idx = np.arange(u_segments, dtype=np.int32)
+    nxt = (idx + 1) % u_segments
+    upper = (np.arange(rings - 1, dtype=np.int32) * u_segments)[:, None]
+    quads = np.stack((upper + idx, upper + u_segments + idx, upper + u_segments + nxt, upper + nxt), axis=-1).reshape(-1)
+    last = (rings - 1) * u_segments
+    top_fan = np.stack((np.full(u_segments, top, dtype=np.int32), idx, nxt), axis=-1).reshape(-1)
+    bottom_fan = np.stack((last + idx, np.full(u_segments, bottom, dtype=np.int32), last + nxt), axis=-1).reshape(-1)
+    totals = np.concatenate(
+        (
+            np.full((rings - 1) * u_segments, 4, dtype=np.int32),
+            np.full(u_segments * 2, 3, dtype=np.int32),
+        )
+    )
+    return co, np.concatenate((quads, top_fan, bottom_fan)).astype(np.int32), totals
+
+
+def _unit_box() -> MeshArrays:
+    co = np.array(
+        [(x, y, z) for z in (-0.5, 0.5) for y in (-0.5, 0.5) for x in (-0.5, 0.5)],
+        dtype=np.float64,
+    )
+    loops = np.array(
+        (0, 2, 3, 1, 4, 5, 7, 6, 0, 1, 5, 4, 1, 3, 7, 5, 3, 2, 6, 7, 2, 0, 4, 6),
+        dtype=np.int32,
+    )
+    return co, loops, np.full(6, 4, dtype=np.int32)
+
+
+def _template(kind: str, segments: int) -> MeshArrays:
+    key = (kind, segments)
+    cached = _template_cache.get(key)
+    if cached is not None:
+        _template_cache.move_to_end(key)
+        return cached
+    if kind == "CYLINDER":
+        arrays = _unit_cylinder(segments, cap_ends=True)
+    elif kind == "TUBE":
+        arrays = _unit_cylinder(segments, cap_ends=False)
+    elif kind == "SPHERE":
+        arrays = _unit_sphere(segments, max(6, segments // 2))
+    else:
+        arrays = _unit_box()
+    for array in arrays:
+        array.setflags(write=False)
+    _template_cache[key] = arrays
+    while len(_template_cache) > _TEMPLATE_CACHE_SIZE:
+        _template_cache.popitem(last=False)
+    return arrays
+
+
+def clear_template_cache() -> None:
+    _template_cache.clear()
+
+
+def _basis_from_direction(direction: np.ndarray) -> np.ndarray:
+    # Columns are the local X/Y/Z axes; Z tracks `direction`, Y leans towards world up like to_track_quat("Z", "Y").
+    z_axis = direction / np.linalg.norm(direction)
+    up = np.array((0.0, 0.0, 1.0)) if abs(z_axis[2]) < 0.999 else np.array((0.0, 1.0, 0.0))
+    y_axis = up - z_axis * float(np.dot(up, z_axis))
+    y_axis /= np.linalg.norm(y_axis)
+    x_axis = np.cross(y_axis, z_axis)
+    return np.column_stack((x_axis, y_axis, z_axis))
 
 
 def add_cylinder_between(
-    bm: bmesh.types.BMesh,
-    start: Vector,
-    end: Vector,
+    buffer: MeshBuffer,
+    start: ArrayLike,
+    end: ArrayLike,
     radius: float,
     segments: int = 16,
     cap_ends: bool = True,
 ) -> None:
-    vec = end - start
-    length = vec.length
+    start_co = np.asarray(start, dtype=np.float64)
+    end_co = np.asarray(end, dtype=np.float64)
+    vec = end_co - start_co
+    length = float(np.linalg.norm(vec))
     if length <= 1.0e-8:
         return
-    matrix = _matrix_from_direction(vec, (start + end) * 0.5)
-    bmesh.ops.create_cone(
-        bm,
-        cap_ends=cap_ends,
-        cap_tris=False,
-        segments=max(8, segments),
-        radius1=radius,
-        radius2=radius,
-        depth=length,
-        matrix=matrix,
-    )
+    linear = _basis_from_direction(vec) * np.array((radius, radius, length))
+    template = _template("CYLINDER" if cap_ends else "TUBE", max(8, segments))
+    buffer.append(*template, linear=linear, offset=(start_co + end_co) * 0.5)
 
 
-def add_sphere(bm: bmesh.types.BMesh, center: Vector, radius: float, segments: int = 12) -> None:
-    matrix = Matrix.Translation(center)
-    bmesh.ops.create_uvsphere(
-        bm,
-        u_segments=max(8, segments),
-        v_segments=max(6, segments // 2),
-        radius=radius,
-        matrix=matrix,
-    )
+def add_sphere(buffer: MeshBuffer, center: ArrayLike, radius: float, segments: int = 12) -> None:
+    template = _template("SPHERE", max(8, segments))
+    buffer.append(*template, linear=np.eye(3) * radius, offset=np.asarray(center, dtype=np.float64))
 
 
 def add_box_between(
-    bm: bmesh.types.BMesh,
-    start: Vector,
-    end: Vector,
+    buffer: MeshBuffer,
+    start: ArrayLike,
+    end: ArrayLike,
     width: float,
     height: float,
 ) -> None:
-    vec = end - start
-    length = vec.length
+    start_co = np.asarray(start, dtype=np.float64)
+    end_co = np.asarray(end, dtype=np.float64)
+    vec = end_co - start_co
+    length = float(np.linalg.norm(vec))
     if length <= 1.0e-8:
         return
-    matrix = _matrix_from_direction(vec, (start + end) * 0.5)
-    bmesh.ops.create_cube(bm, size=1.0, matrix=matrix)
-    bmesh.ops.scale(
-        bm,
-        vec=Vector((width, height, length)),
-        verts=bm.verts[-8:],
-        space=Matrix.Identity(4),
+    linear = _basis_from_direction(vec) * np.array((width, height, length))
+    buffer.append(*_template("BOX", 0), linear=linear, offset=(start_co + end_co) * 0.5)
+
+
+def helix_spring_arrays(
+    start: ArrayLike,
+    end: ArrayLike,
+    coil_radius: float,
+    wire_radius: float,
+    turns: float,
+    radial_segments: int,
+    path_steps_per_turn: int = 18,
+    cap_ends: bool = True,
+) -> MeshArrays:
+    start_co = np.asarray(start, dtype=np.float64)
+    axis = np.asarray(end, dtype=np.float64) - start_co
+    length = float(np.linalg.norm(axis))
+    if length <= 1.0e-8:
+        return _empty_arrays()
+    z_axis = axis / length
+    fallback = np.array((0.0, 1.0, 0.0)) if abs(z_axis[2]) > 0.95 else np.array((0.0, 0.0, 1.0))
+    x_axis = np.cross(z_axis, fallback)
+    x_axis /= np.linalg.norm(x_axis)
+    y_axis = np.cross(z_axis, x_axis)
+    y_axis /= np.linalg.norm(y_axis)
+    basis = np.column_stack((x_axis, y_axis, z_axis))
+
+    steps = max(12, int(path_steps_per_turn * turns))
+    t = np.linspace(0.0, 1.0, steps + 1)
+    ang = t * turns * math.tau
+    cos_ang = np.cos(ang)
+    sin_ang = np.sin(ang)
+    sweep = coil_radius * turns * math.tau
+
+    center_local = np.column_stack((cos_ang * coil_radius, sin_ang * coil_radius, t * length))
+    tangent_local = np.column_stack((-sin_ang * sweep, cos_ang * sweep, np.full_like(t, length)))
+    tangent_local /= np.linalg.norm(tangent_local, axis=1)[:, None]
+    tangent = tangent_local @ basis.T
+    normal = np.cross(tangent, z_axis)
+    normal /= np.linalg.norm(normal, axis=1)[:, None]
+    binormal = np.cross(tangent, normal)
+    binormal /= np.linalg.norm(binormal, axis=1)[:, None]
+    centers = start_co + center_local @ basis.T
+
+    ring_ang = np.arange(radial_segments) / radial_segments * math.tau
+    offsets = (
+        np.cos(ring_ang)[None, :, None] * normal[:, None, :]
+        + np.sin(ring_ang)[None, :, None] * binormal[:, None, :]
     )
+    co = (centers[:, None, :] + offsets * wire_radius).reshape(-1, 3)
+
+    ring = np.arange(radial_segments, dtype=np.int32)
+    ring_next = (ring + 1) % radial_segments
+    base = (np.arange(steps, dtype=np.int32) * radial_segments)[:, None]
+    quads = np.stack(
+        (base + ring, base + ring_next, base + radial_segments + ring_next, base + radial_segments + ring),
+        axis=-1,
+    ).reshape(-1)
+    loop_chunks = [quads]
+    totals = [np.full(steps * radial_segments, 4, dtype=np.int32)]
+    if cap_ends:
+        loop_chunks.append(ring[::-1])
+        loop_chunks.append(ring + steps * radial_segments)
+        totals.append(np.full(2, radial_segments, dtype=np.int32))
+    return co, np.concatenate(loop_chunks).astype(np.int32), np.concatenate(totals)
 
 
 def add_helix_spring(
-    bm: bmesh.types.BMesh,
-    start: Vector,
-    end: Vector,
+    buffer: MeshBuffer,
+    start: ArrayLike,
+    end: ArrayLike,
     coil_radius: float,
     wire_radius: float,
     turns: float,
@@ -81,55 +230,15 @@ def add_helix_spring(
     path_steps_per_turn: int = 18,
     cap_ends: bool = True,
 ) -> None:
-    axis = end - start
-    length = axis.length
-    if length <= 1.0e-8:
-        return
-    z_axis = axis.normalized()
-    fallback = Vector((0.0, 1.0, 0.0)) if abs(z_axis.z) > 0.95 else Vector((0.0, 0.0, 1.0))
-    x_axis = z_axis.cross(fallback).normalized()
-    y_axis = z_axis.cross(x_axis).normalized()
-    basis = Matrix((x_axis, y_axis, z_axis)).transposed()
-    steps = max(12, int(path_steps_per_turn * turns))
-    rings: list[list[bmesh.types.BMVert]] = []
-    for i in range(steps + 1):
-        t = i / steps
-        ang = t * turns * math.tau
-        center_local = Vector((math.cos(ang) * coil_radius, math.sin(ang) * coil_radius, t * length))
-        tangent_local = Vector(
-            (
-                -math.sin(ang) * coil_radius * turns * math.tau,
-                math.cos(ang) * coil_radius * turns * math.tau,
-                length,
-            )
-        ).normalized()
-        tangent = basis @ tangent_local
-        normal = tangent.cross(z_axis).normalized()
-        binormal = tangent.cross(normal).normalized()
-        center_world = start + (basis @ center_local)
-        ring = []
-        for j in range(radial_segments):
-            a = j / radial_segments * math.tau
-            p = center_world + (math.cos(a) * normal + math.sin(a) * binormal) * wire_radius
-            ring.append(bm.verts.new(p))
-        rings.append(ring)
-    bm.verts.ensure_lookup_table()
-    for i in range(len(rings) - 1):
-        r1 = rings[i]
-        r2 = rings[i + 1]
-        for j in range(radial_segments):
-            n = (j + 1) % radial_segments
-            face_verts = (r1[j], r1[n], r2[n], r2[j])
-            try:
-                bm.faces.new(face_verts)
-            except ValueError:
-                pass
-    if cap_ends and rings:
-        try:
-            bm.faces.new(tuple(reversed(rings[0])))
-        except ValueError:
-            pass
-        try:
-            bm.faces.new(tuple(rings[-1]))
-        except ValueError:
-            pass
+    buffer.append(
+        *helix_spring_arrays(
+            start,
+            end,
+            coil_radius,
+            wire_radius,
+            turns,
+            radial_segments,
+            path_steps_per_turn=path_steps_per_turn,
+            cap_ends=cap_ends,
+        )
+    )
@@ -8,34 +8,65 @@ import queue
 import shlex
 import subprocess
 import threading
+import time
+from collections.abc import Callable, Iterator
 from datetime import datetime
+from functools import partial
+from typing import cast
 from urllib import error as urlerror
 from urllib import request as urlrequest
 
 import bmesh
 import bpy
+import numpy as np
 from bpy.props import StringProperty
 from mathutils import Matrix, Vector
 
-from .dfm import interface_specs, run_printability_checks
+from .dfm import combine_mass_properties, euler_xyz_matrix, format_dfm_timings, interface_specs, run_printability_checks
+from .export import (
+    ExportJob,
+    ExportTask,
+    ThreeMFItem,
+    active_export_job,
+    atomic_path,
+    evaluated_world_triangles,
+    is_unchanged,
+    mesh_digest,
+    previous_exports,
+    set_active_export_job,
+    shutdown_export_job,
+    write_3mf,
+    write_binary_stl,
+)
 from .geometry import (
-    build_knuckle_mesh,
-    build_link_mesh,
-    build_servo_horn_dual_mesh,
-    build_shock_body_mesh,
-    build_shock_rod_mesh,
-    build_spring_mesh,
-    build_wishbone_mesh,
+    LOD_FULL,
+    LOD_PREVIEW,
+    MeshBuffer,
+    PartSpec,
+    build_parts,
+    clear_full_cache,
+    default_worker_count,
+    full_resolution_buffers,
+    lod_settings,
+    part_hash,
+    part_module,
+    remember_full_buffer,
+    shock_part_specs,
+    shutdown_executor,
+    steering_part_specs,
+    suspension_part_specs,
 )
+from .tracking import dirty_parts, live_mode_active, mark_clean, set_live_mode, sync_baseline
 from .utils import (
-    bbox_intersects,
     chassis_axes,
     delete_object_if_exists,
     ensure_collection_path,
     ensure_dir,
     ensure_empty,
-    ensure_mesh_object,
+    ensure_mesh_object_from_buffer,
+    find_interferences,
     list_generated_mesh_objects,
+    mesh_from_buffer,
     missing_required_hardpoints,
     missing_required_references,
     mm_to_m,
@@ -43,13 +74,14 @@ from .utils import (
     parent_keep_world,
     parse_metadata_params,
     point_inside_bbox_world,
+    property_group_values,
     set_metadata,
     tire_dimensions_local,
     validate_scene_for_shocks,
     validate_scene_for_steering,
     validate_scene_for_suspension,
 )
-from .utils.constants import SIDES
+from .utils.constants import MANDATORY_HARDPOINT_TEMPLATES, SIDES
 from .utils.math_utils import axis_vector_from_enum, lerp, midpoint, side_sign
 
 _AUTO_REF_NAME_MAP = {
@@ -451,26 +483,6 @@ def _get_rear_axle_reference(scene: bpy.types.Scene) -> Vector:
     return front_center - forward * mm_to_m(settings.wheelbase_mm)
 
 
-def _select_only(context: bpy.types.Context, obj: bpy.types.Object) -> tuple[list[bpy.types.Object], bpy.types.Object | None]:
-    prev_selected = list(context.selected_objects)
-    prev_active = context.view_layer.objects.active
-    for item in prev_selected:
-        item.select_set(False)
-    obj.select_set(True)
-    context.view_layer.objects.active = obj
-    return prev_selected, prev_active
-
-
-def _restore_selection(context: bpy.types.Context, selected: list[bpy.types.Object], active: bpy.types.Object | None) -> None:
-    for obj in context.selected_objects:
-        obj.select_set(False)
-    for obj in selected:
-        if obj.name in bpy.data.objects:
-            obj.select_set(True)
-    if active is not None and active.name in bpy.data.objects:
-        context.view_layer.objects.active = active
-
-
 def _norm_name(value: str) -> str:
     return "".join(ch for ch in value.lower() if ch.isalnum() or ch == "_")
 
@@ -558,10 +570,13 @@ def _autofill_refs_and_hardpoints(
     return assigned, missing
 
 
-def infer_shock_mounts(scene: bpy.types.Scene, force_rebuild: bool = False) -> tuple[dict[str, tuple[Vector, Vector]], list[str]]:
+def infer_shock_mounts(
+    scene: bpy.types.Scene,
+    force_rebuild: bool = False,
+    place_empties: bool = True,
+) -> tuple[dict[str, tuple[Vector, Vector]], list[str]]:
     refs = scene.rcgen_refs
     settings = scene.rcgen_settings
-    collections = _ensure_collections(scene)
     right, forward, up = chassis_axes(refs.chassis_obj)
     warnings: list[str] = []
     result: dict[str, tuple[Vector, Vector]] = {}
@@ -607,6 +622,11 @@ def infer_shock_mounts(scene: bpy.types.Scene, force_rebuild: bool = False) -> t
             if iter_limit == 0:
                 warnings.append(f"RC_ShockTop_{side}: wheel well escape did not converge (bbox).")
 
+        result[side] = (top, bottom)
+        if not place_empties:
+            continue
+
+        collections = _ensure_collections(scene)
         top_name = f"RC_ShockTop_{side}"
         bottom_name = f"RC_ShockBottom_{side}"
         if force_rebuild:
@@ -617,7 +637,6 @@ def infer_shock_mounts(scene: bpy.types.Scene, force_rebuild: bool = False) -> t
         bottom_empty = ensure_empty(scene, bottom_name, bottom, collections["debug"], size=mm_to_m(10.0))
         set_metadata(top_empty, settings.rcgen_id, side, "shock", {"kind": "SHOCK_TOP_INFERRED"})
         set_metadata(bottom_empty, settings.rcgen_id, side, "shock", {"kind": "SHOCK_BOTTOM_INFERRED"})
-        result[side] = (top, bottom)
 
     return result, warnings
 
@@ -643,174 +662,155 @@ def _effective_shock_mounts(scene: bpy.types.Scene, inferred: dict[str, tuple[Ve
     return result, warnings
 
 
-def _write_obj(name: str, mesh: bpy.types.Mesh, collection: bpy.types.Collection, parent: bpy.types.Object | None, rcgen_id: str, side: str, module: str, params: dict) -> bpy.types.Object:
-    obj = ensure_mesh_object(name, mesh, collection)
+def _write_obj(
+    name: str,
+    mesh_name: str,
+    buffer: MeshBuffer | None,
+    collection: bpy.types.Collection,
+    parent: bpy.types.Object | None,
+    rcgen_id: str,
+    side: str,
+    module: str,
+    params: dict,
+    content_hash: str = "",
+    lod: str = "",
+) -> bpy.types.Object:
+    # buffer=None keeps the cached datablock of an existing object and only refreshes placement/metadata.
+    if buffer is not None:
+        obj = ensure_mesh_object_from_buffer(name, mesh_name, buffer, collection)
+    else:
+        obj = bpy.data.objects[name]
     obj.matrix_world = Matrix.Identity(4)
     if parent is not None:
         parent_keep_world(obj, parent)
-    set_metadata(obj, rcgen_id=rcgen_id, side=side, module=module, params=params)
+    set_metadata(obj, rcgen_id=rcgen_id, side=side, module=module, params=params, content_hash=content_hash, lod=lod)
     return obj
 
-def _generate_suspension(scene: bpy.types.Scene, operator: bpy.types.Operator) -> bool:
-    ok, errors = validate_scene_for_suspension(scene)
-    if not ok:
-        for err in errors:
-            operator.report({"ERROR"}, err)
-        return False
 
+def _reusable_part(spec: PartSpec, content_hash: str) -> bool:
+    obj = bpy.data.objects.get(spec["name"])
+    return obj is not None and obj.type == "MESH" and obj.get("rcgen_hash") == content_hash and len(obj.data.polygons) > 0
+
+
+def _viewport_lod(settings: bpy.types.PropertyGroup) -> str:
+    return LOD_PREVIEW if settings.use_preview_lod else LOD_FULL
+
+
+def _generation_snapshot(scene: bpy.types.Scene, mounts: dict[str, tuple[Vector, Vector]] | None = None, lod: str = LOD_FULL) -> dict:
     refs = scene.rcgen_refs
     settings = scene.rcgen_settings
-    tol = scene.rcgen_tolerances
-    cols = _ensure_collections(scene)
+    right, forward, up = chassis_axes(refs.chassis_obj)
+    points: dict[str, tuple[float, float, float]] = {}
+    for side in SIDES:
+        for template in MANDATORY_HARDPOINT_TEMPLATES:
+            key = template.format(side=side.lower())
+            loc = _loc(getattr(refs, key, None))
+            if loc is not None:
+                points[key] = tuple(loc)
+        points[f"wheel_center_{side.lower()}"] = tuple(object_center(refs, side))
+    for side, (top, bottom) in (mounts or {}).items():
+        points[f"shock_top_{side.lower()}"] = tuple(top)
+        points[f"shock_bottom_{side.lower()}"] = tuple(bottom)
+    points["servo"] = tuple(refs.servo_obj.matrix_world.translation)
+    servo_axis = (refs.servo_obj.matrix_world.to_3x3() @ axis_vector_from_enum(settings.servo_axis)).normalized()
+    return {
+        "rcgen_id": settings.rcgen_id,
+        "sides": SIDES,
+        "settings": lod_settings(property_group_values(settings), lod),
+        "iface": interface_specs(settings, scene.rcgen_tolerances),
+        "points": points,
+        "axes": {"right": tuple(right), "forward": tuple(forward), "up": tuple(up)},
+        "servo_axis": tuple(servo_axis),
+        "uprights": {side: getattr(refs, f"upright_{side.lower()}_obj", None) is not None for side in SIDES},
+        "servo_horn_ref": refs.servo_horn_obj is not None,
+    }
 
-    iface = interface_specs(settings, tol)
-    rod_radius = max(mm_to_m(settings.arm_rod_diameter_mm) * 0.5, mm_to_m(settings.min_wall_mm) * 0.5)
-    bushing_radius = mm_to_m(settings.arm_bushing_diameter_mm) * 0.5 + iface["sliding_clearance_m"]
 
-    warnings = []
-    for side in SIDES:
-        lca_mesh = build_wishbone_mesh(
-            f"RC_LCA_{side}_MESH",
-            _hp_loc(refs, "lca_in_front", side),
-            _hp_loc(refs, "lca_in_rear", side),
-            _hp_loc(refs, "lca_out", side),
-            rod_radius=rod_radius,
-            bushing_radius=bushing_radius,
-            segments=settings.segments,
-            add_rib=settings.add_ribs,
-            section=settings.arm_section,
-        )
-        lca_obj = _write_obj(
-            f"RC_LCA_{side}",
-            lca_mesh,
-            cols["front"],
-            refs.chassis_obj,
+def _apply_part_specs(
+    scene: bpy.types.Scene,
+    specs: list[PartSpec],
+    hashes: dict[str, str],
+    buffers: dict[str, MeshBuffer],
+    lod: str,
+) -> dict[str, bpy.types.Object]:
+    refs = scene.rcgen_refs
+    settings = scene.rcgen_settings
+    cols = _ensure_collections(scene)
+    written = {}
+    for spec in specs:
+        written[spec["name"]] = _write_obj(
+            spec["name"],
+            spec["mesh_name"],
+            buffers.get(spec["name"]),
+            cols[spec["collection"]],
+            getattr(refs, f"{spec['parent']}_obj", None),
             settings.rcgen_id,
-            side,
-            "suspension",
-            {
-                "kind": "LCA",
-                "hardware": settings.default_hardware,
-                "hole_dia_mm": round(iface["hole_m"] * 1000.0, 3),
-                "arm_section": settings.arm_section,
-            },
+            spec["side"],
+            spec["module"],
+            spec["params"],
+            hashes[spec["name"]],
+            lod,
         )
+    return written
 
-        uca_mesh = build_wishbone_mesh(
-            f"RC_UCA_{side}_MESH",
-            _hp_loc(refs, "uca_in_front", side),
-            _hp_loc(refs, "uca_in_rear", side),
-            _hp_loc(refs, "uca_out", side),
-            rod_radius=rod_radius * 0.9,
-            bushing_radius=bushing_radius * 0.9,
-            segments=settings.segments,
-            add_rib=settings.add_ribs,
-            section=settings.arm_section,
-        )
-        uca_obj = _write_obj(
-            f"RC_UCA_{side}",
-            uca_mesh,
-            cols["front"],
-            refs.chassis_obj,
-            settings.rcgen_id,
-            side,
-            "suspension",
-            {
-                "kind": "UCA",
-                "hardware": settings.default_hardware,
-                "hole_dia_mm": round(iface["hole_m"] * 1000.0, 3),
-                "arm_section": settings.arm_section,
-            },
-        )
 
-        upright = getattr(refs, f"upright_{side.lower()}_obj", None)
-        knuckle_obj = None
-        if upright is None and settings.generate_knuckle_when_missing:
-            center = object_center(refs, side)
-            knuckle_mesh = build_knuckle_mesh(
-                f"RC_KNUCKLE_{side}_MESH",
-                center=center,
-                lca_out=_hp_loc(refs, "lca_out", side),
-                uca_out=_hp_loc(refs, "uca_out", side),
-                steering_point=_hp_loc(refs, "steering_arm_point", side),
-                core_radius=mm_to_m(7.0),
-                arm_radius=mm_to_m(3.0),
-                segments=settings.segments,
-            )
-            knuckle_obj = _write_obj(
-                f"RC_Knuckle_{side}",
-                knuckle_mesh,
-                cols["front"],
-                refs.chassis_obj,
-                settings.rcgen_id,
-                side,
-                "suspension",
-                {"kind": "KNUCKLE", "hardware": settings.default_hardware},
-            )
+def _wheelwell_hits(refs: bpy.types.PropertyGroup, side: str, objects: list[bpy.types.Object | None]) -> set[str]:
+    wheelwell = getattr(refs, f"wheelwell_{side.lower()}_obj", None)
+    parts = [obj for obj in objects if obj is not None]
+    if wheelwell is None or not parts:
+        return set()
+    return {a.name for a, _, _ in find_interferences(parts, [wheelwell], check_object_pairs=False)}
+
+
+def _plan_suspension(scene: bpy.types.Scene, operator: bpy.types.Operator, lod: str) -> list[PartSpec] | None:
+    ok, errors = validate_scene_for_suspension(scene)
+    if not ok:
+        for err in errors:
+            operator.report({"ERROR"}, err)
+        return None
+    return suspension_part_specs(_generation_snapshot(scene, lod=lod))
 
-        wheelwell = getattr(refs, f"wheelwell_{side.lower()}_obj", None)
-        if wheelwell is not None:
-            if bbox_intersects(lca_obj, wheelwell):
-                warnings.append(f"{side}: LCA intersects WheelWell (bbox).")
-            if bbox_intersects(uca_obj, wheelwell):
-                warnings.append(f"{side}: UCA intersects WheelWell (bbox).")
-            if knuckle_obj is not None and bbox_intersects(knuckle_obj, wheelwell):
-                warnings.append(f"{side}: Knuckle intersects WheelWell (bbox).")
+
+def _report_suspension(scene: bpy.types.Scene, operator: bpy.types.Operator, written: dict[str, bpy.types.Object]) -> None:
+    refs = scene.rcgen_refs
+    warnings = []
+    for side in SIDES:
+        labels = (("LCA", f"RC_LCA_{side}"), ("UCA", f"RC_UCA_{side}"), ("Knuckle", f"RC_Knuckle_{side}"))
+        hits = _wheelwell_hits(refs, side, [written.get(name) for _, name in labels])
+        for label, name in labels:
+            if name in hits:
+                warnings.append(f"{side}: {label} intersects WheelWell (mesh).")
 
     _warn_report(operator, warnings)
     operator.report({"INFO"}, "Suspension generated/updated.")
-    return True
 
 
-def _generate_steering(scene: bpy.types.Scene, operator: bpy.types.Operator) -> bool:
+def _plan_steering(scene: bpy.types.Scene, operator: bpy.types.Operator, lod: str) -> list[PartSpec] | None:
     ok, errors = validate_scene_for_steering(scene)
     if not ok:
         for err in errors:
             operator.report({"ERROR"}, err)
-        return False
+        return None
 
-    refs = scene.rcgen_refs
     settings = scene.rcgen_settings
-    tol = scene.rcgen_tolerances
-    cols = _ensure_collections(scene)
+    snapshot = _generation_snapshot(scene, lod=lod)
+    specs = steering_part_specs(snapshot)
 
-    right, _, _ = chassis_axes(refs.chassis_obj)
-    half_horn = mm_to_m(settings.servo_horn_length_mm) * 0.5
-    horn_center = refs.servo_obj.matrix_world.translation.copy()
-    horn_left = horn_center - right * half_horn
-    horn_right = horn_center + right * half_horn
-    servo_axis = (refs.servo_obj.matrix_world.to_3x3() @ axis_vector_from_enum(settings.servo_axis)).normalized()
+    min_len = mm_to_m(settings.steering_min_length_mm)
+    for spec in specs:
+        if spec["builder"] != "link":
+            continue
+        dist = (Vector(spec["args"]["end"]) - Vector(spec["args"]["start"])).length
+        if dist < max(min_len, spec["args"]["terminal_radius"] * 2.0):
+            operator.report({"ERROR"}, f"Tie rod {spec['side']} impossible: insufficient length.")
+            return None
+    return specs
 
-    iface = interface_specs(settings, tol)
-
-    if refs.servo_horn_obj is None:
-        horn_mesh = build_servo_horn_dual_mesh(
-            "RC_SERVO_HORN_MESH",
-            origin=horn_center,
-            tip_left=horn_left,
-            tip_right=horn_right,
-            axis_dir=servo_axis,
-            hub_radius=mm_to_m(settings.servo_horn_diameter_mm) * 0.5,
-            arm_radius=mm_to_m(settings.tie_rod_diameter_mm) * 0.6,
-            thickness=mm_to_m(5.0),
-            segments=settings.segments,
-        )
-        _write_obj(
-            "RC_ServoHorn",
-            horn_mesh,
-            cols["steering"],
-            refs.servo_obj,
-            settings.rcgen_id,
-            "C",
-            "steering",
-            {
-                "kind": "SERVO_HORN",
-                "length_mm": settings.servo_horn_length_mm,
-                "hardware": settings.default_hardware,
-                "hole_dia_mm": round(iface["hole_m"] * 1000.0, 3),
-            },
-        )
-    else:
+
+def _report_steering(scene: bpy.types.Scene, operator: bpy.types.Operator, written: dict[str, bpy.types.Object]) -> None:
+    refs = scene.rcgen_refs
+    settings = scene.rcgen_settings
+    if refs.servo_horn_obj is not None:
         delete_object_if_exists("RC_ServoHorn")
 
     rear_ref = _get_rear_axle_reference(scene)
@@ -818,41 +818,8 @@ def _generate_steering(scene: bpy.types.Scene, operator: bpy.types.Operator) ->
 
     for side in SIDES:
         steering_target = _hp_loc(refs, "steering_arm_point", side)
-        start = horn_left if side == "L" else horn_right
-        dist = (steering_target - start).length
-        min_len = mm_to_m(settings.steering_min_length_mm)
-        terminal_radius = mm_to_m(settings.tie_rod_terminal_diameter_mm) * 0.5 + iface["sliding_clearance_m"]
-
-        if dist < max(min_len, terminal_radius * 2.0):
-            operator.report({"ERROR"}, f"Tie rod {side} impossible: insufficient length.")
-            return False
-
-        mesh = build_link_mesh(
-            f"RC_TIEROD_{side}_MESH",
-            start=start,
-            end=steering_target,
-            rod_radius=mm_to_m(settings.tie_rod_diameter_mm) * 0.5,
-            terminal_radius=terminal_radius,
-            segments=settings.segments,
-        )
-        tie_obj = _write_obj(
-            f"RC_TieRod_{side}",
-            mesh,
-            cols["steering"],
-            refs.chassis_obj,
-            settings.rcgen_id,
-            side,
-            "steering",
-            {
-                "kind": "TIE_ROD",
-                "hardware": settings.default_hardware,
-                "hole_dia_mm": round(iface["hole_m"] * 1000.0, 3),
-            },
-        )
-
-        wheelwell = getattr(refs, f"wheelwell_{side.lower()}_obj", None)
-        if wheelwell is not None and bbox_intersects(tie_obj, wheelwell):
-            warnings.append(f"{side}: Tie rod intersects WheelWell (bbox).")
+        if _wheelwell_hits(refs, side, [written.get(f"RC_TieRod_{side}")]):
+            warnings.append(f"{side}: Tie rod intersects WheelWell (mesh).")
 
         wheel_center = object_center(refs, side)
         steer_vec = steering_target - wheel_center
@@ -873,23 +840,24 @@ def _generate_steering(scene: bpy.types.Scene, operator: bpy.types.Operator) ->
 
     _warn_report(operator, warnings)
     operator.report({"INFO"}, "Steering generated/updated.")
-    return True
 
-def _generate_shocks(scene: bpy.types.Scene, operator: bpy.types.Operator) -> bool:
+
+def _plan_shocks(
+    scene: bpy.types.Scene,
+    operator: bpy.types.Operator,
+    lod: str,
+    place_mounts: bool = True,
+) -> list[PartSpec] | None:
     ok, errors, base_warnings = validate_scene_for_shocks(scene)
     if not ok:
         for err in errors:
             operator.report({"ERROR"}, err)
-        return False
+        return None
 
     _warn_report(operator, base_warnings)
-    refs = scene.rcgen_refs
     settings = scene.rcgen_settings
-    tol = scene.rcgen_tolerances
-    cols = _ensure_collections(scene)
 
-    iface = interface_specs(settings, tol)
-    inferred, infer_warnings = infer_shock_mounts(scene, force_rebuild=False)
+    inferred, infer_warnings = infer_shock_mounts(scene, force_rebuild=False, place_empties=place_mounts)
     _warn_report(operator, infer_warnings)
     mounts, mount_warnings = _effective_shock_mounts(scene, inferred)
     _warn_report(operator, mount_warnings)
@@ -898,115 +866,107 @@ def _generate_shocks(scene: bpy.types.Scene, operator: bpy.types.Operator) -> bo
     stroke = mm_to_m(settings.shock_stroke_mm)
     if stroke > total_length:
         operator.report({"ERROR"}, "Shock stroke larger than total length.")
-        return False
+        return None
 
-    warnings = []
     for side in SIDES:
         if side not in mounts:
             operator.report({"ERROR"}, f"Shock mounts missing for side {side}.")
-            return False
-
+            return None
         top, bottom = mounts[side]
-        axis = top - bottom
-        mount_dist = axis.length
-        if mount_dist <= 1.0e-8:
+        if (top - bottom).length <= 1.0e-8:
             operator.report({"ERROR"}, f"Shock mounts coincide on side {side}.")
-            return False
+            return None
 
-        axis.normalize()
-        body_len = max(mount_dist - stroke, mount_dist * 0.55)
-        body_start = top
-        body_end = top - axis * body_len
-        rod_start = bottom
-        rod_end = body_end
-
-        body_mesh = build_shock_body_mesh(
-            f"RC_SHOCK_BODY_{side}_MESH",
-            body_start=body_start,
-            body_end=body_end,
-            body_radius=mm_to_m(settings.shock_body_diameter_mm) * 0.5,
-            eye_radius=mm_to_m(settings.shock_eyelet_diameter_mm) * 0.5,
-            segments=settings.segments,
-        )
-        body_obj = _write_obj(
-            f"RC_ShockBody_{side}",
-            body_mesh,
-            cols["shocks"],
-            refs.chassis_obj,
-            settings.rcgen_id,
-            side,
-            "shock",
-            {
-                "kind": "SHOCK_BODY",
-                "hardware": settings.default_hardware,
-                "hole_dia_mm": round(iface["hole_m"] * 1000.0, 3),
-            },
-        )
+    return shock_part_specs(_generation_snapshot(scene, mounts, lod))
 
-        rod_mesh = build_shock_rod_mesh(
-            f"RC_SHOCK_ROD_{side}_MESH",
-            rod_start=rod_start,
-            rod_end=rod_end,
-            rod_radius=mm_to_m(settings.shock_rod_diameter_mm) * 0.5,
-            eye_radius=mm_to_m(settings.shock_eyelet_diameter_mm) * 0.45,
-            segments=settings.segments,
-        )
-        rod_obj = _write_obj(
-            f"RC_ShockRod_{side}",
-            rod_mesh,
-            cols["shocks"],
-            refs.chassis_obj,
-            settings.rcgen_id,
-            side,
-            "shock",
-            {
-                "kind": "SHOCK_ROD",
-                "hardware": settings.default_hardware,
-                "stroke_mm": settings.shock_stroke_mm,
-            },
-        )
 
-        spring_obj = None
-        if settings.generate_spring:
-            spring_start = top - axis * (body_len * 0.12)
-            spring_end = bottom + axis * (mount_dist * 0.12)
-            spring_mesh = build_spring_mesh(
-                f"RC_SPRING_{side}_MESH",
-                start=spring_start,
-                end=spring_end,
-                outer_diameter=mm_to_m(settings.spring_outer_diameter_mm),
-                wire_diameter=mm_to_m(settings.spring_wire_diameter_mm),
-                turns=settings.spring_turns,
-                radial_segments=settings.spring_resolution,
-            )
-            spring_obj = _write_obj(
-                f"RC_Spring_{side}",
-                spring_mesh,
-                cols["shocks"],
-                refs.chassis_obj,
-                settings.rcgen_id,
-                side,
-                "shock",
-                {"kind": "SPRING", "od_mm": settings.spring_outer_diameter_mm},
-            )
-        else:
+def _report_shocks(scene: bpy.types.Scene, operator: bpy.types.Operator, written: dict[str, bpy.types.Object]) -> None:
+    refs = scene.rcgen_refs
+    settings = scene.rcgen_settings
+    if not settings.generate_spring:
+        for side in SIDES:
             delete_object_if_exists(f"RC_Spring_{side}")
 
+    warnings = []
+    for side in SIDES:
         if settings.spring_outer_diameter_mm <= settings.shock_body_diameter_mm:
             warnings.append(f"{side}: spring may collide with body (OD <= body dia).")
 
-        wheelwell = getattr(refs, f"wheelwell_{side.lower()}_obj", None)
-        if wheelwell is not None:
-            if bbox_intersects(body_obj, wheelwell) or bbox_intersects(rod_obj, wheelwell):
-                warnings.append(f"{side}: shock intersects WheelWell (bbox).")
-            if spring_obj is not None and bbox_intersects(spring_obj, wheelwell):
-                warnings.append(f"{side}: spring intersects WheelWell (bbox).")
+        hits = _wheelwell_hits(
+            refs,
+            side,
+            [written.get(f"RC_ShockBody_{side}"), written.get(f"RC_ShockRod_{side}"), written.get(f"RC_Spring_{side}")],
+        )
+        if hits & {f"RC_ShockBody_{side}", f"RC_ShockRod_{side}"}:
+            warnings.append(f"{side}: shock intersects WheelWell (mesh).")
+        if f"RC_Spring_{side}" in hits:
+            warnings.append(f"{side}: spring intersects WheelWell (mesh).")
 
     _warn_report(operator, warnings)
     operator.report({"INFO"}, "Shock/spring generated/updated.")
+
+
+_GENERATION_STEPS = {
+    "suspension": (_plan_suspension, _report_suspension),
+    "steering": (_plan_steering, _report_steering),
+    "shocks": (_plan_shocks, _report_shocks),
+}
+_ALL_MODULES = tuple(_GENERATION_STEPS)
+
+
+def _generate_modules(
+    scene: bpy.types.Scene,
+    operator: bpy.types.Operator,
+    modules: tuple[str, ...],
+    force: bool = False,
+    only: set[str] | None = None,
+) -> bool:
+    # Plan every module first so all part geometry can be built in one batch (optionally in a
+    # process pool); only the datablock upload and the scene checks run on the main thread.
+    settings = scene.rcgen_settings
+    lod = _viewport_lod(settings)
+    plans = []
+    for module in modules:
+        plan, report = _GENERATION_STEPS[module]
+        specs = plan(scene, operator, lod)
+        if specs is None:
+            return False
+        if only is not None:
+            specs = [spec for spec in specs if spec["name"] in only]
+        plans.append((specs, report))
+
+    all_specs = [spec for specs, _ in plans for spec in specs]
+    hashes = {spec["name"]: part_hash(spec) for spec in all_specs}
+    stale = all_specs if force else [spec for spec in all_specs if not _reusable_part(spec, hashes[spec["name"]])]
+    workers = settings.parallel_workers if settings.parallel_generation else 1
+    buffers, fallback = build_parts(stale, workers, settings.parallel_min_parts)
+    if fallback:
+        operator.report({"WARNING"}, fallback)
+    built = {spec["name"]: buffer for spec, buffer in zip(stale, buffers)}
+    if lod == LOD_FULL:
+        for spec, buffer in zip(stale, buffers):
+            remember_full_buffer(hashes[spec["name"]], buffer)
+
+    for specs, report in plans:
+        written = _apply_part_specs(scene, specs, hashes, built, lod)
+        report(scene, operator, written)
+    mark_clean(scene, modules)
+    operator.report({"INFO"}, f"Parts rebuilt: {len(stale)}, reused: {len(all_specs) - len(stale)}.")
     return True
 
 
+def _generate_suspension(scene: bpy.types.Scene, operator: bpy.types.Operator, force: bool = False) -> bool:
+    return _generate_modules(scene, operator, ("suspension",), force)
+
+
+def _generate_steering(scene: bpy.types.Scene, operator: bpy.types.Operator, force: bool = False) -> bool:
+    return _generate_modules(scene, operator, ("steering",), force)
+
+
+def _generate_shocks(scene: bpy.types.Scene, operator: bpy.types.Operator, force: bool = False) -> bool:
+    return _generate_modules(scene, operator, ("shocks",), force)
+
+
 def _hardware_bom(objects: list[bpy.types.Object], default_hw: str) -> dict[str, int]:
     counts: dict[str, int] = {f"Screw_{default_hw}": 0, f"Nut_{default_hw}": 0, f"Insert_{default_hw}": 0}
     for obj in objects:
@@ -1289,37 +1249,262 @@ def _split_object_for_export(
     return [part_a, part_b], pin_objs, warnings
 
 
-def _export_selected_stl(filepath: str) -> tuple[bool, str]:
-    try:
-        bpy.ops.export_mesh.stl(filepath=filepath, use_selection=True, check_existing=False, ascii=False)
-        return True, ""
-    except Exception:
-        pass
-    try:
-        bpy.ops.wm.stl_export(filepath=filepath, export_selected_objects=True, check_existing=False)
-        return True, ""
-    except Exception as exc:
-        return False, str(exc)
+def _plan_module_quietly(scene: bpy.types.Scene, reporter: _QuietReporter, module: str, lod: str) -> list[PartSpec] | None:
+    if module == "shocks":
+        return _plan_shocks(scene, reporter, lod, place_mounts=False)
+    plan, _ = _GENERATION_STEPS[module]
+    return plan(scene, reporter, lod)
 
 
-def _write_manufacturing_pack(context: bpy.types.Context, scene: bpy.types.Scene, operator: bpy.types.Operator) -> bool:
+def _swap_in_full_lod(
+    scene: bpy.types.Scene,
+    operator: bpy.types.Operator,
+    objects: list[bpy.types.Object],
+) -> list[tuple[bpy.types.Object, bpy.types.Mesh]] | None:
+    # Returns None (export aborted) when a preview part no longer matches the scene: the full
+    # mesh is re-planned from the current scene, so a stale part would export unseen geometry.
+    preview = {obj.name: obj for obj in objects if obj.get("rcgen_lod") == LOD_PREVIEW}
+    specs: list[PartSpec] = []
+    stale: list[str] = []
+    for module in _ALL_MODULES:
+        names = {name for name in preview if part_module(name) == module}
+        if not names:
+            continue
+        # Re-plan silently and without placing the inferred shock mount empties: export must not
+        # touch the scene or repeat the warnings already shown when the parts were generated.
+        reporter = _QuietReporter()
+        preview_specs = _plan_module_quietly(scene, reporter, module, LOD_PREVIEW)
+        module_specs = _plan_module_quietly(scene, reporter, module, LOD_FULL)
+        if preview_specs is None or module_specs is None:
+            detail = f" ({reporter.errors[0]})" if reporter.errors else ""
+            operator.report({"ERROR"}, f"{module}: cannot plan full resolution parts{detail}.")
+            return None
+        current = {spec["name"]: part_hash(spec) for spec in preview_specs}
+        stale.extend(sorted(name for name in names if current.get(name) != preview[name].get("rcgen_hash")))
+        specs.extend(spec for spec in module_specs if spec["name"] in names)
+    if stale:
+        operator.report({"ERROR"}, f"Scene out of date ({', '.join(stale)}); run Update before exporting.")
+        return None
+    if not specs:
+        return []
+
     settings = scene.rcgen_settings
-    tol = scene.rcgen_tolerances
+    workers = settings.parallel_workers if settings.parallel_generation else 1
+    buffers, fallback = full_resolution_buffers(specs, workers, settings.parallel_min_parts)
+    if fallback:
+        operator.report({"WARNING"}, fallback)
+    swapped = []
+    for spec, buffer in zip(specs, buffers):
+        obj = preview[spec["name"]]
+        swapped.append((obj, obj.data))
+        obj.data = mesh_from_buffer(f"{spec['mesh_name']}_FULL", buffer)
+    return swapped
 
-    out_dir = ensure_dir(bpy.path.abspath(settings.export_dir))
-    set_dir = ensure_dir(os.path.join(out_dir, settings.rcgen_id))
 
+def _restore_preview_lod(swapped: list[tuple[bpy.types.Object, bpy.types.Mesh]]) -> None:
+    for obj, preview_mesh in swapped:
+        full_mesh = obj.data
+        obj.data = preview_mesh
+        if full_mesh.users == 0:
+            bpy.data.meshes.remove(full_mesh)
+
+
+_EXPORT_POLL_S = 0.1
+
+
+def _write_manufacturing_pack(context: bpy.types.Context, scene: bpy.types.Scene, operator: bpy.types.Operator) -> bool:
+    if active_export_job() is not None:
+        operator.report({"ERROR"}, "A manufacturing pack export is already running.")
+        return False
+    settings = scene.rcgen_settings
     objects = list_generated_mesh_objects(scene, settings.rcgen_id)
     if not objects:
         operator.report({"ERROR"}, "No generated RC objects found for export.")
         return False
 
-    errors, warnings, orientations = run_printability_checks(scene)
+    # Viewport parts may hold preview meshes; DFM and files always use full resolution.
+    swapped = _swap_in_full_lod(scene, operator, objects)
+    if swapped is None:
+        return False
+    try:
+        job = _prepare_manufacturing_job(context, scene, operator, objects)
+    finally:
+        _restore_preview_lod(swapped)
+    if job is None:
+        return False
+
+    job.start()
+    if bpy.app.background:
+        job.wait()
+        level, message = _export_job_outcome(job)
+        set_active_export_job(None, message)
+        operator.report({level}, message)
+        return level != "ERROR"
+    set_active_export_job(job)
+    context.window_manager.progress_begin(0, job.total)
+    bpy.app.timers.register(_poll_export_job, first_interval=_EXPORT_POLL_S)
+    operator.report({"INFO"}, f"Manufacturing pack export started ({job.total} files).")
+    return True
+
+
+def _export_job_outcome(job: ExportJob) -> tuple[str, str]:
+    if job.errors:
+        extra = f" (+{len(job.errors) - 1} more)" if len(job.errors) > 1 else ""
+        return "ERROR", f"Export failed: {job.errors[0]}{extra}"
+    if job.cancelled:
+        return "WARNING", f"Export cancelled after {job.completed}/{job.total} files."
+    return "INFO", job.done_message
+
+
+def _redraw_view3d() -> None:
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+def _poll_export_job() -> float | None:
+    # bpy.app.timers callback: the operator has already returned, so the outcome goes to the panel.
+    job = active_export_job()
+    if job is None:
+        return None
+    wm = bpy.context.window_manager
+    if not job.poll():
+        wm.progress_update(job.completed)
+        _redraw_view3d()
+        return _EXPORT_POLL_S
+    wm.progress_end()
+    set_active_export_job(None, _export_job_outcome(job)[1])
+    _redraw_view3d()
+    return None
+
+
+def _threemf_items(
+    snapshots: list[tuple[str, np.ndarray, np.ndarray]],
+    rotations: dict[str, np.ndarray],
+    check_cancelled: Callable[[], None],
+) -> Iterator[ThreeMFItem]:
+    for name, co, tris in snapshots:
+        check_cancelled()
+        yield name, co * 1000.0, tris, rotations[name]
+
+
+def _export_stl(path: str, name: str, co: np.ndarray, tris: np.ndarray, previous: dict) -> tuple[list[dict], int]:
+    digest = mesh_digest(co, tris)
+    written = not is_unchanged(previous.get(("STL", name)), path, digest)
+    if written:
+        write_binary_stl(path, co, tris)
+    entry = {"object": name, "format": "STL", "path": path, "sha1": digest, "triangles": len(tris)}
+    entry["bytes"] = os.path.getsize(path)
+    return [entry], int(written)
+
+
+_MIRROR_X = np.diag((-1.0, 1.0, 1.0))
+
+
+def _export_3mf(
+    path: str,
+    snapshots: list[tuple[str, np.ndarray, np.ndarray]],
+    orientations: dict[str, dict[str, float]],
+    copies: dict[str, list[tuple[str, bool]]],
+    bed: tuple[float, float],
+    previous: dict,
+    check_cancelled: Callable[[], None],
+) -> tuple[list[dict], int]:
+    # One package holds every part, so it is rewritten when any part, its print rotation, its copies,
+    # the bed size or the set of parts changed. Split parts and pins have no DFM orientation and go in
+    # as modeled. Congruent copies are extra build items of the representative's object; mirrored
+    # ones are reflected across X after the print rotation, which keeps the same face on the bed.
+    rotations: dict[str, np.ndarray] = {}
+    entries: list[dict] = []
+    for name, co, tris in snapshots:
+        ori = orientations.get(name, {"rx_rad": 0.0, "ry_rad": 0.0, "rz_rad": 0.0})
+        rotation = euler_xyz_matrix(ori["rx_rad"], ori["ry_rad"], ori["rz_rad"])
+        part_copies = copies.get(name, [])
+        rotations[name] = np.stack([rotation, *(_MIRROR_X @ rotation if mirrored else rotation for _, mirrored in part_copies)])
+        digest = mesh_digest(co, tris, rotations[name].tobytes(), np.asarray(bed, dtype=np.float64).tobytes())
+        entry = {"object": name, "format": "3MF", "path": path, "sha1": digest, "triangles": len(tris)}
+        if part_copies:
+            entry["copies"] = [{"object": copy, "mirrored": mirrored} for copy, mirrored in part_copies]
+        entries.append(entry)
+    previous_names = {name for (fmt, name), entry in previous.items() if fmt == "3MF" and entry.get("path") == path}
+    written = previous_names != set(rotations) or not all(
+        is_unchanged(previous.get(("3MF", entry["object"])), path, entry["sha1"]) for entry in entries
+    )
+    if written:
+        write_3mf(path, _threemf_items(snapshots, rotations, check_cancelled), bed)
+    size = os.path.getsize(path)
+    for entry in entries:
+        entry["bytes"] = size
+    return entries, int(written)
+
+
+def _write_manifest(job: ExportJob, path: str, manifest: dict, part_labels: list[str], set_dir: str) -> None:
+    # Runs after every part task finished, in task order so the manifest does not depend on thread timing.
+    exported: list[dict] = []
+    written = 0
+    for label in part_labels:
+        # Part tasks (_export_stl / _export_3mf) return (manifest entries, files written).
+        entries, count = cast(tuple[list[dict], int], job.results[label])
+        exported.extend(entries)
+        written += count
+    _write_json_file(path, {"exports": exported, **manifest})
+    job.done_message = (
+        f"Manufacturing pack exported to: {set_dir} "
+        f"({written} part files written, {len(part_labels) - written} unchanged)."
+    )
+
+
+def _remove_files(paths: list[str]) -> None:
+    for path in paths:
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def _write_json_file(path: str, payload: dict) -> None:
+    with atomic_path(path) as tmp, open(tmp, "w", encoding="utf-8") as fp:
+        json.dump(payload, fp, indent=2)
+
+
+def _write_csv_file(path: str, fieldnames: list[str], rows: list[dict]) -> None:
+    with atomic_path(path) as tmp, open(tmp, "w", newline="", encoding="utf-8") as fp:
+        writer = csv.DictWriter(fp, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_text_file(path: str, text: str) -> None:
+    with atomic_path(path) as tmp, open(tmp, "w", encoding="utf-8") as fp:
+        fp.write(text)
+
+
+_PRINT_ESTIMATE_NOTE = (
+    "Upper bound: parts are unions of overlapping primitives that are not booleaned, "
+    "so overlapping volume is counted once per primitive."
+)
+
+
+def _prepare_manufacturing_job(
+    context: bpy.types.Context,
+    scene: bpy.types.Scene,
+    operator: bpy.types.Operator,
+    objects: list[bpy.types.Object],
+) -> ExportJob | None:
+    # Main thread: DFM, splitting and a snapshot of every mesh plus the BOM/assembly content. The
+    # returned job only encodes and writes files, so it never touches bpy.
+    settings = scene.rcgen_settings
+    tol = scene.rcgen_tolerances
+
+    out_dir = ensure_dir(bpy.path.abspath(settings.export_dir))
+    set_dir = ensure_dir(os.path.join(out_dir, settings.rcgen_id))
+
+    errors, warnings, orientations, dfm_report = run_printability_checks(scene)
     _warn_report(operator, warnings)
+    operator.report({"INFO"}, format_dfm_timings(dfm_report))
     for err in errors:
         operator.report({"ERROR"}, err)
     if errors:
-        return False
+        return None
 
     temp_collection = ensure_collection_path(scene, ("RC_GEN", "ExportTemp"))
     temp_objects: list[bpy.types.Object] = []
@@ -1327,7 +1512,18 @@ def _write_manufacturing_pack(context: bpy.types.Context, scene: bpy.types.Scene
     export_targets: list[bpy.types.Object] = []
     split_pin_count = 0
 
+    # Congruent copies (usually the R twin of an L part) get no STL of their own: the representative's file
+    # is printed once per copy, mirrored in the slicer when the copy is a mirror image.
+    names = {obj.name for obj in objects}
+    congruent = {name: link for name, link in dfm_report["congruent"].items() if link["of"] in names}
+    copies: dict[str, list[tuple[str, bool]]] = {}
+    for name, link in congruent.items():
+        copies.setdefault(link["of"], []).append((name, link["mirrored"]))
+    target_copies = dict(copies)
+
     for obj in objects:
+        if obj.name in congruent:
+            continue
         if settings.auto_split_large_parts and _exceeds_print_volume(obj, settings):
             parts, pins, split_warnings = _split_object_for_export(context, scene, obj, settings, tol, temp_collection)
             _warn_report(operator, split_warnings)
@@ -1336,7 +1532,9 @@ def _write_manufacturing_pack(context: bpy.types.Context, scene: bpy.types.Scene
                 export_targets.extend(pins)
                 temp_objects.extend(parts)
                 temp_objects.extend(pins)
-                split_pin_count += len(pins)
+                split_pin_count += len(pins) * (1 + len(copies.get(obj.name, ())))
+                for target in (*parts, *pins):
+                    target_copies[target.name] = copies.get(obj.name, [])
                 split_notes.append(
                     f"{obj.name}: split into {parts[0].name} and {parts[1].name} "
                     f"with {settings.split_key_profile} keys "
@@ -1346,33 +1544,40 @@ def _write_manufacturing_pack(context: bpy.types.Context, scene: bpy.types.Scene
             operator.report({"WARNING"}, f"{obj.name}: split failed, exporting original mesh.")
         export_targets.append(obj)
 
-    exported: list[dict[str, str]] = []
-    prev_selected = list(context.selected_objects)
-    prev_active = context.view_layer.objects.active
+    # One evaluated snapshot per target feeds both the STL and the 3MF writers.
+    depsgraph = context.evaluated_depsgraph_get()
+    snapshots = [(obj.name, *evaluated_world_triangles(obj, depsgraph)) for obj in export_targets]
 
-    try:
-        for obj in export_targets:
-            before_sel, before_active = _select_only(context, obj)
-            base_path = os.path.join(set_dir, obj.name)
-            if settings.export_stl:
-                stl_path = base_path + ".stl"
-                ok_stl, stl_error = _export_selected_stl(stl_path)
-                if ok_stl:
-                    exported.append({"object": obj.name, "format": "STL", "path": stl_path})
-                else:
-                    operator.report({"ERROR"}, f"STL export unavailable/failed: {stl_error}")
-                    _restore_selection(context, before_sel, before_active)
-                    return False
-            if settings.export_3mf:
-                if hasattr(bpy.ops.export_mesh, "threemf"):
-                    path_3mf = base_path + ".3mf"
-                    bpy.ops.export_mesh.threemf(filepath=path_3mf, use_selection=True, check_existing=False)
-                    exported.append({"object": obj.name, "format": "3MF", "path": path_3mf})
-                else:
-                    operator.report({"WARNING"}, "3MF exporter not available in this Blender build.")
-            _restore_selection(context, before_sel, before_active)
-    finally:
-        _restore_selection(context, prev_selected, prev_active)
+    for tmp_obj in temp_objects:
+        mesh = tmp_obj.data if tmp_obj.type == "MESH" else None
+        bpy.data.objects.remove(tmp_obj, do_unlink=True)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+    job = ExportJob(default_worker_count(), f"Manufacturing pack exported to: {set_dir}")
+    manifest_path = os.path.join(set_dir, "manifest.json")
+    previous = previous_exports(manifest_path)
+    files: list[ExportTask] = []
+    if settings.export_stl:
+        for name, co, tris in snapshots:
+            stl_path = os.path.join(set_dir, name) + ".stl"
+            files.append((f"STL {name}", partial(_export_stl, stl_path, name, co, tris, previous)))
+
+    if settings.export_3mf:
+        path_3mf = os.path.join(set_dir, settings.rcgen_id) + ".3mf"
+        bed = (settings.print_volume_x_mm, settings.print_volume_y_mm)
+        files.append(
+            ("3MF", lambda: _export_3mf(path_3mf, snapshots, orientations, target_copies, bed, previous, job.check_cancelled))
+        )
+    part_labels = [label for label, _ in files]
+
+    # STLs of parts that are now congruent copies (left by an export without dedupe) would sit next
+    # to the representative's file and be printed twice.
+    superseded: list[str] = []
+    if settings.export_stl:
+        superseded = [path for path in (os.path.join(set_dir, name) + ".stl" for name in congruent) if os.path.isfile(path)]
+    if superseded:
+        files.append(("superseded STL", partial(_remove_files, superseded)))
 
     bom_counts = _hardware_bom(objects, settings.default_hardware)
     bom_rows = []
@@ -1380,14 +1585,48 @@ def _write_manufacturing_pack(context: bpy.types.Context, scene: bpy.types.Scene
         if qty > 0:
             bom_rows.append({"item": name, "qty": qty, "notes": "Estimated by generator topology"})
 
-    bom_rows.extend(
-        {
-            "item": obj.name,
-            "qty": 1,
-            "notes": f"module={obj.get('rcgen_module', '')}, side={obj.get('rcgen_side', '')}",
-        }
-        for obj in objects
-    )
+    part_stats = dfm_report["parts"]
+    for obj in objects:
+        if obj.name in congruent:
+            continue
+        stats = part_stats.get(obj.name, {})
+        notes = f"module={obj.get('rcgen_module', '')}, side={obj.get('rcgen_side', '')}"
+        if obj.name in copies:
+            labels = (f"{copy} (mirrored)" if mirrored else copy for copy, mirrored in copies[obj.name])
+            notes += f"; also printed as {', '.join(labels)}"
+        bom_rows.append(
+            {
+                "item": obj.name,
+                "qty": 1 + len(copies.get(obj.name, ())),
+                "notes": notes,
+                "filament_g": round(stats["mass_g"], 2) if "mass_g" in stats else "",
+                "print_time_min": round(stats["print_time_min"], 1) if "print_time_min" in stats else "",
+            }
+        )
+    print_totals = {
+        "filament_g": round(sum(stats.get("mass_g", 0.0) for stats in part_stats.values()), 2),
+        "filament_volume_mm3": round(sum(stats.get("filament_volume_mm3", 0.0) for stats in part_stats.values()), 1),
+        "print_time_min": round(sum(stats.get("print_time_min", 0.0) for stats in part_stats.values()), 1),
+        "layer_height_mm": settings.layer_height_mm,
+        "nozzle_mm": settings.nozzle_mm,
+        "infill_percent": settings.infill_percent,
+        "filament_density_g_cm3": settings.filament_density_g_cm3,
+        "estimate": _PRINT_ESTIMATE_NOTE,
+    }
+
+    # Solid-body mass properties (100% density) per module/side group and for the whole set.
+    part_mass = dfm_report["mass"]
+    groups: dict[str, list[dict]] = {}
+    for obj in objects:
+        if obj.name in part_mass:
+            groups.setdefault(f"{obj.get('rcgen_module', '')}/{obj.get('rcgen_side', '')}", []).append(part_mass[obj.name])
+    mass_block = {
+        "density_g_cm3": settings.filament_density_g_cm3,
+        "parts": part_mass,
+        "groups": {group: combine_mass_properties(items) for group, items in sorted(groups.items())},
+        "total": combine_mass_properties(list(part_mass.values())),
+        "estimate": _PRINT_ESTIMATE_NOTE,
+    }
     if split_pin_count > 0:
         bom_rows.append(
             {
@@ -1397,77 +1636,101 @@ def _write_manufacturing_pack(context: bpy.types.Context, scene: bpy.types.Scene
             }
         )
 
+    generated_at = datetime.utcnow().isoformat() + "Z"
     bom_json_path = os.path.join(set_dir, "BOM.json")
-    with open(bom_json_path, "w", encoding="utf-8") as fp:
-        json.dump(
-            {
-                "rcgen_id": settings.rcgen_id,
-                "generated_at": datetime.utcnow().isoformat() + "Z",
-                "hardware_default": settings.default_hardware,
-                "rows": bom_rows,
-            },
-            fp,
-            indent=2,
-        )
+    bom_json = {
+        "rcgen_id": settings.rcgen_id,
+        "generated_at": generated_at,
+        "hardware_default": settings.default_hardware,
+        "rows": bom_rows,
+        "print_totals": print_totals,
+        "mass_properties": mass_block,
+    }
 
     bom_csv_path = os.path.join(set_dir, "BOM.csv")
-    with open(bom_csv_path, "w", newline="", encoding="utf-8") as fp:
-        writer = csv.DictWriter(fp, fieldnames=["item", "qty", "notes"])
-        writer.writeheader()
-        for row in bom_rows:
-            writer.writerow(row)
+    bom_csv_rows = [
+        *bom_rows,
+        {
+            "item": "TOTAL printed parts",
+            "qty": len(objects),
+            "notes": (
+                f"layer={settings.layer_height_mm:.2f}mm, nozzle={settings.nozzle_mm:.2f}mm, "
+                f"infill={settings.infill_percent:.0f}%; filament and time are upper bounds"
+            ),
+            "filament_g": print_totals["filament_g"],
+            "print_time_min": print_totals["print_time_min"],
+        },
+    ]
 
     assembly_path = os.path.join(set_dir, "ASSEMBLY.md")
-    with open(assembly_path, "w", encoding="utf-8") as fp:
-        fp.write("# RC Mechanism Generator - Manufacturing Pack\n\n")
-        fp.write(f"- Set: `{settings.rcgen_id}`\n")
-        fp.write(f"- Generated: {datetime.utcnow().isoformat()}Z\n")
-        fp.write("\n## Recommended Sequence\n")
-        fp.write("1. Print suspension arms and knuckles.\n")
-        fp.write("2. Assemble chassis pivots with specified hardware.\n")
-        fp.write("3. Install steering horn and tie rods.\n")
-        fp.write("4. Install shock body, rod and spring.\n")
-        fp.write("5. Re-check free movement and wheel-well clearance.\n")
-        fp.write("\n## Project Tolerances\n")
-        fp.write(f"- clearance_sliding_mm: {tol.clearance_sliding_mm:.3f}\n")
-        fp.write(f"- clearance_press_mm: {tol.clearance_press_mm:.3f}\n")
-        fp.write(f"- hole_oversize_mm: {tol.hole_oversize_mm:.3f}\n")
-        fp.write(f"- nut_trap_clearance_mm: {tol.nut_trap_clearance_mm:.3f}\n")
-        fp.write(f"- insert_pocket_clearance_mm: {tol.insert_pocket_clearance_mm:.3f}\n")
-        fp.write("\n## Print Orientation (suggested)\n")
-        for obj in export_targets:
-            ori = orientations.get(obj.name, {"rx_rad": 0.0, "ry_rad": 0.0, "rz_rad": 0.0})
-            fp.write(
-                f"- {obj.name}: rotate rx={math.degrees(ori['rx_rad']):.1f}deg, "
-                f"ry={math.degrees(ori['ry_rad']):.1f}deg, rz={math.degrees(ori['rz_rad']):.1f}deg\n"
+    lines = [
+        "# RC Mechanism Generator - Manufacturing Pack\n",
+        f"- Set: `{settings.rcgen_id}`",
+        f"- Generated: {generated_at}",
+        "\n## Recommended Sequence",
+        "1. Print suspension arms and knuckles.",
+        "2. Assemble chassis pivots with specified hardware.",
+        "3. Install steering horn and tie rods.",
+        "4. Install shock body, rod and spring.",
+        "5. Re-check free movement and wheel-well clearance.",
+        "\n## Project Tolerances",
+        f"- clearance_sliding_mm: {tol.clearance_sliding_mm:.3f}",
+        f"- clearance_press_mm: {tol.clearance_press_mm:.3f}",
+        f"- hole_oversize_mm: {tol.hole_oversize_mm:.3f}",
+        f"- nut_trap_clearance_mm: {tol.nut_trap_clearance_mm:.3f}",
+        f"- insert_pocket_clearance_mm: {tol.insert_pocket_clearance_mm:.3f}",
+        "\n## Print Orientation (suggested)",
+    ]
+    for name, _, _ in snapshots:
+        ori = orientations.get(name, {"rx_rad": 0.0, "ry_rad": 0.0, "rz_rad": 0.0})
+        line = (
+            f"- {name}: rotate rx={math.degrees(ori['rx_rad']):.1f}deg, "
+            f"ry={math.degrees(ori['ry_rad']):.1f}deg, rz={math.degrees(ori['rz_rad']):.1f}deg"
+        )
+        if "support_volume_mm3" in ori:
+            line += (
+                f" (support ~{ori['support_volume_mm3']:.0f} mm3, overhang {ori['overhang_area_mm2']:.0f} mm2, "
+                f"bed contact {ori['contact_area_mm2']:.0f} mm2, height {ori['build_height_mm']:.1f} mm)"
             )
-        if split_notes:
-            fp.write("\n## Auto Split Notes\n")
-            for note in split_notes:
-                fp.write(f"- {note}\n")
-
-    manifest_path = os.path.join(set_dir, "manifest.json")
-    with open(manifest_path, "w", encoding="utf-8") as fp:
-        json.dump(
-            {
-                "exports": exported,
-                "bom_csv": bom_csv_path,
-                "bom_json": bom_json_path,
-                "assembly": assembly_path,
-                "split_notes": split_notes,
-            },
-            fp,
-            indent=2,
+        lines.append(line)
+    lines.extend(
+        [
+            "\n## Print Estimates (upper bound)",
+            f"- Filament: {print_totals['filament_g']:.2f} g ({print_totals['filament_volume_mm3']:.0f} mm3)",
+            f"- Print time: {print_totals['print_time_min']:.1f} min",
+            f"- Solid mass (100% infill): {mass_block['total']['mass_g']:.2f} g",
+            f"- {_PRINT_ESTIMATE_NOTE}",
+        ]
+    )
+    if congruent:
+        lines.append("\n## Congruent Parts")
+        lines.append(
+            "Copies have no STL of their own. The 3MF has one build item per copy, "
+            "mirrored across X for mirrored copies."
         )
-
-    for tmp_obj in temp_objects:
-        mesh = tmp_obj.data if tmp_obj.type == "MESH" else None
-        bpy.data.objects.remove(tmp_obj, do_unlink=True)
-        if mesh is not None and mesh.users == 0:
-            bpy.data.meshes.remove(mesh)
-
-    operator.report({"INFO"}, f"Manufacturing pack exported to: {set_dir}")
-    return True
+        for name, link in congruent.items():
+            lines.append(f"- {name}: print {link['of']}" + (" mirrored" if link["mirrored"] else ""))
+    if split_notes:
+        lines.append("\n## Auto Split Notes")
+        lines.extend(f"- {note}" for note in split_notes)
+
+    files.append(("BOM.json", lambda: _write_json_file(bom_json_path, bom_json)))
+    files.append(("BOM.csv", lambda: _write_csv_file(bom_csv_path, ["item", "qty", "notes", "filament_g", "print_time_min"], bom_csv_rows)))
+    files.append(("ASSEMBLY.md", lambda: _write_text_file(assembly_path, "\n".join(lines) + "\n")))
+    job.add_stage(files)
+
+    # The manifest goes last, once every file it lists has been written (or found unchanged).
+    manifest = {
+        "bom_csv": bom_csv_path,
+        "bom_json": bom_json_path,
+        "assembly": assembly_path,
+        "split_notes": split_notes,
+        "superseded_removed": superseded,
+        "orientations": orientations,
+        "dfm": dfm_report,
+    }
+    job.add_stage([("manifest.json", lambda: _write_manifest(job, manifest_path, manifest, part_labels, set_dir))])
+    return job
 
 
 class RCGEN_OT_CaptureSelected(bpy.types.Operator):
@@ -1561,7 +1824,7 @@ class RCGEN_OT_GenerateSuspension(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context: bpy.types.Context):
-        return {"FINISHED"} if _generate_suspension(context.scene, self) else {"CANCELLED"}
+        return {"FINISHED"} if _generate_suspension(context.scene, self, force=True) else {"CANCELLED"}
 
 
 class RCGEN_OT_UpdateSuspension(bpy.types.Operator):
@@ -1579,7 +1842,7 @@ class RCGEN_OT_GenerateSteering(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context: bpy.types.Context):
-        return {"FINISHED"} if _generate_steering(context.scene, self) else {"CANCELLED"}
+        return {"FINISHED"} if _generate_steering(context.scene, self, force=True) else {"CANCELLED"}
 
 
 class RCGEN_OT_UpdateSteering(bpy.types.Operator):
@@ -1613,7 +1876,7 @@ class RCGEN_OT_GenerateShocks(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context: bpy.types.Context):
-        return {"FINISHED"} if _generate_shocks(context.scene, self) else {"CANCELLED"}
+        return {"FINISHED"} if _generate_shocks(context.scene, self, force=True) else {"CANCELLED"}
 
 
 class RCGEN_OT_UpdateShocks(bpy.types.Operator):
@@ -1630,8 +1893,17 @@ class RCGEN_OT_RunPrintabilityChecks(bpy.types.Operator):
     bl_label = "Run Printability Checks"
 
     def execute(self, context: bpy.types.Context):
-        errors, warnings, _ = run_printability_checks(context.scene)
+        scene = context.scene
+        # Same full-resolution meshes as the export, so its DFM pass reuses these cached results.
+        swapped = _swap_in_full_lod(scene, self, list_generated_mesh_objects(scene, scene.rcgen_settings.rcgen_id))
+        if swapped is None:
+            return {"CANCELLED"}
+        try:
+            errors, warnings, _, dfm_report = run_printability_checks(scene)
+        finally:
+            _restore_preview_lod(swapped)
         _warn_report(self, warnings)
+        self.report({"INFO"}, format_dfm_timings(dfm_report))
         if errors:
             for err in errors:
                 self.report({"ERROR"}, err)
@@ -1648,17 +1920,32 @@ class RCGEN_OT_ExportManufacturingPack(bpy.types.Operator):
         return {"FINISHED"} if _write_manufacturing_pack(context, context.scene, self) else {"CANCELLED"}
 
 
+class RCGEN_OT_CancelExport(bpy.types.Operator):
+    bl_idname = "rcgen.cancel_export"
+    bl_label = "Cancel Export"
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        return active_export_job() is not None
+
+    def execute(self, context: bpy.types.Context):
+        # Files already being written are finished; queued ones and the manifest are skipped.
+        job = active_export_job()
+        if job is None:
+            self.report({"WARNING"}, "No manufacturing pack export is running.")
+            return {"CANCELLED"}
+        job.cancel()
+        self.report({"INFO"}, "Cancelling manufacturing pack export.")
+        return {"FINISHED"}
+
+
 class RCGEN_OT_GenerateAll(bpy.types.Operator):
     bl_idname = "rcgen.generate_all"
     bl_label = "Generate All"
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context: bpy.types.Context):
-        if not _generate_suspension(context.scene, self):
-            return {"CANCELLED"}
-        if not _generate_steering(context.scene, self):
-            return {"CANCELLED"}
-        if not _generate_shocks(context.scene, self):
+        if not _generate_modules(context.scene, self, _ALL_MODULES, force=True):
             return {"CANCELLED"}
         self.report({"INFO"}, "Full generation finished.")
         return {"FINISHED"}
@@ -1670,16 +1957,105 @@ class RCGEN_OT_UpdateAll(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context: bpy.types.Context):
-        if not _generate_suspension(context.scene, self):
-            return {"CANCELLED"}
-        if not _generate_steering(context.scene, self):
-            return {"CANCELLED"}
-        if not _generate_shocks(context.scene, self):
+        if not _generate_modules(context.scene, self, _ALL_MODULES):
             return {"CANCELLED"}
         self.report({"INFO"}, "Full update finished.")
         return {"FINISHED"}
 
 
+class RCGEN_OT_UpdateDirty(bpy.types.Operator):
+    bl_idname = "rcgen.update_dirty"
+    bl_label = "Update Dirty"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context: bpy.types.Context):
+        dirty = dirty_parts(context.scene)
+        modules = tuple(module for module in _ALL_MODULES if any(part_module(name) == module for name in dirty))
+        if not modules:
+            self.report({"INFO"}, "No dirty parts.")
+            return {"FINISHED"}
+        if not _generate_modules(context.scene, self, modules, only=dirty):
+            return {"CANCELLED"}
+        self.report({"INFO"}, "Dirty parts updated.")
+        return {"FINISHED"}
+
+
+class _QuietReporter:
+    # Stands in for the operator so live ticks and export re-planning do not flood the info log.
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def report(self, level: set[str], message: str) -> None:
+        if "ERROR" in level:
+            self.errors.append(message)
+
+
+_LIVE_TICK_S = 0.02
+
+
+class RCGEN_OT_LiveMode(bpy.types.Operator):
+    bl_idname = "rcgen.live_mode"
+    bl_label = "Live Mode"
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        if live_mode_active():
+            set_live_mode(False)
+            return {"FINISHED"}
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(_LIVE_TICK_S, window=context.window)
+        self._pending: set[str] = set()
+        self._failed: set[str] | None = None
+        self._changed_at = time.perf_counter()
+        sync_baseline(context.scene)
+        set_live_mode(True)
+        wm.modal_handler_add(self)
+        self.report({"INFO"}, "Live Mode on (Esc to stop).")
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context: bpy.types.Context, event: bpy.types.Event):
+        if not live_mode_active() or event.type == "ESC":
+            self._stop(context)
+            self.report({"INFO"}, "Live Mode off.")
+            return {"FINISHED"}
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        scene = context.scene
+        settings = scene.rcgen_settings
+        dirty = dirty_parts(scene)
+        now = time.perf_counter()
+        if dirty != self._pending:
+            # Debounce: wait until the dirty set stops changing before regenerating.
+            self._pending = dirty
+            self._changed_at = now
+            return {"PASS_THROUGH"}
+        if not dirty or dirty == self._failed or (now - self._changed_at) * 1000.0 < settings.live_debounce_ms:
+            return {"PASS_THROUGH"}
+
+        reporter = _QuietReporter()
+        budget = settings.live_budget_ms / 1000.0
+        for module in _ALL_MODULES:
+            if not any(part_module(name) == module for name in dirty):
+                continue
+            if not _generate_modules(scene, reporter, (module,), only=dirty):
+                self._failed = dirty_parts(scene)
+                break
+            if time.perf_counter() - now > budget:
+                break
+        if reporter.errors:
+            self.report({"WARNING"}, reporter.errors[-1])
+        # Modules left over the budget run on the next tick without waiting for the debounce again.
+        self._pending = dirty_parts(scene)
+        return {"PASS_THROUGH"}
+
+    def cancel(self, context: bpy.types.Context):
+        self._stop(context)
+
+    def _stop(self, context: bpy.types.Context) -> None:
+        context.window_manager.event_timer_remove(self._timer)
+        set_live_mode(False)
+
+
 class RCGEN_OT_OrganizeCollections(bpy.types.Operator):
     bl_idname = "rcgen.organize_collections"
     bl_label = "Organize Collections"
@@ -1773,8 +2149,11 @@ classes = (
     RCGEN_OT_UpdateShocks,
     RCGEN_OT_RunPrintabilityChecks,
     RCGEN_OT_ExportManufacturingPack,
+    RCGEN_OT_CancelExport,
     RCGEN_OT_GenerateAll,
     RCGEN_OT_UpdateAll,
+    RCGEN_OT_UpdateDirty,
+    RCGEN_OT_LiveMode,
     RCGEN_OT_OrganizeCollections,
     RCGEN_OT_TestMCPConnection,
     RCGEN_OT_CallMCPTool,
@@ -1787,5 +2166,10 @@ def register():
 
 
 def unregister():
+    if bpy.app.timers.is_registered(_poll_export_job):
+        bpy.app.timers.unregister(_poll_export_job)
+    shutdown_export_job()
+    shutdown_executor()
+    clear_full_cache()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -87,17 +87,30 @@ class RCGEN_Settings(bpy.types.PropertyGroup):
     print_volume_z_mm: FloatProperty(name="Print Volume Z (mm)", default=250.0, min=20.0, max=1000.0)
     nozzle_mm: FloatProperty(name="Nozzle (mm)", default=0.4, min=0.1, max=2.0)
     layer_height_mm: FloatProperty(name="Layer Height (mm)", default=0.2, min=0.05, max=1.0)
+    perimeter_count: IntProperty(name="Perimeters", default=2, min=1, max=10)
+    infill_percent: FloatProperty(name="Infill (%)", default=20.0, min=0.0, max=100.0)
+    print_speed_mm_s: FloatProperty(name="Print Speed (mm/s)", description="Velocidade media de extrusao para a estimativa de tempo", default=60.0, min=1.0, max=1000.0)
+    filament_density_g_cm3: FloatProperty(name="Filament Density (g/cm3)", description="Densidade do material para filamento e propriedades de massa (PLA ~1.24, PETG ~1.27, ABS ~1.04)", default=1.24, min=0.5, max=3.0)
 
     wheel_spin_axis: EnumProperty(name="Wheel Spin Axis", items=(("X", "X", ""), ("Y", "Y", ""), ("Z", "Z", "")), default="Y")
     tire_diameter_mm_manual: FloatProperty(name="Tire Diameter Manual (mm)", default=85.0, min=10.0, max=400.0)
     tire_width_mm_manual: FloatProperty(name="Tire Width Manual (mm)", default=30.0, min=5.0, max=200.0)
     servo_axis: EnumProperty(name="Servo Axis", items=(("X", "X", ""), ("Y", "Y", ""), ("Z", "Z", "")), default="Z")
     segments: IntProperty(name="Segments", default=16, min=8, max=64)
+    use_preview_lod: BoolProperty(name="Preview LOD", description="Viewport usa resolucao reduzida; export reconstroi em resolucao total", default=True)
+    preview_segments: IntProperty(name="Preview Segments", default=8, min=6, max=64)
+    preview_spring_resolution: IntProperty(name="Preview Spring Resolution", default=6, min=6, max=24)
+    parallel_generation: BoolProperty(name="Parallel Generation", default=True)
+    parallel_workers: IntProperty(name="Worker Processes", description="0 = automatico (CPUs - 1, max 8)", default=0, min=0, max=64)
+    parallel_min_parts: IntProperty(name="Parallel Min Parts", description="Abaixo desta quantidade de pecas a geometria e gerada em serie", default=24, min=2, max=10000)
+    live_debounce_ms: IntProperty(name="Live Debounce (ms)", description="Espera as edicoes pararem por este tempo antes de regenerar", default=120, min=0, max=2000)
+    live_budget_ms: IntProperty(name="Live Budget (ms)", description="Tempo maximo por tick; modulos restantes ficam para o proximo tick", default=30, min=5, max=1000)
 
     arm_section: EnumProperty(name="Arm Section", items=(("ROUND", "Round", ""), ("RECT", "Rect", ""), ("OVAL", "Oval", "")), default="ROUND")
     arm_rod_diameter_mm: FloatProperty(name="Arm Rod Dia (mm)", default=6.0, min=1.0, max=25.0)
     arm_bushing_diameter_mm: FloatProperty(name="Arm Bushing Dia (mm)", default=8.0, min=1.0, max=30.0)
     min_wall_mm: FloatProperty(name="Min Wall (mm)", default=1.6, min=0.2, max=8.0)
+    wall_thickness_samples: IntProperty(name="Wall Thickness Samples", description="Amostras por peca na medicao de espessura por raios (0 = apenas bounding box)", default=256, min=0, max=20000)
     min_feature_mm: FloatProperty(name="Min Feature (mm)", default=0.5, min=0.05, max=5.0)
     add_ribs: BoolProperty(name="Add Ribs", default=True)
     use_chamfer_radius: BoolProperty(name="Use Chamfer/Radius", default=True)
@@ -135,6 +148,11 @@ class RCGEN_Settings(bpy.types.PropertyGroup):
     spring_turns: FloatProperty(name="Spring Turns", default=8.0, min=2.0, max=20.0)
     spring_resolution: IntProperty(name="Spring Resolution", default=8, min=6, max=24)
 
+    clearance_search_mm: FloatProperty(name="Clearance Search (mm)", description="Folgas maiores que isto ficam fora da matriz de folgas", default=10.0, min=0.5, max=200.0)
+    orientation_candidates: IntProperty(name="Orientation Candidates", description="Direcoes amostradas na esfera ao escolher a orientacao de impressao", default=128, min=0, max=2000)
+    dfm_workers: IntProperty(name="DFM Workers", description="Threads para os checks DFM (0 = automatico)", default=0, min=0, max=64)
+    dedupe_congruent_parts: BoolProperty(name="Dedupe Congruent Parts", description="Pecas iguais ou espelhadas (L/R) sao verificadas e exportadas uma vez, com quantidade na BOM", default=True)
+    congruence_tolerance_mm: FloatProperty(name="Congruence Tolerance (mm)", description="Desvio maximo entre vertices para considerar duas pecas congruentes", default=0.05, min=0.001, max=2.0)
     overhang_warn_deg: FloatProperty(name="Overhang Warn Deg", default=55.0, min=30.0, max=89.0)
     min_edge_hole_margin_mm: FloatProperty(name="Min Edge-Hole Margin (mm)", default=1.2, min=0.1, max=10.0)
     auto_split_large_parts: BoolProperty(name="Auto Split Oversize", default=True)
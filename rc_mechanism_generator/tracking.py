@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Any
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .geometry import invalidated_nodes, is_mount_node, part_dependencies, part_module
+from .utils import property_group_values
+from .utils.constants import SIDES
+
+_GRAPH = part_dependencies(SIDES)
+
+# Per-scene state, keyed by scene name. Not saved with the .blend: after loading a file the
+# first depsgraph update only records a baseline.
+_baseline: dict[str, dict[str, Any]] = {}
+_dirty: dict[str, set[str]] = {}
+_live_mode = False
+
+
+def live_mode_active() -> bool:
+    return _live_mode
+
+
+def set_live_mode(active: bool) -> None:
+    global _live_mode
+    _live_mode = active
+
+
+def input_state(scene: bpy.types.Scene) -> dict[str, Any]:
+    state: dict[str, Any] = {}
+    refs = scene.rcgen_refs
+    for prop in refs.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.type != "POINTER":
+            continue
+        obj = getattr(refs, prop.identifier)
+        if obj is None:
+            state[f"ref:{prop.identifier}"] = None
+        else:
+            matrix = tuple(tuple(row) for row in obj.matrix_world)
+            state[f"ref:{prop.identifier}"] = (obj.name, matrix, tuple(obj.dimensions))
+    for name, value in property_group_values(scene.rcgen_settings).items():
+        state[f"settings:{name}"] = value
+    for name, value in property_group_values(scene.rcgen_tolerances).items():
+        state[f"tolerances:{name}"] = value
+    return state
+
+
+def changed_inputs(before: dict[str, Any], after: dict[str, Any]) -> set[str]:
+    return {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+
+
+def dirty_parts(scene: bpy.types.Scene) -> set[str]:
+    return {node for node in _dirty.get(scene.name, ()) if not is_mount_node(node)}
+
+
+def mark_dirty(scene: bpy.types.Scene, changed: set[str]) -> set[str]:
+    nodes = invalidated_nodes(changed, _GRAPH)
+    _dirty.setdefault(scene.name, set()).update(nodes)
+    return nodes
+
+
+def mark_clean(scene: bpy.types.Scene, modules: tuple[str, ...]) -> None:
+    dirty = _dirty.get(scene.name)
+    if dirty:
+        dirty.difference_update({node for node in dirty if part_module(node) in modules})
+
+
+def sync_baseline(scene: bpy.types.Scene) -> set[str]:
+    state = input_state(scene)
+    previous = _baseline.get(scene.name)
+    _baseline[scene.name] = state
+    if previous is None:
+        return set()
+    return changed_inputs(previous, state)
+
+
+@persistent
+def _on_depsgraph_update(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> None:
+    if not any(isinstance(update.id, (bpy.types.Object, bpy.types.Scene)) for update in depsgraph.updates):
+        return
+    changed = sync_baseline(scene)
+    if changed:
+        mark_dirty(scene, changed)
+
+
+@persistent
+def _on_load_post(*_args) -> None:
+    _baseline.clear()
+    _dirty.clear()
+    set_live_mode(False)
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _baseline.clear()
+    _dirty.clear()
+    set_live_mode(False)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import bpy
 
+from .export import active_export_job, last_export_status
+from .tracking import dirty_parts, live_mode_active
 from .utils.constants import SIDES
 
 
@@ -56,7 +58,7 @@ class RCGEN_PT_MainPanel(bpy.types.Panel):
         tol = scene.rcgen_tolerances
 
         self._draw_overview(layout, settings, refs)
-        self._draw_quick_actions(layout)
+        self._draw_quick_actions(layout, scene)
 
         self._draw_project(layout, settings)
         self._draw_tolerances(layout, tol, settings)
@@ -83,13 +85,24 @@ class RCGEN_PT_MainPanel(bpy.types.Panel):
         chips.label(text=f"Escala {settings.project_scale:.2f}", icon="PREFERENCES")
         chips.label(text=f"Entre-eixos {settings.wheelbase_mm:.0f} mm", icon="DRIVER_DISTANCE")
 
-    def _draw_quick_actions(self, layout):
+    def _draw_quick_actions(self, layout, scene):
         box = layout.box()
         _draw_card_title(box, "Acoes Rapidas", "PLAY")
         row = box.row(align=True)
         row.scale_y = 1.2
         row.operator("rcgen.generate_all", text="Gerar Tudo", icon="MOD_BUILD")
         row.operator("rcgen.update_all", text="Atualizar Tudo", icon="FILE_REFRESH")
+        dirty = len(dirty_parts(scene))
+        row = box.row(align=True)
+        row.enabled = dirty > 0
+        row.operator("rcgen.update_dirty", text=f"Atualizar Pendentes ({dirty})", icon="FILE_REFRESH")
+        live = live_mode_active()
+        box.operator(
+            "rcgen.live_mode",
+            text="Parar Modo Ao Vivo" if live else "Modo Ao Vivo",
+            icon="PAUSE" if live else "PLAY",
+            depress=live,
+        )
 
     def _draw_project(self, layout, settings):
         box = layout.box()
@@ -105,6 +118,30 @@ class RCGEN_PT_MainPanel(bpy.types.Panel):
         basics.prop(settings, "servo_axis", text="Eixo do Servo")
         basics.prop(settings, "segments", text="Segmentos")
 
+        box.separator()
+        box.label(text="Resolucao de Preview", icon="MOD_DECIM")
+        lod = box.column(align=True)
+        lod.prop(settings, "use_preview_lod", text="Preview no Viewport")
+        sub = lod.row(align=True)
+        sub.enabled = settings.use_preview_lod
+        sub.prop(settings, "preview_segments", text="Segmentos")
+        sub.prop(settings, "preview_spring_resolution", text="Mola")
+
+        box.separator()
+        box.label(text="Geracao Paralela", icon="MOD_ARRAY")
+        parallel = box.column(align=True)
+        parallel.prop(settings, "parallel_generation", text="Processos em Paralelo")
+        sub = parallel.row(align=True)
+        sub.enabled = settings.parallel_generation
+        sub.prop(settings, "parallel_workers", text="Workers (0 = auto)")
+        sub.prop(settings, "parallel_min_parts", text="Min. Pecas")
+
+        box.separator()
+        box.label(text="Modo Ao Vivo", icon="TIME")
+        live = box.row(align=True)
+        live.prop(settings, "live_debounce_ms", text="Debounce (ms)")
+        live.prop(settings, "live_budget_ms", text="Orcamento (ms)")
+
         box.separator()
         box.label(text="Perfil de Impressao", icon="MOD_WIREFRAME")
         row = box.row(align=True)
@@ -114,6 +151,12 @@ class RCGEN_PT_MainPanel(bpy.types.Panel):
         row2 = box.row(align=True)
         row2.prop(settings, "nozzle_mm", text="Bico (mm)")
         row2.prop(settings, "layer_height_mm", text="Altura de Camada (mm)")
+        row3 = box.row(align=True)
+        row3.prop(settings, "perimeter_count", text="Perimetros")
+        row3.prop(settings, "infill_percent", text="Preenchimento (%)")
+        row4 = box.row(align=True)
+        row4.prop(settings, "print_speed_mm_s", text="Velocidade (mm/s)")
+        row4.prop(settings, "filament_density_g_cm3", text="Densidade (g/cm3)")
 
         box.separator()
         box.label(text="Pneu (Entrada Rapida)", icon="MESH_CIRCLE")
@@ -197,6 +240,7 @@ class RCGEN_PT_MainPanel(bpy.types.Panel):
         box.prop(settings, "arm_rod_diameter_mm", text="Diametro da Haste (mm)")
         box.prop(settings, "arm_bushing_diameter_mm", text="Diametro da Bucha (mm)")
         box.prop(settings, "min_wall_mm", text="Parede Minima (mm)")
+        box.prop(settings, "wall_thickness_samples", text="Amostras de Espessura")
         box.prop(settings, "min_feature_mm", text="Detalhe Minimo (mm)")
         box.prop(settings, "add_ribs", text="Adicionar Nervuras")
         box.prop(settings, "use_chamfer_radius", text="Usar Chanfro/Raio")
@@ -276,7 +320,15 @@ class RCGEN_PT_MainPanel(bpy.types.Panel):
         if not settings.ui_show_dfm_export:
             return
 
+        box.prop(settings, "dfm_workers", text="Threads DFM (0 = auto)")
+        row = box.row(align=True)
+        row.prop(settings, "dedupe_congruent_parts", text="Agrupar Pecas L/R Iguais")
+        sub = row.row(align=True)
+        sub.enabled = settings.dedupe_congruent_parts
+        sub.prop(settings, "congruence_tolerance_mm", text="Tol. (mm)")
+        box.prop(settings, "clearance_search_mm", text="Busca de Folga (mm)")
         box.prop(settings, "overhang_warn_deg", text="Alerta de Overhang (graus)")
+        box.prop(settings, "orientation_candidates", text="Candidatas de Orientacao")
         box.prop(settings, "min_edge_hole_margin_mm", text="Margem Min. Borda-Furo (mm)")
         box.prop(settings, "auto_split_large_parts", text="Dividir Pecas Grandes Automaticamente")
         box.prop(settings, "split_key_diameter_mm", text="Diametro da Chave de Uniao (mm)")
@@ -290,7 +342,15 @@ class RCGEN_PT_MainPanel(bpy.types.Panel):
 
         actions = box.column(align=True)
         actions.operator("rcgen.run_printability_checks", text="Rodar Verificacoes de Impressao", icon="CHECKMARK")
-        actions.operator("rcgen.export_manufacturing_pack", text="Exportar Pacote de Fabricacao", icon="EXPORT")
+        job = active_export_job()
+        row = actions.row(align=True)
+        row.enabled = job is None
+        row.operator("rcgen.export_manufacturing_pack", text="Exportar Pacote de Fabricacao", icon="EXPORT")
+        if job is not None:
+            actions.label(text=f"Exportando {job.completed}/{job.total} arquivos", icon="TIME")
+            actions.operator("rcgen.cancel_export", text="Cancelar Exportacao", icon="CANCEL")
+        elif last_export_status():
+            actions.label(text=last_export_status(), icon="INFO")
         actions.operator("rcgen.organize_collections", text="Organizar Colecoes", icon="OUTLINER_COLLECTION")
 
     def _draw_mcp(self, layout, settings):
@@ -6,16 +6,20 @@ from .blender_utils import (
     ensure_dir,
     ensure_empty,
     ensure_mesh_object,
+    ensure_mesh_object_from_buffer,
     list_generated_mesh_objects,
+    mesh_from_buffer,
     mm_to_m,
     object_center,
     parent_keep_world,
     parse_metadata_params,
     point_inside_bbox_world,
+    property_group_values,
     set_metadata,
     tire_dimensions_local,
     world_bbox_bounds,
 )
+from .collision import find_interferences, sweep_and_prune
 from .validation import (
     missing_required_hardpoints,
     missing_required_references,
@@ -32,7 +36,10 @@ __all__ = [
     "ensure_dir",
     "ensure_empty",
     "ensure_mesh_object",
+    "ensure_mesh_object_from_buffer",
+    "find_interferences",
     "list_generated_mesh_objects",
+    "mesh_from_buffer",
     "mm_to_m",
     "missing_required_hardpoints",
     "missing_required_references",
@@ -40,7 +47,9 @@ __all__ = [
     "parent_keep_world",
     "parse_metadata_params",
     "point_inside_bbox_world",
+    "property_group_values",
     "set_metadata",
+    "sweep_and_prune",
     "tire_dimensions_local",
     "validate_scene_for_shocks",
     "validate_scene_for_steering",
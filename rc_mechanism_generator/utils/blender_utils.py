@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 import bpy
-import bmesh
-from mathutils import Vector
+import numpy as np
+from mathutils import Matrix, Vector
+
+if TYPE_CHECKING:
+    from ..geometry.mesh_buffer import MeshBuffer
 
 
 def mm_to_m(value_mm: float) -> float:
@@ -57,14 +60,76 @@ def ensure_empty(
     return obj
 
 
-def mesh_from_bmesh(name: str, bm: bmesh.types.BMesh) -> bpy.types.Mesh:
+def write_mesh_arrays(mesh: bpy.types.Mesh, co: np.ndarray, loops: np.ndarray, loop_totals: np.ndarray) -> None:
+    # Expects an empty mesh (new or after clear_geometry()).
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    if len(loop_totals) > 1:
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32).reshape(-1))
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loops, dtype=np.int32))
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if bpy.app.version < (4, 0, 0):
+        # loop_total became derived from loop_start offsets (read-only) in 4.0.
+        mesh.polygons.foreach_set("loop_total", np.ascontiguousarray(loop_totals, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+
+def mesh_from_arrays(name: str, co: np.ndarray, loops: np.ndarray, loop_totals: np.ndarray) -> bpy.types.Mesh:
     mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    mesh.update()
-    bm.free()
+    write_mesh_arrays(mesh, co, loops, loop_totals)
     return mesh
 
 
+def mesh_from_buffer(name: str, buffer: MeshBuffer) -> bpy.types.Mesh:
+    return mesh_from_arrays(name, buffer.co, buffer.loops, buffer.loop_totals)
+
+
+def ensure_mesh_object_from_buffer(
+    name: str,
+    mesh_name: str,
+    buffer: MeshBuffer,
+    collection: bpy.types.Collection,
+) -> bpy.types.Object:
+    # Rewrite the existing datablock in place instead of allocating a new one per update: keeps
+    # bpy.data stable, avoids orphan meshes and keeps undo steps small. Shared meshes are not touched.
+    obj = bpy.data.objects.get(name)
+    if obj is None or obj.type != "MESH" or obj.data.users != 1:
+        return ensure_mesh_object(name, mesh_from_buffer(mesh_name, buffer), collection)
+    mesh = obj.data
+    mesh.clear_geometry()
+    write_mesh_arrays(mesh, buffer.co, buffer.loops, buffer.loop_totals)
+    if obj.name not in collection.objects:
+        collection.objects.link(obj)
+    return obj
+
+
+def world_triangle_arrays(obj: bpy.types.Object) -> tuple[np.ndarray, np.ndarray]:
+    # Generated parts carry no modifiers, so their mesh is read directly. Reference objects (wheel
+    # wells, chassis) may be modelled with modifiers, so they use the evaluated mesh.
+    if "rcgen_id" in obj:
+        return _world_triangles(obj.data, obj.matrix_world)
+    evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    mesh = evaluated.to_mesh()
+    try:
+        return _world_triangles(mesh, evaluated.matrix_world)
+    finally:
+        evaluated.to_mesh_clear()
+
+
+def _world_triangles(mesh: bpy.types.Mesh, matrix_world: Matrix) -> tuple[np.ndarray, np.ndarray]:
+    mesh.calc_loop_triangles()
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    matrix = np.array(matrix_world, dtype=np.float64)
+    world = co.reshape(-1, 3).astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    return world, tris.reshape(-1, 3)
+
+
 def ensure_mesh_object(name: str, mesh: bpy.types.Mesh, collection: bpy.types.Collection) -> bpy.types.Object:
     obj = bpy.data.objects.get(name)
     if obj is None:
@@ -88,11 +153,33 @@ def parent_keep_world(obj: bpy.types.Object, parent: bpy.types.Object | None) ->
     obj.matrix_world = current_world
 
 
-def set_metadata(obj: bpy.types.Object, rcgen_id: str, side: str, module: str, params: dict) -> None:
+def set_metadata(
+    obj: bpy.types.Object,
+    rcgen_id: str,
+    side: str,
+    module: str,
+    params: dict,
+    content_hash: str = "",
+    lod: str = "",
+) -> None:
     obj["rcgen_id"] = rcgen_id
     obj["rcgen_side"] = side
     obj["rcgen_module"] = module
     obj["rcgen_params"] = json.dumps(params, sort_keys=True)
+    if content_hash:
+        obj["rcgen_hash"] = content_hash
+    if lod:
+        obj["rcgen_lod"] = lod
+
+
+def property_group_values(group: bpy.types.PropertyGroup) -> dict:
+    values = {}
+    for prop in group.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.type in {"POINTER", "COLLECTION"}:
+            continue
+        value = getattr(group, prop.identifier)
+        values[prop.identifier] = tuple(value) if getattr(prop, "is_array", False) else value
+    return values
 
 
 def parse_metadata_params(obj: bpy.types.Object) -> dict:
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Collection, Sequence
+
+import bpy
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+from .blender_utils import world_bbox_bounds, world_triangle_arrays
+
+# Cache of (world vertices, BVH) per object name, shared between the passes of one check run.
+GeometryCache = dict[str, tuple[np.ndarray, BVHTree] | None]
+
+_MAX_CLEARANCE_SAMPLES = 2000
+
+# Triangle pairs reported for a pair whose surfaces do not touch because one mesh encloses the other.
+ENCLOSED = -1
+
+# Skewed so the containment ray does not run along the axis-aligned edges of generated parts.
+_RAY_DIRECTION = (3.0 / math.sqrt(14.0), 2.0 / math.sqrt(14.0), 1.0 / math.sqrt(14.0))
+_RAY_EPSILON = 1e-6
+_MAX_CROSSINGS = 64
+
+
+def sweep_and_prune(bounds_min: np.ndarray, bounds_max: np.ndarray) -> list[tuple[int, int]]:
+    # Broad phase: sort boxes along the axis with the widest spread of centers, then each box only
+    # meets the boxes whose start falls inside its own interval. O(n log n + k).
+    count = len(bounds_min)
+    if count < 2:
+        return []
+    axis = int(np.argmax(np.ptp((bounds_min + bounds_max) * 0.5, axis=0)))
+    order = np.argsort(bounds_min[:, axis], kind="stable")
+    starts = bounds_min[order, axis]
+    ends = np.searchsorted(starts, bounds_max[order, axis], side="right")
+
+    pairs: list[tuple[int, int]] = []
+    for rank in range(count):
+        others = order[rank + 1:ends[rank]]
+        if len(others) == 0:
+            continue
+        index = int(order[rank])
+        overlap = np.all(
+            (bounds_min[others] <= bounds_max[index]) & (bounds_max[others] >= bounds_min[index]),
+            axis=1,
+        )
+        pairs.extend((min(index, other), max(index, other)) for other in others[overlap].tolist())
+    return sorted(pairs)
+
+
+def _object_geometry(obj: bpy.types.Object, cache: GeometryCache) -> tuple[np.ndarray, BVHTree] | None:
+    if obj.name not in cache:
+        cache[obj.name] = None
+        if obj.type == "MESH":
+            # Checked on the triangles read, since modifiers can add faces to a reference's base mesh.
+            co, tris = world_triangle_arrays(obj)
+            if len(tris):
+                cache[obj.name] = (co, BVHTree.FromPolygons(co.tolist(), tris.tolist(), all_triangles=True))
+    return cache[obj.name]
+
+
+def _bounds_arrays(items: Sequence[bpy.types.Object]) -> tuple[np.ndarray, np.ndarray]:
+    bounds = [world_bbox_bounds(obj) for obj in items]
+    bounds_min = np.array([tuple(low) for low, _ in bounds], dtype=np.float64).reshape(-1, 3)
+    bounds_max = np.array([tuple(high) for _, high in bounds], dtype=np.float64).reshape(-1, 3)
+    return bounds_min, bounds_max
+
+
+def _contains_point(tree: BVHTree, point: list[float], max_distance: float) -> bool:
+    # Ray parity with signed crossings: a hit face pointing along the ray leaves a shell (+1), one
+    # pointing against it enters one (-1). Plain parity would miscount generated parts, which are
+    # unions of overlapping closed primitives; the signed sum is positive only inside one of them.
+    winding = 0
+    travelled = 0.0
+    origin = point
+    for _ in range(_MAX_CROSSINGS):
+        if travelled >= max_distance:
+            break
+        location, normal, _, distance = tree.ray_cast(origin, _RAY_DIRECTION, max_distance - travelled)
+        if location is None:
+            break
+        facing = sum(n * d for n, d in zip(normal, _RAY_DIRECTION))
+        winding += 1 if facing > 0.0 else -1
+        travelled += distance + _RAY_EPSILON
+        origin = [value + step * _RAY_EPSILON for value, step in zip(location, _RAY_DIRECTION)]
+    return winding > 0
+
+
+def _encloses(
+    geo_outer: tuple[np.ndarray, BVHTree],
+    geo_inner: tuple[np.ndarray, BVHTree],
+    outer_min: np.ndarray,
+    outer_max: np.ndarray,
+    inner_min: np.ndarray,
+    inner_max: np.ndarray,
+) -> bool:
+    # Surfaces do not intersect, so one vertex decides whether the whole inner mesh is inside.
+    if np.any(inner_min < outer_min) or np.any(inner_max > outer_max):
+        return False
+    return _contains_point(geo_outer[1], geo_inner[0][0].tolist(), float(np.linalg.norm(outer_max - outer_min)))
+
+
+def find_interferences(
+    objects: Sequence[bpy.types.Object],
+    references: Sequence[bpy.types.Object] = (),
+    check_object_pairs: bool = True,
+    ignored_pairs: Collection[frozenset[str]] = (),
+    cache: GeometryCache | None = None,
+) -> list[tuple[bpy.types.Object, bpy.types.Object, int]]:
+    # Returns (a, b, triangle pairs) for every intersecting pair, in input order. References are only
+    # tested against objects. Triangle pairs is 0 when one side is not a mesh and the boxes overlap,
+    # and ENCLOSED when the surfaces do not touch but one mesh lies fully inside the other.
+    items = [*objects, *references]
+    if len(items) < 2:
+        return []
+    bounds_min, bounds_max = _bounds_arrays(items)
+    cache = {} if cache is None else cache
+    result = []
+    for i, j in sweep_and_prune(bounds_min, bounds_max):
+        a_is_object = i < len(objects)
+        b_is_object = j < len(objects)
+        if not (a_is_object or b_is_object):
+            continue
+        if a_is_object and b_is_object and not check_object_pairs:
+            continue
+        a, b = items[i], items[j]
+        if frozenset((a.name, b.name)) in ignored_pairs:
+            continue
+        geo_a = _object_geometry(a, cache)
+        geo_b = _object_geometry(b, cache)
+        if geo_a is None or geo_b is None:
+            result.append((a, b, 0))
+            continue
+        overlap = geo_a[1].overlap(geo_b[1])
+        if overlap:
+            result.append((a, b, len(overlap)))
+        elif _encloses(geo_a, geo_b, bounds_min[i], bounds_max[i], bounds_min[j], bounds_max[j]) or _encloses(
+            geo_b, geo_a, bounds_min[j], bounds_max[j], bounds_min[i], bounds_max[i]
+        ):
+            result.append((a, b, ENCLOSED))
+    return result
+
+
+def _nearest_gap(co: np.ndarray, tree: BVHTree, low: np.ndarray, high: np.ndarray, search: float) -> float:
+    # Only vertices within `search` of the other part's box can be closer than `search`.
+    near = np.all((co >= low - search) & (co <= high + search), axis=1)
+    points = co[near]
+    if len(points) > _MAX_CLEARANCE_SAMPLES:
+        points = points[:: math.ceil(len(points) / _MAX_CLEARANCE_SAMPLES)]
+    best = math.inf
+    for point in points.tolist():
+        hit = tree.find_nearest(point, min(best, search))
+        if hit[0] is not None:
+            best = min(best, hit[3])
+    return best
+
+
+def minimum_clearances(
+    objects: Sequence[bpy.types.Object],
+    search: float,
+    intersecting: Collection[frozenset[str]] = (),
+    cache: GeometryCache | None = None,
+) -> dict[frozenset[str], float]:
+    # Approximate minimum surface gap (meters) for every pair closer than `search`: nearest point on
+    # one BVH from the (sampled) vertices of the other part, in both directions. Pairs known to
+    # intersect are 0.0; pairs farther apart than `search` are left out.
+    if len(objects) < 2:
+        return {}
+    bounds_min, bounds_max = _bounds_arrays(objects)
+    cache = {} if cache is None else cache
+    result = {}
+    for i, j in sweep_and_prune(bounds_min - search * 0.5, bounds_max + search * 0.5):
+        a, b = objects[i], objects[j]
+        key = frozenset((a.name, b.name))
+        if key in intersecting:
+            result[key] = 0.0
+            continue
+        geo_a = _object_geometry(a, cache)
+        geo_b = _object_geometry(b, cache)
+        if geo_a is None or geo_b is None:
+            continue
+        gap = min(
+            _nearest_gap(geo_a[0], geo_b[1], bounds_min[j], bounds_max[j], search),
+            _nearest_gap(geo_b[0], geo_a[1], bounds_min[i], bounds_max[i], search),
+        )
+        if gap < search:
+            result[key] = gap
+    return result